@@ -0,0 +1,109 @@
+"""
+Модуль содержит абстрактный класс Agent - стратегию автоматической игры.
+
+Classes:
+    Agent: Предназначен для наследования стратегиями, выбирающими
+    направление змейки по состоянию игрового движка.
+
+Functions:
+    get_next_cell: Вычисляет клетку, в которую голова попадет при ходе.
+    get_safe_directions: Находит направления, ход в которые не приводит
+    к немедленному столкновению.
+
+Imports:
+    ABC: Чтобы сделать класс Agent абстрактным.
+    abstractmethod: Для обозначения абстрактого метода.
+
+    GameEngine: Для написания аннотаций типа игрового движка.
+"""
+from abc import ABC, abstractmethod
+
+from engine.game_engine import GameEngine
+
+
+DIRECTIONS = ('Up', 'Down', 'Left', 'Right')
+OPPOSITES = {'Up': 'Down', 'Down': 'Up', 'Left': 'Right', 'Right': 'Left'}
+
+
+class Agent(ABC):
+    """Предназначен для наследования стратегиями автоматической игры."""
+    def reset(self, engine: GameEngine) -> None:
+        """
+        Подготавливает агента к новой игре.
+
+        Args:
+            engine (GameEngine): Игровой движок новой игры.
+        """
+        pass
+
+    @abstractmethod
+    def choose_direction(self, engine: GameEngine) -> str | None:
+        """
+        Выбирает направление змейки перед следующим тиком.
+
+        Args:
+            engine (GameEngine): Игровой движок.
+
+        Returns:
+            str | None: Новое направление или None, чтобы продолжать
+            движение в текущем направлении.
+        """
+        pass
+
+
+def get_next_cell(
+    cell: int, direction: str, board_width: int, board_heigth: int
+    ) -> int | None:
+    """
+    Вычисляет клетку, в которую голова попадет при ходе.
+
+    Args:
+        cell (int): Номер клетки головы.
+        direction (str): Направление хода.
+        board_width (int): Ширина поля в клетках.
+        board_heigth (int): Высота поля в клетках.
+
+    Returns:
+        int | None: Номер клетки или None, если ход выводит за границу поля.
+    """
+    y, x = divmod(cell, board_width)
+    if direction == 'Up':
+        return cell - board_width if y > 0 else None
+    if direction == 'Down':
+        return cell + board_width if y < board_heigth - 1 else None
+    if direction == 'Left':
+        return cell - 1 if x > 0 else None
+    return cell + 1 if x < board_width - 1 else None
+
+
+def get_safe_directions(engine: GameEngine) -> list[tuple[str, int]]:
+    """
+    Находит направления, ход в которые не приводит к немедленному столкновению.
+
+    Клетка хвоста считается свободной, если змейка на этом ходу не растет.
+
+    Args:
+        engine (GameEngine): Игровой движок.
+
+    Returns:
+        list[tuple[str, int]]: Направления и клетки, в которые попадет голова.
+    """
+    board_width, board_heigth = engine.get_board_size()
+    snake = engine.get_snake()
+    segment_positions = snake.get_segment_positions()
+    head = segment_positions[0]
+    tail = segment_positions[-1] if not snake.get_pending_growth() else None
+    opposite = OPPOSITES[snake.get_direction()]
+
+    safe_directions = []
+    for direction in DIRECTIONS:
+        if direction == opposite:
+            continue
+        cell = get_next_cell(head, direction, board_width, board_heigth)
+        if cell is None:
+            continue
+        if snake.is_occupied(cell) and cell != tail:
+            continue
+        safe_directions.append((direction, cell))
+
+    return safe_directions
@@ -0,0 +1,166 @@
+"""
+Модуль содержит агента, ведущего змейку по гамильтонову циклу поля.
+
+Гамильтонов цикл проходит через каждую клетку поля ровно один раз,
+поэтому змейка, идущая по нему, никогда не врезается в себя и
+заполняет все поле.
+
+Classes:
+    HamiltonianAgent: Ведет змейку по гамильтонову циклу поля.
+
+Functions:
+    build_cycle: Строит замкнутый обход всех клеток поля.
+    get_cycle_directions: Вычисляет направление движения из каждой клетки обхода.
+
+Imports:
+    Agent: Является родительским классом HamiltonianAgent.
+    get_next_cell: Для проверки хода по циклу.
+    PathfindingAgent: Для выбора хода, если идти по циклу нельзя.
+    GameEngine: Для написания аннотаций типа игрового движка.
+"""
+from agents.agent import Agent, get_next_cell
+from agents.path_agent import PathfindingAgent
+from engine.game_engine import GameEngine
+
+
+def build_cycle(width: int, height: int) -> list[int]:
+    """
+    Строит замкнутый обход всех клеток поля.
+
+    Обход идет по первой строке слева направо, затем змейкой по
+    столбцам со второго по последний и возвращается вверх по первому
+    столбцу. Для замкнутости высота поля должна быть четной.
+
+    Args:
+        width (int): Ширина поля в клетках.
+        height (int): Высота поля в клетках.
+
+    Returns:
+        list[int]: Номера клеток в порядке обхода.
+    """
+    cycle = [x for x in range(width)]
+    for y in range(1, height):
+        if y % 2:
+            columns = range(width - 1, 0, -1)
+        else:
+            columns = range(1, width)
+        cycle.extend(y * width + x for x in columns)
+    cycle.extend(y * width for y in range(height - 1, 0, -1))
+
+    return cycle
+
+
+def get_cycle_directions(cycle: list[int], width: int) -> list[str]:
+    """
+    Вычисляет направление движения из каждой клетки обхода.
+
+    Args:
+        cycle (list[int]): Номера клеток в порядке обхода.
+        width (int): Ширина поля в клетках.
+
+    Returns:
+        list[str]: Направление из каждой клетки, индексированное номером клетки.
+    """
+    names = {1: 'Right', -1: 'Left', width: 'Down', -width: 'Up'}
+    directions = [''] * len(cycle)
+    for index, cell in enumerate(cycle):
+        next_cell = cycle[(index + 1) % len(cycle)]
+        directions[cell] = names[next_cell - cell]
+
+    return directions
+
+
+class HamiltonianAgent(Agent):
+    """
+    Ведет змейку по гамильтонову циклу поля.
+
+    Цикл строится один раз на размер поля. Если поле имеет нечетные
+    ширину и высоту, цикла не существует, и змейку ведет к еде
+    PathfindingAgent. Он же выбирает ход, когда ход по циклу приводит
+    к столкновению или развороту, например после продолжения игры из
+    снимка, чтобы змейка не ходила по кругу, не съедая еду.
+    """
+    def __init__(self, *, seed: int | None = None) -> None:
+        """
+        Инициализирует агента.
+
+        Args:
+            seed (int | None): Не используется, принимается для единообразия \
+                создания агентов.
+        """
+        self.__board_size = None
+        self.__directions = None
+        self.__fallback = PathfindingAgent(seed=seed)
+
+    def __build_directions(self, width: int, height: int) -> list[str] | None:
+        """
+        Строит направления движения по циклу для поля.
+
+        Если высота поля нечетная, а ширина четная, цикл строится по
+        транспонированному полю.
+
+        Args:
+            width (int): Ширина поля в клетках.
+            height (int): Высота поля в клетках.
+
+        Returns:
+            list[str] | None: Направление из каждой клетки или None, если
+            цикла на поле не существует.
+        """
+        if height % 2 == 0:
+            return get_cycle_directions(build_cycle(width, height), width)
+        if width % 2:
+            return None
+
+        transposed = get_cycle_directions(build_cycle(height, width), height)
+        flips = {'Right': 'Down', 'Left': 'Up', 'Down': 'Right', 'Up': 'Left'}
+        directions = [''] * (width * height)
+        for cell, direction in enumerate(transposed):
+            y, x = divmod(cell, height)
+            directions[x * width + y] = flips[direction]
+
+        return directions
+
+    def reset(self, engine: GameEngine) -> None:
+        """
+        Строит цикл, если размер поля изменился, и сбрасывает агента,
+        выбирающего ход вне цикла.
+
+        Args:
+            engine (GameEngine): Игровой движок новой игры.
+        """
+        board_size = engine.get_board_size()
+        if board_size != self.__board_size:
+            self.__board_size = board_size
+            self.__directions = self.__build_directions(*board_size)
+        self.__fallback.reset(engine)
+
+    def choose_direction(self, engine: GameEngine) -> str | None:
+        """
+        Выбирает направление по циклу, а если цикла нет или ход по циклу
+        приведет к столкновению или развороту, - направление агента
+        PathfindingAgent.
+
+        Args:
+            engine (GameEngine): Игровой движок.
+
+        Returns:
+            str | None: Новое направление или None, если безопасных нет.
+        """
+        if self.__board_size != engine.get_board_size():
+            self.reset(engine)
+        if self.__directions is None:
+            return self.__fallback.choose_direction(engine)
+
+        snake = engine.get_snake()
+        segment_positions = snake.get_segment_positions()
+        head = segment_positions[0]
+        direction = self.__directions[head]
+        cell = get_next_cell(head, direction, *self.__board_size)
+        is_free = not snake.get_occupancy()[cell] or (
+            cell == segment_positions[-1] and not snake.get_pending_growth()
+            )
+        if is_free and len(segment_positions) > 1 and cell != segment_positions[1]:
+            return direction
+
+        return self.__fallback.choose_direction(engine)
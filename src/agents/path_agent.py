@@ -0,0 +1,441 @@
+"""
+Модуль содержит агента, ищущего путь к еде алгоритмом A*.
+
+Classes:
+    PathfindingAgent: Ведет змейку к еде кратчайшим путем с проверкой,
+    что после еды змейка сможет догнать свой хвост.
+
+Imports:
+    array: Для заранее выделенных буферов поиска пути.
+    deque: Для хранения запланированного пути.
+    heappush, heappop: Для очереди с приоритетом алгоритма A*.
+    perf_counter: Для ограничения времени поиска пути за тик.
+
+    Agent: Является родительским классом PathfindingAgent.
+    get_safe_directions: Для выбора хода, если путь не найден за тик.
+    GameEngine: Для написания аннотаций типа игрового движка.
+"""
+from array import array
+from collections import deque
+from heapq import heappush, heappop
+from time import perf_counter
+
+from agents.agent import Agent, get_safe_directions
+from engine.game_engine import GameEngine
+
+
+class PathfindingAgent(Agent):
+    """
+    Ведет змейку к еде кратчайшим путем с проверкой, что после еды
+    змейка сможет догнать свой хвост.
+
+    Найденный путь запоминается и проходится без повторного поиска,
+    пока еда не съедена, поэтому поиск выполняется один раз на каждую
+    еду. Поиск использует сетку занятости змейки, которую она обновляет
+    сама при движении, и буферы, выделенные один раз на размер поля:
+    вместо очистки буферов перед поиском увеличивается номер поиска.
+
+    Выбор хода выполняется на каждом тике, поэтому все поиски за тик
+    вместе идут не дольше TIME_BUDGET секунд от начала выбора хода.
+    Не найденный за это время путь считается отсутствующим, а ход
+    выбирается среди безопасных направлений без поиска. Поэтому на больших
+    полях ходы агента могут зависеть от скорости компьютера.
+
+    Если безопасного пути к еде нет, змейка следует за хвостом: путь
+    к хвосту берется из того же поиска, что и путь к еде, а когда он
+    пройден, ищется только путь к хвосту. Путь к еде ищется снова через
+    REPLAN_PERIOD тиков или когда еда переместилась. После количества
+    тиков без пути к еде, равного числу клеток поля, змейка идет к еде
+    и без проверки хвоста, чтобы не ходить по кругу бесконечно.
+    """
+    TIME_BUDGET = 0.004
+    __DEADLINE_CHECK_PERIOD = 32
+    REPLAN_PERIOD = 16
+
+    def __init__(self, *, seed: int | None = None) -> None:
+        """
+        Инициализирует агента.
+
+        Args:
+            seed (int | None): Не используется, принимается для единообразия \
+                создания агентов.
+        """
+        self.__board_size = None
+        self.__plan = deque()
+        self.__plan_food = None
+        self.__plan_head = None
+        self.__plan_reaches_food = False
+        self.__unplanned_ticks = 0
+        self.__search_delay = 0
+        self.__deadline = 0.0
+
+    def __allocate_buffers(self, width: int, height: int) -> None:
+        """
+        Выделяет буферы поиска пути на размер поля.
+
+        Args:
+            width (int): Ширина поля в клетках.
+            height (int): Высота поля в клетках.
+        """
+        cell_count = width * height
+        self.__BOARD_WIDTH = width
+        self.__BOARD_HEIGTH = height
+        self.__search_marks = array('I', bytes(4 * cell_count))
+        self.__costs = array('i', bytes(4 * cell_count))
+        self.__parents = array('i', bytes(4 * cell_count))
+        self.__virtual_occupancy = bytearray(cell_count)
+        self.__search_number = 0
+        self.__heap = []
+
+    def reset(self, engine: GameEngine) -> None:
+        """
+        Сбрасывает запланированный путь и выделяет буферы, если размер
+        поля изменился.
+
+        Args:
+            engine (GameEngine): Игровой движок новой игры.
+        """
+        board_size = engine.get_board_size()
+        if board_size != self.__board_size:
+            self.__board_size = board_size
+            self.__allocate_buffers(*board_size)
+        self.__plan.clear()
+        self.__plan_food = None
+        self.__plan_head = None
+        self.__plan_reaches_food = False
+        self.__unplanned_ticks = 0
+        self.__search_delay = 0
+
+    def __get_neighbours(self, cell: int) -> list[int]:
+        """
+        Получает соседние клетки в пределах поля.
+
+        Args:
+            cell (int): Номер клетки.
+
+        Returns:
+            list[int]: Номера соседних клеток.
+        """
+        width = self.__BOARD_WIDTH
+        y, x = divmod(cell, width)
+        neighbours = []
+        if y > 0:
+            neighbours.append(cell - width)
+        if y < self.__BOARD_HEIGTH - 1:
+            neighbours.append(cell + width)
+        if x > 0:
+            neighbours.append(cell - 1)
+        if x < width - 1:
+            neighbours.append(cell + 1)
+
+        return neighbours
+
+    def __find_path(
+        self,
+        start: int,
+        goal: int,
+        occupancy: bytearray,
+        free_cell: int = -1,
+        reached_cell: int = -1
+        ) -> list[int] | None:
+        """
+        Ищет кратчайший путь алгоритмом A* с манхэттенской эвристикой.
+        Из клеток с равной оценкой первой раскрывается более дальняя
+        от начала, поэтому на свободном поле раскрываются почти только
+        клетки самого пути. Поиск прекращается, когда истекает время,
+        отведенное на выбор хода.
+
+        Args:
+            start (int): Клетка начала пути.
+            goal (int): Клетка конца пути. Может быть занятой.
+            occupancy (bytearray): Сетка занятости, занятые клетки непроходимы.
+            free_cell (int): Занятая клетка, которую нужно считать свободной, \
+                например хвост, уходящий на следующем ходу.
+            reached_cell (int): Занятая клетка, путь до которой нужно \
+                запомнить, не проходя через нее. Путь до нее можно получить \
+                методом __get_reached_path до следующего поиска.
+
+        Returns:
+            list[int] | None: Клетки пути без начальной или None, если
+            пути нет или он не найден за оставшееся время выбора хода.
+        """
+        self.__search_number += 1
+        number = self.__search_number
+        marks = self.__search_marks
+        costs = self.__costs
+        parents = self.__parents
+        heap = self.__heap
+        heap.clear()
+
+        get_neighbours = self.__get_neighbours
+        width = self.__BOARD_WIDTH
+        goal_y, goal_x = divmod(goal, width)
+        marks[start] = number
+        costs[start] = 0
+        heappush(heap, (0, 0, start))
+
+        deadline = self.__deadline
+        check_period = self.__DEADLINE_CHECK_PERIOD
+        expansions = 0
+        while heap:
+            _, cost, cell = heappop(heap)
+            cost = -cost
+            if cell == goal:
+                return self.__get_reached_path(start, goal)
+            if cost > costs[cell]:
+                continue
+            expansions += 1
+            if expansions % check_period == 0 and perf_counter() > deadline:
+                return None
+
+            cost += 1
+            for neighbour in get_neighbours(cell):
+                is_blocked = occupancy[neighbour] and neighbour != free_cell
+                if is_blocked and neighbour != goal and neighbour != reached_cell:
+                    continue
+                if marks[neighbour] == number and costs[neighbour] <= cost:
+                    continue
+                marks[neighbour] = number
+                costs[neighbour] = cost
+                parents[neighbour] = cell
+                if is_blocked and neighbour != goal:
+                    continue
+                y, x = divmod(neighbour, width)
+                heappush(
+                    heap,
+                    (cost + abs(goal_y - y) + abs(goal_x - x), -cost, neighbour)
+                    )
+
+        return None
+
+    def __get_reached_path(self, start: int, cell: int) -> list[int] | None:
+        """
+        Восстанавливает путь до клетки, достигнутой последним поиском.
+
+        Args:
+            start (int): Клетка начала поиска.
+            cell (int): Клетка конца пути.
+
+        Returns:
+            list[int] | None: Клетки пути без начальной или None, если
+            последний поиск не достиг клетки.
+        """
+        if cell == start or self.__search_marks[cell] != self.__search_number:
+            return None
+
+        parents = self.__parents
+        path = []
+        while cell != start:
+            path.append(cell)
+            cell = parents[cell]
+        path.reverse()
+
+        return path
+
+    def __is_tail_reachable(
+        self, path: list[int], engine: GameEngine
+        ) -> bool:
+        """
+        Проверяет, сможет ли змейка догнать свой хвост, пройдя путь и
+        съев еду в его конце.
+
+        Args:
+            path (list[int]): Клетки пути к еде.
+            engine (GameEngine): Игровой движок.
+
+        Returns:
+            bool: Достижим ли хвост после пути.
+        """
+        snake = engine.get_snake()
+        segment_positions = snake.get_segment_positions()
+        length = len(segment_positions)
+        growth = snake.get_pending_growth()
+
+        path_length = len(path)
+        new_length = length + min(growth, path_length)
+        kept_count = max(new_length - path_length, 0)
+        path_start = max(path_length - new_length, 0)
+
+        virtual = self.__virtual_occupancy
+        virtual[:] = snake.get_occupancy()
+        for index in range(kept_count, length):
+            virtual[segment_positions[index]] = 0
+        for index in range(path_start, path_length):
+            virtual[path[index]] = 1
+
+        if kept_count:
+            tail = segment_positions[kept_count - 1]
+        else:
+            tail = path[path_start]
+        return self.__find_path(path[-1], tail, virtual) is not None
+
+    def __plan_tail_path(
+        self, engine: GameEngine, tail_path: list[int] | None = None
+        ) -> None:
+        """
+        Планирует путь за хвостом. Из безопасных соседних клеток головы
+        выбирается та, от которой кратчайший путь до хвоста самый
+        длинный: змейка не повторяет свое тело, а обходит свободные
+        клетки, поэтому ее форма меняется и еда, закрытая телом, может
+        освободиться.
+
+        Args:
+            engine (GameEngine): Игровой движок.
+            tail_path (list[int] | None): Путь до хвоста, найденный \
+                поиском пути к еде. Для его первой клетки поиск не \
+                повторяется.
+        """
+        snake = engine.get_snake()
+        segment_positions = snake.get_segment_positions()
+        occupancy = snake.get_occupancy()
+        tail = segment_positions[-1]
+
+        best_path = tail_path
+        for _, cell in get_safe_directions(engine):
+            if tail_path and cell == tail_path[0]:
+                continue
+            if cell == tail:
+                path = [cell]
+            else:
+                path = self.__find_path(cell, tail, occupancy)
+                if path is None:
+                    continue
+                path.insert(0, cell)
+            if best_path is None or len(path) > len(best_path):
+                best_path = path
+
+        if best_path:
+            self.__plan.extend(best_path)
+
+    def __plan_path(self, engine: GameEngine) -> None:
+        """
+        Планирует безопасный путь к еде, а если его нет — путь за
+        хвостом, и откладывает следующий поиск пути к еде на
+        REPLAN_PERIOD тиков. Путь к еде без проверки хвоста принимается,
+        если змейка слишком долго не находит безопасного пути.
+
+        Args:
+            engine (GameEngine): Игровой движок.
+        """
+        self.__plan.clear()
+        food = engine.get_food().get_position()
+        self.__plan_food = food
+
+        snake = engine.get_snake()
+        segment_positions = snake.get_segment_positions()
+        occupancy = snake.get_occupancy()
+        head = segment_positions[0]
+        tail = segment_positions[-1]
+        free_cell = -1
+        if not snake.get_pending_growth():
+            free_cell = tail
+
+        tail_path = None
+        if food is not None:
+            path = self.__find_path(head, food, occupancy, free_cell, tail)
+            tail_path = self.__get_reached_path(head, tail)
+            if path and (
+                self.__unplanned_ticks > len(occupancy)
+                or self.__is_tail_reachable(path, engine)
+                ):
+                self.__plan.extend(path)
+                self.__plan_reaches_food = True
+                self.__unplanned_ticks = 0
+                return
+
+        self.__search_delay = self.REPLAN_PERIOD
+        self.__plan_tail_path(engine, tail_path)
+
+    def __choose_safe_direction(self, engine: GameEngine) -> str | None:
+        """
+        Выбирает без поиска безопасное направление с наибольшим числом
+        свободных соседних клеток, если запланированного пути нет.
+
+        Args:
+            engine (GameEngine): Игровой движок.
+
+        Returns:
+            str | None: Новое направление или None, если безопасных нет.
+        """
+        occupancy = engine.get_snake().get_occupancy()
+        best_direction = None
+        best_count = -1
+        for direction, cell in get_safe_directions(engine):
+            count = 0
+            for neighbour in self.__get_neighbours(cell):
+                if not occupancy[neighbour]:
+                    count += 1
+            if count > best_count:
+                best_direction = direction
+                best_count = count
+
+        return best_direction
+
+    def __get_direction(self, head: int, cell: int) -> str:
+        """
+        Получает направление хода из клетки головы в соседнюю клетку.
+
+        Args:
+            head (int): Номер клетки головы.
+            cell (int): Номер соседней клетки.
+
+        Returns:
+            str: Направление хода.
+        """
+        delta = cell - head
+        if delta == 1:
+            return 'Right'
+        if delta == -1:
+            return 'Left'
+        if delta > 0:
+            return 'Down'
+        return 'Up'
+
+    def choose_direction(self, engine: GameEngine) -> str | None:
+        """
+        Выбирает следующий ход по запланированному пути, планируя новый
+        путь, когда путь пройден, стал недоступен или еда переместилась.
+
+        Args:
+            engine (GameEngine): Игровой движок.
+
+        Returns:
+            str | None: Новое направление или None, если безопасных нет.
+        """
+        if self.__board_size != engine.get_board_size():
+            self.reset(engine)
+        self.__deadline = perf_counter() + self.TIME_BUDGET
+
+        snake = engine.get_snake()
+        segment_positions = snake.get_segment_positions()
+        head = segment_positions[0]
+        food_moved = engine.get_food().get_position() != self.__plan_food
+        plan = self.__plan
+        if food_moved or head != self.__plan_head:
+            plan.clear()
+            self.__plan_reaches_food = False
+        if food_moved:
+            self.__search_delay = 0
+        elif self.__search_delay:
+            self.__search_delay -= 1
+
+        if not self.__plan_reaches_food and not self.__search_delay:
+            self.__plan_path(engine)
+        elif not plan:
+            self.__plan_tail_path(engine)
+
+        if not self.__plan_reaches_food:
+            self.__unplanned_ticks += 1
+        if plan:
+            cell = plan[0]
+            is_free = not snake.get_occupancy()[cell] or (
+                cell == segment_positions[-1] and not snake.get_pending_growth()
+                )
+            if is_free:
+                plan.popleft()
+                self.__plan_head = cell
+                return self.__get_direction(head, cell)
+            plan.clear()
+            self.__plan_reaches_food = False
+
+        return self.__choose_safe_direction(engine)
@@ -0,0 +1,63 @@
+"""
+Модуль отвечает за создание агентов по имени.
+
+Functions:
+    get_agent_names: Получает имена встроенных агентов.
+    create_agent: Создает агента по имени или пути к классу.
+
+Imports:
+    import_module: Для загрузки агентов из сторонних модулей.
+
+    Agent: Для написания аннотации типа создаваемого агента.
+    RandomAgent, GreedyAgent, PathfindingAgent, HamiltonianAgent: Встроенные агенты.
+"""
+from importlib import import_module
+
+from agents.agent import Agent
+from agents.simple_agents import RandomAgent, GreedyAgent
+from agents.path_agent import PathfindingAgent
+from agents.hamiltonian_agent import HamiltonianAgent
+
+
+AGENTS = {
+    'random': RandomAgent,
+    'greedy': GreedyAgent,
+    'astar': PathfindingAgent,
+    'hamiltonian': HamiltonianAgent
+    }
+
+
+def get_agent_names() -> list[str]:
+    """
+    Получает имена встроенных агентов.
+
+    Returns:
+        list[str]: Имена агентов.
+    """
+    return list(AGENTS)
+
+
+def create_agent(name: str, *, seed: int | None = None) -> Agent:
+    """
+    Создает агента по имени встроенного агента или по пути к классу
+    вида 'модуль:Класс'. Класс агента должен принимать зерно генератора
+    случайных чисел аргументом seed.
+
+    Args:
+        name (str): Имя агента или путь к классу.
+        seed (int | None): Зерно генератора случайных чисел агента.
+
+    Raises:
+        ValueError: Если агент с таким именем не найден.
+
+    Returns:
+        Agent: Экземпляр агента.
+    """
+    agent_class = AGENTS.get(name)
+    if agent_class is None:
+        if ':' not in name:
+            raise ValueError(f'Неизвестный агент: {name}')
+        module_name, class_name = name.split(':', 1)
+        agent_class = getattr(import_module(module_name), class_name)
+
+    return agent_class(seed=seed)
@@ -0,0 +1,83 @@
+"""
+Модуль содержит простые стратегии автоматической игры.
+
+Classes:
+    RandomAgent: Выбирает случайное безопасное направление.
+    GreedyAgent: Выбирает безопасное направление, ближайшее к еде.
+
+Imports:
+    Random: Для собственного генератора случайных чисел агента.
+
+    Agent: Является родительским классом агентов.
+    get_safe_directions: Для отбора направлений без немедленного столкновения.
+    GameEngine: Для написания аннотаций типа игрового движка.
+"""
+from random import Random
+
+from agents.agent import Agent, get_safe_directions
+from engine.game_engine import GameEngine
+
+
+class RandomAgent(Agent):
+    """Выбирает случайное безопасное направление."""
+    def __init__(self, *, seed: int | None = None) -> None:
+        """
+        Инициализирует агента.
+
+        Args:
+            seed (int | None): Зерно генератора случайных чисел агента.
+        """
+        self.__rng = Random(seed)
+
+    def choose_direction(self, engine: GameEngine) -> str | None:
+        """
+        Выбирает случайное безопасное направление.
+
+        Args:
+            engine (GameEngine): Игровой движок.
+
+        Returns:
+            str | None: Новое направление или None, если безопасных нет.
+        """
+        safe_directions = get_safe_directions(engine)
+        if not safe_directions:
+            return None
+        return self.__rng.choice(safe_directions)[0]
+
+
+class GreedyAgent(Agent):
+    """Выбирает безопасное направление, ближайшее к еде."""
+    def __init__(self, *, seed: int | None = None) -> None:
+        """
+        Инициализирует агента.
+
+        Args:
+            seed (int | None): Не используется, принимается для единообразия \
+                создания агентов.
+        """
+        pass
+
+    def choose_direction(self, engine: GameEngine) -> str | None:
+        """
+        Выбирает безопасное направление с наименьшим манхэттенским
+        расстоянием до еды.
+
+        Args:
+            engine (GameEngine): Игровой движок.
+
+        Returns:
+            str | None: Новое направление или None, если безопасных нет.
+        """
+        safe_directions = get_safe_directions(engine)
+        food = engine.get_food().get_position()
+        if not safe_directions or food is None:
+            return None
+
+        board_width = engine.get_board_size()[0]
+        food_y, food_x = divmod(food, board_width)
+
+        def get_distance(option: tuple[str, int]) -> int:
+            y, x = divmod(option[1], board_width)
+            return abs(food_y - y) + abs(food_x - x)
+
+        return min(safe_directions, key=get_distance)[0]
@@ -0,0 +1,174 @@
+"""
+Модуль отвечает за загрузку и кэширование изображений игры.
+
+Пути к изображениям строятся относительно пакета, а не текущей рабочей
+папки, поэтому игру можно запускать из любого каталога. Pillow
+импортируется при первой загрузке изображения, а не при запуске игры.
+
+Classes:
+    AssetManager: Содержит загрузку изображений один раз, кэш изображений
+    Tk с ограниченным размером и фоновую предзагрузку.
+
+Imports:
+    OrderedDict: Для вытеснения давно не использованных изображений Tk.
+    Iterable: Для написания аннотации типа аргумента images метода preload.
+    Path: Для построения путей к изображениям.
+    Lock, Thread: Для фоновой предзагрузки изображений.
+    TYPE_CHECKING: Для импорта Pillow только для аннотаций типов.
+
+    Image, ImageTk: Для загрузки, изменения размера изображений и
+    создания изображений Tk. Импортируются в методах загрузки.
+"""
+from collections import OrderedDict
+from collections.abc import Iterable
+from pathlib import Path
+from threading import Lock, Thread
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from PIL import Image, ImageTk
+
+
+IMAGES_DIR = Path(__file__).resolve().parents[2] / 'images'
+
+
+class AssetManager:
+    """
+    Содержит загрузку изображений один раз, кэш изображений Tk
+    с ограниченным размером и фоновую предзагрузку.
+
+    Изображения Pillow нужного размера готовятся один раз и могут
+    загружаться в фоновом потоке. Изображения Tk создаются только
+    в главном потоке, потому что Tk не потокобезопасен.
+    """
+    def __init__(
+        self, *, images_dir: Path = IMAGES_DIR, max_photos: int = 32
+        ) -> None:
+        """
+        Инициализирует менеджер изображений.
+
+        Args:
+            images_dir (Path): Папка с изображениями.
+            max_photos (int): Наибольшее количество хранимых изображений Tk.
+        """
+        self.__IMAGES_DIR = images_dir
+        self.__MAX_PHOTOS = max_photos
+
+        self.__lock = Lock()
+        self.__images = {}
+        self.__photos = OrderedDict()
+        self.__preload_thread = None
+
+    def get_path(self, name: str) -> Path:
+        """
+        Получает путь к изображению.
+
+        Args:
+            name (str): Имя файла изображения.
+
+        Returns:
+            Path: Путь к изображению.
+        """
+        return self.__IMAGES_DIR / name
+
+    def get_image(self, name: str, size: tuple[int, int]) -> 'Image.Image':
+        """
+        Получает изображение Pillow нужного размера, загружая его
+        только при первом обращении.
+
+        Args:
+            name (str): Имя файла изображения.
+            size (tuple[int, int]): Ширина и высота в пикселях.
+
+        Returns:
+            Image: Изображение нужного размера.
+        """
+        from PIL import Image
+
+        key = (name, size)
+        with self.__lock:
+            image = self.__images.get(key)
+            if image is None:
+                with Image.open(self.get_path(name)) as source:
+                    image = source.resize(size)
+                self.__images[key] = image
+
+        return image
+
+    def get_photo(
+        self, name: str, size: tuple[int, int]
+        ) -> 'ImageTk.PhotoImage':
+        """
+        Получает изображение Tk нужного размера.
+
+        Вызывающий код должен хранить ссылку на полученное изображение,
+        пока оно показывается: вытесненное из кэша изображение удаляется
+        из Tk, когда на него не остается ссылок.
+
+        Args:
+            name (str): Имя файла изображения.
+            size (tuple[int, int]): Ширина и высота в пикселях.
+
+        Returns:
+            PhotoImage: Изображение Tk.
+        """
+        key = (name, size)
+        photo = self.__photos.get(key)
+        if photo is not None:
+            self.__photos.move_to_end(key)
+            return photo
+
+        from PIL import ImageTk
+
+        photo = ImageTk.PhotoImage(self.get_image(name, size))
+        self.__photos[key] = photo
+        if len(self.__photos) > self.__MAX_PHOTOS:
+            self.__photos.popitem(last=False)
+
+        return photo
+
+    def get_photo_count(self) -> int:
+        """
+        Получает количество изображений Tk в кэше.
+
+        Returns:
+            int: Количество изображений Tk.
+        """
+        return len(self.__photos)
+
+    def __preload(self, images: list[tuple[str, tuple[int, int]]]) -> None:
+        """
+        Загружает изображения в кэш.
+
+        Args:
+            images (list[tuple[str, tuple[int, int]]]): Имена и размеры изображений.
+        """
+        for name, size in images:
+            try:
+                self.get_image(name, size)
+            except OSError:
+                pass
+
+    def preload(self, images: Iterable[tuple[str, tuple[int, int]]]) -> None:
+        """
+        Запускает фоновую загрузку изображений.
+
+        Ошибки загрузки в фоне пропускаются: изображение будет загружено
+        повторно и ошибка возникнет при первом обращении к нему.
+
+        Args:
+            images (Iterable[tuple[str, tuple[int, int]]]): Имена и размеры изображений.
+        """
+        self.__preload_thread = Thread(
+            target=self.__preload, args=(list(images),), daemon=True
+            )
+        self.__preload_thread.start()
+
+    def is_preloading(self) -> bool:
+        """
+        Проверяет, идет ли фоновая загрузка изображений.
+
+        Returns:
+            bool: Идет ли загрузка.
+        """
+        return self.__preload_thread is not None and self.__preload_thread.is_alive()
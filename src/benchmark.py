@@ -0,0 +1,123 @@
+"""
+Модуль предназначен для запуска бенчмарков игровой логики и отрисовки.
+
+Результаты сохраняются в JSON и могут сравниваться с результатами
+другого коммита для поиска регрессий:
+
+    python benchmark.py --output new.json --compare old.json
+
+Для времени выбора хода агентами задан бюджет: если 99-й перцентиль
+превышает его, запуск завершается с ошибкой и без сравнения.
+
+Для замеров отрисовки без монитора запускать через xvfb-run.
+
+Funcions:
+    parse_args: Разбирает аргументы командной строки.
+    main: Запускает бенчмарки, сохраняет и сравнивает результаты.
+
+Imports:
+    argparse: Для разбора аргументов командной строки.
+    sys: Для кода завершения при найденных регрессиях.
+
+    run_engine_benchmarks: Для замеров игровой логики.
+    run_render_benchmarks: Для замеров отрисовки.
+    run_vector_env_benchmarks: Для замеров симуляции множества игр.
+    run_agent_benchmarks: Для замеров времени выбора хода агентами.
+    save_results, load_results, compare_results: Для работы с результатами.
+"""
+import argparse
+import sys
+
+from benchmarks.engine_benchmarks import run_engine_benchmarks
+from benchmarks.render_benchmarks import run_render_benchmarks
+from benchmarks.vector_env_benchmarks import run_vector_env_benchmarks
+from benchmarks.agent_benchmarks import run_agent_benchmarks
+from benchmarks.bench_results import save_results, load_results, compare_results
+
+
+def parse_args() -> argparse.Namespace:
+    """
+    Разбирает аргументы командной строки.
+
+    Returns:
+        Namespace: Аргументы командной строки.
+    """
+    parser = argparse.ArgumentParser(
+        description='Бенчмарки игровой логики и отрисовки змейки.'
+        )
+    parser.add_argument(
+        '--output', default='bench_results.json',
+        help='файл для сохранения результатов'
+        )
+    parser.add_argument(
+        '--compare', metavar='BASELINE',
+        help='файл с результатами для сравнения'
+        )
+    parser.add_argument(
+        '--threshold', type=float, default=0.1,
+        help='допустимое относительное замедление (по умолчанию 0.1)'
+        )
+    parser.add_argument(
+        '--quick', action='store_true', help='сокращенный набор замеров'
+        )
+    parser.add_argument(
+        '--no-render', action='store_true', help='пропустить замеры отрисовки'
+        )
+
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Запускает бенчмарки, сохраняет и сравнивает результаты."""
+    args = parse_args()
+
+    results = run_engine_benchmarks(quick=args.quick)
+    results.update(run_vector_env_benchmarks(quick=args.quick))
+    results.update(run_agent_benchmarks(quick=args.quick))
+    if not args.no_render:
+        results.update(run_render_benchmarks(quick=args.quick))
+
+    over_budget = 0
+    for case_id, result in results.items():
+        if 'ns_per_op' in result:
+            line = f'{case_id:<50} {result["ns_per_op"]:>12.0f} ns/op'
+            if 'game_steps_per_second' in result:
+                line += f' ({result["game_steps_per_second"]:.0f} игровых тиков/с)'
+            if 'budget_ns' in result:
+                line += (
+                    f' (p99 {result["p99_ns"] / 1e6:.2f} мс, '
+                    f'max {result["max_ns"] / 1e6:.2f} мс)'
+                    )
+                if result['p99_ns'] > result['budget_ns']:
+                    line += ' ПРЕВЫШЕН БЮДЖЕТ'
+                    over_budget += 1
+            print(line)
+        else:
+            print(f'{case_id:<50} пропущено: {result.get("skipped")}')
+
+    save_results(args.output, results)
+    print(f'Результаты сохранены в {args.output}')
+
+    if over_budget:
+        print(f'Превышений бюджета времени: {over_budget}')
+        sys.exit(1)
+
+    if args.compare is None:
+        return
+
+    comparison = compare_results(
+        load_results(args.compare), results, threshold=args.threshold
+        )
+    regressions = 0
+    for case_id, old, new, is_regression in comparison:
+        mark = 'РЕГРЕССИЯ' if is_regression else ''
+        print(f'{case_id:<50} {old:>10.0f} -> {new:>10.0f} ns/op {mark}')
+        regressions += is_regression
+
+    if regressions:
+        print(f'Найдено регрессий: {regressions}')
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,141 @@
+"""
+Модуль содержит бенчмарки времени выбора хода агентами автоматической игры.
+
+Выбор хода выполняется в главном потоке Tk на каждом тике, поэтому
+важно не среднее время, а самые долгие выборы: 99-й перцентиль не
+должен превышать бюджет DECISION_BUDGET_NS независимо от сравнения с
+результатами другого коммита. Змейка длиной в половину поля лежит
+на обходе поля, поэтому хвост за телом и поиски пути идут в обход.
+
+Functions:
+    build_engine: Создает движок со змейкой заданной длины на обходе поля.
+    bench_agent_decision: Измеряет время выбора хода агентом по ходу игры.
+    run_agent_benchmarks: Запускает все бенчмарки агентов.
+
+Imports:
+    Random: Для воспроизводимого размещения еды.
+    perf_counter_ns: Для измерения времени.
+
+    GameEngine: Для игры агента.
+    create_agent: Для создания агента по имени.
+    bench_utils: Общие инструменты бенчмарков.
+"""
+from random import Random
+from time import perf_counter_ns
+
+from engine.game_engine import GameEngine
+from agents.registry import create_agent
+from benchmarks.bench_utils import build_cycle, get_cycle_directions, make_case_id
+
+
+DECISION_BUDGET_NS = 10_000_000
+
+
+def build_engine(*, size: int, length: int, seed: int) -> GameEngine:
+    """
+    Создает движок со змейкой заданной длины, лежащей на обходе поля,
+    и едой в случайной свободной клетке.
+
+    Args:
+        size (int): Ширина и высота поля в клетках.
+        length (int): Длина змейки.
+        seed (int): Зерно генератора случайных чисел игры.
+
+    Returns:
+        GameEngine: Игровой движок.
+    """
+    engine = GameEngine(
+        settings={'board width': size, 'board height': size}, seed=seed
+        )
+    if length <= 3:
+        return engine
+
+    cycle = build_cycle(size, size)
+    segment_positions = [cycle[i] for i in range(length - 1, -1, -1)]
+    food = cycle[Random(seed).randrange(length, len(cycle))]
+    engine.restore(
+        seed=seed,
+        rng_state=engine.get_rng_state(),
+        score=0,
+        lives=3,
+        move_delay=engine.get_move_delay(),
+        segment_positions=segment_positions,
+        direction=get_cycle_directions(cycle, size)[segment_positions[0]],
+        pending_growth=0,
+        food_position=food
+        )
+
+    return engine
+
+
+def bench_agent_decision(
+    *, agent_name: str, size: int, length: int, ticks: int
+    ) -> dict[str, float | int]:
+    """
+    Измеряет время выбора хода агентом на каждом тике игры. Если игра
+    заканчивается, она начинается заново с той же змейкой.
+
+    Args:
+        agent_name (str): Имя агента.
+        size (int): Ширина и высота поля в клетках.
+        length (int): Начальная длина змейки.
+        ticks (int): Количество замеренных тиков.
+
+    Returns:
+        dict[str, float | int]: Среднее, 99-й перцентиль и наибольшее
+        время выбора хода в наносекундах, бюджет и количество выборов,
+        превысивших бюджет.
+    """
+    agent = create_agent(agent_name, seed=0)
+    games = 0
+    engine = build_engine(size=size, length=length, seed=games)
+    agent.reset(engine)
+
+    timings = []
+    for _ in range(ticks):
+        start = perf_counter_ns()
+        direction = agent.choose_direction(engine)
+        timings.append(perf_counter_ns() - start)
+        engine.step(direction)
+        if engine.is_game_over():
+            games += 1
+            engine = build_engine(size=size, length=length, seed=games)
+            agent.reset(engine)
+
+    timings.sort()
+    return {
+        'ns_per_op': sum(timings) / ticks,
+        'p99_ns': timings[(ticks - 1) * 99 // 100],
+        'max_ns': timings[-1],
+        'budget_ns': DECISION_BUDGET_NS,
+        'over_budget': sum(timing > DECISION_BUDGET_NS for timing in timings),
+        'number': ticks,
+        'repeat': 1
+        }
+
+
+def run_agent_benchmarks(*, quick: bool = False) -> dict[str, dict]:
+    """
+    Запускает все бенчмарки агентов.
+
+    Args:
+        quick (bool): Выполнить сокращенный набор замеров.
+
+    Returns:
+        dict[str, dict]: Результаты замеров по их идентификаторам.
+    """
+    ticks = 500 if quick else 3000
+
+    results = {}
+    for agent_name in ('astar', 'hamiltonian'):
+        for size in (100, 500):
+            for fill_ratio in (0.0, 0.5):
+                length = max(3, int(size * size * fill_ratio))
+                case_id = make_case_id(
+                    'agent_decision', agent=agent_name, board=size, fill=fill_ratio
+                    )
+                results[case_id] = bench_agent_decision(
+                    agent_name=agent_name, size=size, length=length, ticks=ticks
+                    )
+
+    return results
@@ -0,0 +1,104 @@
+"""
+Модуль отвечает за сохранение и сравнение результатов бенчмарков.
+
+Functions:
+    collect_metadata: Собирает сведения об окружении запуска.
+    save_results: Сохраняет результаты в JSON-файл.
+    load_results: Загружает результаты из JSON-файла.
+    compare_results: Сравнивает результаты с базовыми и находит регрессии.
+
+Imports:
+    json: Для записи и чтения результатов.
+    platform: Для сведений о платформе и версии Python.
+    subprocess: Для получения текущего коммита git.
+    datetime, timezone: Для отметки времени запуска.
+"""
+import json
+import platform
+import subprocess
+from datetime import datetime, timezone
+
+
+def collect_metadata() -> dict[str, str]:
+    """
+    Собирает сведения об окружении запуска.
+
+    Returns:
+        dict[str, str]: Время запуска, коммит, версия Python и платформа.
+    """
+    try:
+        commit = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            capture_output=True,
+            text=True,
+            check=True
+            ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = 'unknown'
+
+    return {
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'commit': commit,
+        'python': platform.python_version(),
+        'platform': platform.platform()
+        }
+
+
+def save_results(path: str, results: dict[str, dict]) -> None:
+    """
+    Сохраняет результаты в JSON-файл.
+
+    Args:
+        path (str): Путь к файлу.
+        results (dict[str, dict]): Результаты замеров.
+    """
+    report = {'metadata': collect_metadata(), 'results': results}
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump(report, file, indent=2, ensure_ascii=False)
+
+
+def load_results(path: str) -> dict[str, dict]:
+    """
+    Загружает результаты из JSON-файла.
+
+    Args:
+        path (str): Путь к файлу.
+
+    Returns:
+        dict[str, dict]: Результаты замеров.
+    """
+    with open(path, encoding='utf-8') as file:
+        return json.load(file)['results']
+
+
+def compare_results(
+    baseline: dict[str, dict],
+    current: dict[str, dict],
+    *,
+    threshold: float
+    ) -> list[tuple[str, float, float, bool]]:
+    """
+    Сравнивает результаты с базовыми.
+
+    Сравниваются только замеры, присутствующие в обоих наборах.
+
+    Args:
+        baseline (dict[str, dict]): Базовые результаты.
+        current (dict[str, dict]): Текущие результаты.
+        threshold (float): Допустимое относительное замедление, например 0.1.
+
+    Returns:
+        list[tuple[str, float, float, bool]]: Идентификатор замера, базовое
+        и текущее время операции в наносекундах и признак регрессии.
+    """
+    comparison = []
+    for case_id, result in current.items():
+        baseline_result = baseline.get(case_id)
+        if baseline_result is None or 'ns_per_op' not in result \
+            or 'ns_per_op' not in baseline_result:
+            continue
+        old = baseline_result['ns_per_op']
+        new = result['ns_per_op']
+        comparison.append((case_id, old, new, new > old * (1 + threshold)))
+
+    return comparison
@@ -0,0 +1,99 @@
+"""
+Модуль содержит общие инструменты бенчмарков.
+
+Functions:
+    measure: Измеряет время выполнения операции.
+    build_snake_on_cycle: Создает змейку заданной длины, лежащую на обходе поля.
+    make_case_id: Формирует идентификатор замера по названию и параметрам.
+
+Imports:
+    median: Для вычисления медианного времени замера.
+    perf_counter_ns: Для измерения времени.
+    Callable: Для написания аннотации типа аргумента operation.
+
+    Snake: Для создания змейки, по которой выполняются замеры.
+    FreeCells: Для учета свободных клеток поля змейкой.
+    build_cycle, get_cycle_directions: Для обхода поля змейкой. Доступны
+    бенчмаркам через этот модуль.
+"""
+from statistics import median
+from time import perf_counter_ns
+from typing import Callable
+
+from canvas_objects.snake import Snake
+from canvas_objects.free_cells import FreeCells
+from agents.hamiltonian_agent import build_cycle, get_cycle_directions
+
+
+def measure(
+    operation: Callable[[], object], *, number: int, repeat: int = 5
+    ) -> dict[str, float | int]:
+    """
+    Измеряет время выполнения операции.
+
+    Args:
+        operation (Callable[[], object]): Измеряемая операция.
+        number (int): Количество вызовов операции в одном повторе.
+        repeat (int): Количество повторов.
+
+    Returns:
+        dict[str, float | int]: Медианное и минимальное время одной операции
+        в наносекундах, количество вызовов и повторов.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = perf_counter_ns()
+        for _ in range(number):
+            operation()
+        timings.append((perf_counter_ns() - start) / number)
+
+    return {
+        'ns_per_op': median(timings),
+        'min_ns_per_op': min(timings),
+        'number': number,
+        'repeat': repeat
+        }
+
+
+def build_snake_on_cycle(
+    *, width: int, height: int, length: int, cycle: list[int]
+    ) -> tuple[Snake, FreeCells]:
+    """
+    Создает змейку заданной длины, лежащую на обходе поля.
+
+    Args:
+        width (int): Ширина поля в клетках.
+        height (int): Высота поля в клетках.
+        length (int): Длина змейки.
+        cycle (list[int]): Номера клеток в порядке обхода.
+
+    Returns:
+        tuple[Snake, FreeCells]: Змейка и индекс свободных клеток поля.
+    """
+    free_cells = FreeCells(cell_count=width * height)
+    segment_positions = [cycle[i] for i in range(length - 1, -1, -1)]
+    directions = get_cycle_directions(cycle, width)
+    snake = Snake(
+        segment_positions=segment_positions,
+        initial_direction=directions[segment_positions[0]],
+        board_width=width,
+        board_heigth=height,
+        free_cells=free_cells
+        )
+
+    return snake, free_cells
+
+
+def make_case_id(name: str, **params: int | float | str) -> str:
+    """
+    Формирует идентификатор замера по названию и параметрам.
+
+    Args:
+        name (str): Название замера.
+        **params (int | float | str): Параметры замера.
+
+    Returns:
+        str: Идентификатор вида name[key=value,...].
+    """
+    formatted_params = ','.join(f'{key}={value}' for key, value in params.items())
+    return f'{name}[{formatted_params}]'
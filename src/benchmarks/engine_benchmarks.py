@@ -0,0 +1,207 @@
+"""
+Модуль содержит бенчмарки игровой логики без Tkinter.
+
+Functions:
+    bench_snake_move: Измеряет ход змейки.
+    bench_food_placement: Измеряет размещение еды при разной заполненности поля.
+    bench_food_batch: Измеряет пакетный выбор клеток еды для множества игр.
+    bench_collision_checks: Измеряет проверки коллизий змейки.
+    bench_engine_step: Измеряет полный игровой тик движка.
+    run_engine_benchmarks: Запускает все бенчмарки игровой логики.
+
+Imports:
+    Random: Для воспроизводимого заполнения поля.
+
+    Food, spawn_food_batch: Для замеров размещения еды.
+    FreeCells: Для заполнения поля при замерах размещения еды.
+    GameEngine, TickResult: Для замеров полного игрового тика.
+    bench_utils: Общие инструменты бенчмарков.
+"""
+from random import Random
+
+from canvas_objects.food import Food, spawn_food_batch
+from canvas_objects.free_cells import FreeCells
+from engine.game_engine import GameEngine, TickResult
+from benchmarks.bench_utils import (
+    measure,
+    build_cycle,
+    get_cycle_directions,
+    build_snake_on_cycle,
+    make_case_id
+    )
+
+
+def bench_snake_move(
+    *, size: int, length: int, number: int
+    ) -> dict[str, float | int]:
+    """
+    Измеряет ход змейки, движущейся по обходу поля.
+
+    Args:
+        size (int): Ширина и высота поля в клетках.
+        length (int): Длина змейки.
+        number (int): Количество ходов в одном повторе.
+
+    Returns:
+        dict[str, float | int]: Результат замера.
+    """
+    cycle = build_cycle(size, size)
+    directions = get_cycle_directions(cycle, size)
+    snake, _ = build_snake_on_cycle(
+        width=size, height=size, length=length, cycle=cycle
+        )
+
+    def operation() -> None:
+        snake.change_direction(directions[snake.get_head_position()])
+        snake.move()
+
+    return measure(operation, number=number)
+
+
+def bench_food_placement(
+    *, size: int, fill_ratio: float, number: int
+    ) -> dict[str, float | int]:
+    """
+    Измеряет размещение еды на поле, заполненном змейкой на заданную долю.
+
+    Args:
+        size (int): Ширина и высота поля в клетках.
+        fill_ratio (float): Доля занятых клеток поля.
+        number (int): Количество размещений в одном повторе.
+
+    Returns:
+        dict[str, float | int]: Результат замера.
+    """
+    cell_count = size * size
+    free_cells = FreeCells(cell_count=cell_count)
+    taken_count = min(int(cell_count * fill_ratio), cell_count - 1)
+    for cell in Random(0).sample(range(cell_count), taken_count):
+        free_cells.take(cell)
+    food = Food()
+
+    def operation() -> None:
+        food.set_new_position(free_cells=free_cells)
+
+    return measure(operation, number=number)
+
+
+def bench_food_batch(
+    *, size: int, games: int, fill_ratio: float, number: int
+    ) -> dict[str, float | int]:
+    """
+    Измеряет пакетный выбор клеток еды сразу для множества игр.
+
+    Args:
+        size (int): Ширина и высота поля в клетках.
+        games (int): Количество игр.
+        fill_ratio (float): Доля занятых клеток поля.
+        number (int): Количество пакетных выборов в одном повторе.
+
+    Returns:
+        dict[str, float | int]: Результат замера одного пакетного выбора.
+    """
+    import numpy as np
+
+    rng = np.random.default_rng(0)
+    occupancy = rng.random((games, size * size)) < fill_ratio
+
+    def operation() -> None:
+        spawn_food_batch(occupancy, rng)
+
+    return measure(operation, number=number)
+
+
+def bench_collision_checks(
+    *, size: int, length: int, number: int
+    ) -> dict[str, float | int]:
+    """
+    Измеряет проверки коллизий змейки со стеной и самой собой.
+
+    Args:
+        size (int): Ширина и высота поля в клетках.
+        length (int): Длина змейки.
+        number (int): Количество проверок в одном повторе.
+
+    Returns:
+        dict[str, float | int]: Результат замера.
+    """
+    cycle = build_cycle(size, size)
+    snake, _ = build_snake_on_cycle(
+        width=size, height=size, length=length, cycle=cycle
+        )
+
+    def operation() -> None:
+        snake.is_heading_into_wall()
+        snake.is_colliding_with_self()
+
+    return measure(operation, number=number)
+
+
+def bench_engine_step(*, size: int, number: int) -> dict[str, float | int]:
+    """
+    Измеряет полный игровой тик движка со змейкой, идущей по обходу поля.
+
+    Args:
+        size (int): Ширина и высота поля в клетках.
+        number (int): Количество тиков в одном повторе.
+
+    Returns:
+        dict[str, float | int]: Результат замера.
+    """
+    engine = GameEngine(settings={'board width': size, 'board height': size})
+    directions = get_cycle_directions(build_cycle(size, size), size)
+
+    def operation() -> None:
+        head = engine.get_snake().get_head_position()
+        if engine.step(directions[head]) & TickResult.GAME_OVER:
+            engine.reset()
+
+    return measure(operation, number=number)
+
+
+def run_engine_benchmarks(*, quick: bool = False) -> dict[str, dict]:
+    """
+    Запускает все бенчмарки игровой логики.
+
+    Args:
+        quick (bool): Выполнить сокращенный набор замеров.
+
+    Returns:
+        dict[str, dict]: Результаты замеров по их идентификаторам.
+    """
+    board_sizes = (30, 100) if quick else (30, 100, 500)
+    snake_lengths = (3, 100, 1000)
+    fill_ratios = (0.0, 0.5, 0.9, 0.99, 1.0)
+    number = 2_000 if quick else 20_000
+
+    results = {}
+    for size in board_sizes:
+        for length in snake_lengths:
+            if length > size * size // 2:
+                continue
+            results[make_case_id('snake_move', board=size, length=length)] = \
+                bench_snake_move(size=size, length=length, number=number)
+            results[make_case_id('collision_checks', board=size, length=length)] = \
+                bench_collision_checks(size=size, length=length, number=number)
+
+        for fill_ratio in fill_ratios:
+            results[make_case_id('food_placement', board=size, fill=fill_ratio)] = \
+                bench_food_placement(size=size, fill_ratio=fill_ratio, number=number)
+
+        results[make_case_id('engine_step', board=size)] = \
+            bench_engine_step(size=size, number=number)
+
+    try:
+        import numpy
+    except ImportError:
+        numpy = None
+    for fill_ratio in (0.5, 0.99):
+        case_id = make_case_id('food_batch', board=30, games=1000, fill=fill_ratio)
+        if numpy is None:
+            results[case_id] = {'skipped': 'numpy не установлен'}
+            continue
+        results[case_id] = bench_food_batch(
+            size=30, games=1000, fill_ratio=fill_ratio, number=number // 200
+            )
+
+    return results
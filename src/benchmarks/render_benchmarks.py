@@ -0,0 +1,110 @@
+"""
+Модуль содержит бенчмарки отрисовки кадра на холсте Tkinter.
+
+Для запуска без монитора нужен виртуальный дисплей, например
+xvfb-run python benchmark.py. Если дисплей недоступен, замеры
+отрисовки пропускаются.
+
+Functions:
+    bench_canvas_frame: Измеряет отрисовку кадра с движущейся змейкой.
+    run_render_benchmarks: Запускает все бенчмарки отрисовки.
+
+Imports:
+    tkinter: Для создания окна и игрового холста.
+
+    CanvasRenderer: Для отрисовки кадров.
+    bench_utils: Общие инструменты бенчмарков.
+"""
+import tkinter as tk
+
+from screens.canvas_renderer import CanvasRenderer
+from benchmarks.bench_utils import (
+    measure,
+    build_cycle,
+    get_cycle_directions,
+    build_snake_on_cycle,
+    make_case_id
+    )
+
+
+def bench_canvas_frame(
+    *, root: tk.Tk, size: int, length: int, number: int
+    ) -> dict[str, float | int]:
+    """
+    Измеряет кадр игрового холста: ход змейки, отрисовку изменений
+    и обработку отложенной перерисовки Tk.
+
+    Args:
+        root (Tk): Главное окно.
+        size (int): Ширина и высота поля в клетках.
+        length (int): Длина змейки.
+        number (int): Количество кадров в одном повторе.
+
+    Returns:
+        dict[str, float | int]: Результат замера и среднее количество
+        обращений к Tk за кадр.
+    """
+    cell_size = max(1, 600 // size)
+    canvas = tk.Canvas(
+        root, bg='black', width=size * cell_size, height=size * cell_size
+        )
+    canvas.pack()
+
+    cycle = build_cycle(size, size)
+    directions = get_cycle_directions(cycle, size)
+    snake, _ = build_snake_on_cycle(
+        width=size, height=size, length=length, cycle=cycle
+        )
+    renderer = CanvasRenderer(
+        canvas=canvas, cell_size=cell_size, board_width=size, snake_color='green'
+        )
+    snake_positions = snake.get_segment_positions()
+    renderer.render(snake_positions=snake_positions, food_position=0)
+
+    def operation() -> None:
+        snake.change_direction(directions[snake.get_head_position()])
+        snake.move()
+        renderer.render(snake_positions=snake_positions, food_position=0)
+        root.update_idletasks()
+
+    result = measure(operation, number=number)
+    result['tk_calls_per_frame'] = renderer.get_average_tk_calls()
+    canvas.destroy()
+
+    return result
+
+
+def run_render_benchmarks(*, quick: bool = False) -> dict[str, dict]:
+    """
+    Запускает все бенчмарки отрисовки.
+
+    Args:
+        quick (bool): Выполнить сокращенный набор замеров.
+
+    Returns:
+        dict[str, dict]: Результаты замеров по их идентификаторам. Если
+        дисплей недоступен, содержит запись о пропуске замеров.
+    """
+    try:
+        root = tk.Tk()
+    except tk.TclError as ex:
+        return {'canvas_frame': {'skipped': str(ex)}}
+
+    board_sizes = (30, 100) if quick else (30, 100, 500)
+    snake_lengths = (3, 100, 1000)
+    number = 200 if quick else 2_000
+
+    results = {}
+    try:
+        for size in board_sizes:
+            for length in snake_lengths:
+                if length > size * size // 2:
+                    continue
+                case_id = make_case_id('canvas_frame', board=size, length=length)
+                results[case_id] = bench_canvas_frame(
+                    root=root, size=size, length=length, number=number
+                    )
+    finally:
+        root.destroy()
+
+    return results
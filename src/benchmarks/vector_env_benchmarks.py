@@ -0,0 +1,92 @@
+"""
+Модуль содержит бенчмарки одновременной симуляции множества игр.
+
+Если NumPy не установлен, замеры пропускаются.
+
+Functions:
+    bench_vector_env_step: Измеряет тик всех игр VectorSnakeEnv.
+    run_vector_env_benchmarks: Запускает все бенчмарки симуляции множества игр.
+
+Imports:
+    measure, make_case_id: Общие инструменты бенчмарков.
+"""
+from benchmarks.bench_utils import measure, make_case_id
+
+
+def bench_vector_env_step(
+    *, size: int, games: int, number: int
+    ) -> dict[str, float | int]:
+    """
+    Измеряет тик всех игр со случайными сменами направления.
+
+    Закончившиеся игры перезапускаются, чтобы все время шло
+    заданное количество игр.
+
+    Args:
+        size (int): Ширина и высота поля в клетках.
+        games (int): Количество одновременных игр.
+        number (int): Количество тиков в одном повторе.
+
+    Returns:
+        dict[str, float | int]: Результат замера одного тика всех игр
+        и количество игровых тиков в секунду.
+    """
+    import numpy as np
+
+    from engine.vector_env import VectorSnakeEnv, NO_ACTION
+
+    env = VectorSnakeEnv(
+        game_count=games,
+        settings={'board width': size, 'board height': size, 'snake length': 3},
+        seed=0
+        )
+    rng = np.random.default_rng(0)
+    action_pool = np.where(
+        rng.random((64, games)) < 0.2,
+        rng.integers(4, size=(64, games)),
+        NO_ACTION
+        ).astype(np.int8)
+    tick = 0
+
+    def operation() -> None:
+        nonlocal tick
+        env.step(action_pool[tick % len(action_pool)])
+        tick += 1
+        game_over = env.get_game_over()
+        if game_over.any():
+            env.reset(game_over.copy())
+
+    result = measure(operation, number=number)
+    result['game_steps_per_second'] = games * 1e9 / result['ns_per_op']
+
+    return result
+
+
+def run_vector_env_benchmarks(*, quick: bool = False) -> dict[str, dict]:
+    """
+    Запускает все бенчмарки симуляции множества игр.
+
+    Args:
+        quick (bool): Выполнить сокращенный набор замеров.
+
+    Returns:
+        dict[str, dict]: Результаты замеров по их идентификаторам.
+    """
+    game_counts = (1000,) if quick else (100, 1000, 10000)
+    number = 20 if quick else 100
+
+    results = {}
+    try:
+        import numpy
+    except ImportError:
+        numpy = None
+    for games in game_counts:
+        case_id = make_case_id('vector_env_step', board=30, games=games)
+        if numpy is None:
+            results[case_id] = {'skipped': 'numpy не установлен'}
+            continue
+        results[case_id] = bench_vector_env_step(
+            size=30, games=games, number=number
+            )
+
+    return results
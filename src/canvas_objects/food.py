@@ -5,10 +5,26 @@ Classes:
     Food: Содержит методы задавания позиции новой еды и получения
     ее текущей позиции.
 
+Functions:
+    spawn_food_batch: Выбирает клетки еды сразу для множества игр.
+
 Imports:
-    randint: Для определения случайной позиции еды.
+    Random: Для определения случайной позиции еды собственным
+    генератором случайных чисел.
+    TYPE_CHECKING: Для импорта NumPy только для аннотаций типов.
+
+    FreeCells: Для выбора позиции еды среди свободных клеток.
+
+    numpy: Для пакетного выбора клеток еды. Необязательная зависимость,
+    импортируется только в spawn_food_batch.
 """
-from random import randint
+from random import Random
+from typing import TYPE_CHECKING
+
+from canvas_objects.free_cells import FreeCells
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 class Food:
@@ -16,51 +32,141 @@ class Food:
     Содержит методы задавания позиции новой еды и получения
     ее текущей позиции.
     """
+    __ATTEMPTS = 8
+
     def __init__(
-        self,
-        *,
-        canvas_width: int,
-        canvas_heigth: int,
-        cell_size: int
+        self, *, rng: 'Random | np.random.Generator | None' = None
         ) -> None:
         """
-        Инициализирует параметры для появления еды.
+        Инициализирует еду без позиции.
 
         Args:
-            canvas_width (int): Ширина игрового холста.
-            canvas_heigth(int): Высота игрового холста.
-            cell_size(int): Размер еды.
+            rng (Random | Generator | None): Генератор случайных чисел: \
+                random.Random или numpy.random.Generator. Отдельный генератор \
+                с известным зерном делает размещение еды воспроизводимым и \
+                не зависит от глобального состояния модуля random.
         """
-        self.__CANVAS_WIDTH = canvas_width
-        self.__CANVAS_HEIGTH = canvas_heigth
-        self.__CELL_SIZE = cell_size
+        if rng is None:
+            rng = Random()
+        if hasattr(rng, 'integers'):
+            self.__randrange = rng.integers
+        else:
+            self.__randrange = rng.randrange
+        self.__position = None
 
-        self.__position = ()
-
-    def get_position(self) -> tuple[int, int]:
+    def get_position(self) -> int | None:
         """
         Получает позицию еды.
 
         Returns:
-            tuple[int, int]: Позиция еды.
+            int | None: Номер клетки еды или None, если свободных
+            клеток для еды не осталось.
         """
         return self.__position
-    
+
+    def set_position(self, position: int | None) -> None:
+        """
+        Задает позицию еды, например при восстановлении сохраненной игры.
+
+        Args:
+            position (int | None): Номер клетки еды или None, если еды нет.
+        """
+        self.__position = position
+
     def set_new_position(
-        self, *, snake_positions: list[tuple[int, int]]
-        ) -> None:
+        self, *, free_cells: FreeCells, reserved_count: int = 0
+        ) -> bool:
         """
-        Задает новую позицию еды.
+        Задает новую позицию еды в случайной свободной клетке.
+
+        Сначала проверяется до 8 случайных клеток поля и берется первая
+        свободная, что на незаполненном поле занимает O(1). Если все они
+        заняты, свободная клетка выбирается по случайному номеру среди
+        свободных клеток в порядке клеток поля. Каждая свободная клетка
+        выбирается с равной вероятностью, а выбор зависит только от
+        занятых клеток и состояния генератора, поэтому восстановленная
+        из снимка игра размещает еду так же, как исходная.
 
         Args:
-            snake_positions (list[tuple[int, int]]): Позиции сегментов змейки.
+            free_cells (FreeCells): Индекс свободных клеток поля.
+            reserved_count (int): Количество свободных клеток, которые \
+                змейка займет за счет еще не выполненного роста.
+
+        Returns:
+            bool: Удалось ли разместить еду. False означает, что поле
+            полностью занято змейкой.
         """
-        while True:
-            x = randint(0, (self.__CANVAS_WIDTH - self.__CELL_SIZE) \
-                        // self.__CELL_SIZE) * self.__CELL_SIZE
-            y = randint(0, (self.__CANVAS_HEIGTH - self.__CELL_SIZE) \
-                        // self.__CELL_SIZE) * self.__CELL_SIZE
-            position = (x, y)
-            if position not in snake_positions:
-                self.__position = position
-                break
+        free_count = free_cells.get_free_count()
+        if free_count <= reserved_count:
+            self.__position = None
+            return False
+
+        cell_count = free_cells.get_cell_count()
+        for _ in range(self.__ATTEMPTS):
+            cell = int(self.__randrange(cell_count))
+            if free_cells.is_free(cell):
+                self.__position = cell
+                return True
+
+        self.__position = free_cells.get_free_cell(
+            int(self.__randrange(free_count))
+            )
+        return True
+
+
+def spawn_food_batch(
+    occupancy: 'np.ndarray',
+    rng: 'np.random.Generator',
+    *,
+    candidates: int = 8,
+    rounds: int = 2
+    ) -> 'np.ndarray':
+    """
+    Выбирает случайную свободную клетку для еды сразу во множестве игр.
+
+    Для всех игр за один векторный шаг выбирается по candidates случайных
+    клеток, которые проверяются по маске занятости; берется первая
+    свободная. Если в игре все кандидаты заняты, выбор повторяется до
+    rounds раз, а для оставшихся игр свободная клетка выбирается точно
+    по накопленной сумме свободных клеток. Каждая свободная клетка
+    выбирается с равной вероятностью.
+
+    Args:
+        occupancy (ndarray): Маска занятости формы (игры, клетки), \
+            True означает занятую клетку.
+        rng (Generator): Генератор случайных чисел NumPy.
+        candidates (int): Количество кандидатов на игру за один шаг.
+        rounds (int): Количество шагов выбора кандидатов до точного выбора.
+
+    Returns:
+        ndarray: Номер клетки еды для каждой игры или -1, если в игре
+        не осталось свободных клеток.
+    """
+    import numpy as np
+
+    game_count, cell_count = occupancy.shape
+    food_cells = np.full(game_count, -1, dtype=np.int64)
+    pending = np.arange(game_count)
+
+    for _ in range(rounds):
+        if not pending.size:
+            return food_cells
+        cells = rng.integers(cell_count, size=(pending.size, candidates))
+        free = ~occupancy[pending[:, None], cells]
+        found = free.any(axis=1)
+        first_free = free.argmax(axis=1)
+        food_cells[pending[found]] = cells[found, first_free[found]]
+        pending = pending[~found]
+
+    if pending.size:
+        free = ~occupancy[pending]
+        free_counts = free.sum(axis=1)
+        has_free = free_counts > 0
+        pending = pending[has_free]
+        if not pending.size:
+            return food_cells
+        free = free[has_free]
+        picks = rng.integers(free_counts[has_free])
+        food_cells[pending] = (free.cumsum(axis=1) > picks[:, None]).argmax(axis=1)
+
+    return food_cells
@@ -0,0 +1,148 @@
+"""
+Модуль отвечает за учет свободных клеток игрового поля.
+
+Classes:
+    FreeCells: Содержит отметки свободных клеток, позволяющие за O(1)
+    занимать и освобождать клетки и выбирать свободную клетку по номеру
+    в порядке клеток поля.
+
+Imports:
+    array: Для компактного хранения количества свободных клеток в блоках.
+"""
+from array import array
+
+
+class FreeCells:
+    """
+    Содержит отметки свободных клеток игрового поля.
+
+    Для каждой клетки поля хранится один байт: 1 для свободной клетки
+    и 0 для занятой, а для каждого блока из 4096 клеток - количество
+    свободных клеток в нем. Выбор свободной клетки по номеру считает
+    свободные клетки в порядке номеров клеток, поэтому результат зависит
+    только от того, какие клетки заняты, а не от порядка их занятия.
+    """
+    __BLOCK_SHIFT = 12
+    __BLOCK_SIZE = 1 << __BLOCK_SHIFT
+    __PART_SIZE = 64
+
+    def __init__(self, *, cell_count: int) -> None:
+        """
+        Инициализирует отметки, считая все клетки поля свободными.
+
+        Args:
+            cell_count (int): Количество клеток поля.
+        """
+        self.__free = bytearray(b'\x01') * cell_count
+        self.__free_count = cell_count
+        self.__block_free_counts = self.__count_block_free()
+
+    def __count_block_free(self) -> array:
+        """
+        Подсчитывает свободные клетки в каждом блоке поля.
+
+        Returns:
+            array: Количество свободных клеток в каждом блоке.
+        """
+        free = self.__free
+        block_size = self.__BLOCK_SIZE
+        return array('i', (
+            free.count(1, start, start + block_size)
+            for start in range(0, len(free), block_size)
+            ))
+
+    def get_cell_count(self) -> int:
+        """
+        Получает общее количество клеток поля.
+
+        Returns:
+            int: Количество клеток поля.
+        """
+        return len(self.__free)
+
+    def get_free_count(self) -> int:
+        """
+        Получает количество свободных клеток.
+
+        Returns:
+            int: Количество свободных клеток.
+        """
+        return self.__free_count
+
+    def get_free_cell(self, index: int) -> int:
+        """
+        Получает свободную клетку по ее номеру среди свободных клеток
+        в порядке клеток поля.
+
+        Блок с нужной клеткой находится по количеству свободных клеток
+        в блоках, а внутри блока клетки считаются на стороне C, поэтому
+        выбор занимает O(количество клеток / 4096 + 64) операций Python.
+
+        Args:
+            index (int): Номер свободной клетки от 0 до get_free_count() - 1.
+
+        Returns:
+            int: Свободная клетка.
+        """
+        block = 0
+        for count in self.__block_free_counts:
+            if index < count:
+                break
+            index -= count
+            block += 1
+
+        free = self.__free
+        part_size = self.__PART_SIZE
+        start = block << self.__BLOCK_SHIFT
+        count = free.count(1, start, start + part_size)
+        while index >= count:
+            index -= count
+            start += part_size
+            count = free.count(1, start, start + part_size)
+
+        cell = free.find(1, start)
+        for _ in range(index):
+            cell = free.find(1, cell + 1)
+        return cell
+
+    def is_free(self, cell: int) -> bool:
+        """
+        Проверяет, свободна ли клетка поля.
+
+        Args:
+            cell (int): Номер клетки.
+
+        Returns:
+            bool: Свободна ли клетка.
+        """
+        return self.__free[cell] == 1
+
+    def release_all(self) -> None:
+        """Отмечает все клетки поля свободными."""
+        self.__free = bytearray(b'\x01') * len(self.__free)
+        self.__free_count = len(self.__free)
+        self.__block_free_counts = self.__count_block_free()
+
+    def take(self, cell: int) -> None:
+        """
+        Отмечает клетку занятой.
+
+        Args:
+            cell (int): Номер клетки.
+        """
+        if self.__free[cell]:
+            self.__free[cell] = 0
+            self.__free_count -= 1
+            self.__block_free_counts[cell >> self.__BLOCK_SHIFT] -= 1
+
+    def release(self, cell: int) -> None:
+        """
+        Отмечает клетку свободной.
+
+        Args:
+            cell (int): Номер клетки.
+        """
+        if not self.__free[cell]:
+            self.__free[cell] = 1
+            self.__free_count += 1
+            self.__block_free_counts[cell >> self.__BLOCK_SHIFT] += 1
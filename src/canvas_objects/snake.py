@@ -1,101 +1,227 @@
 """
-Модуль отвечает за еду.
+Модуль отвечает за змейку.
+
+Позиции сегментов хранятся номерами клеток поля: cell = y * width + x.
 
 Classes:
-    Snake: Содержит методы возврата, получения положения сегментов змейки и ее головы,
+    Snake: Содержит методы отмены хода, получения положения сегментов змейки и ее головы,
     а также относящиеся к ее управлению.
+
+Imports:
+    deque: Для хранения сегментов змейки с перемещением за O(1).
+
+    FreeCells: Для учета клеток поля, не занятых змейкой.
 """
+from collections import deque
+
+from canvas_objects.free_cells import FreeCells
+
 
 class Snake:
     """
-    Содержит методы возврата, получения положения сегментов змейки и ее головы,
+    Содержит методы отмены хода, получения положения сегментов змейки и ее головы,
     а также относящиеся к ее управлению.
     """
     def __init__(
         self,
         *,
-        segment_positions: list[tuple[int, int]],
-        initial_direction: str
+        segment_positions: list[int],
+        initial_direction: str,
+        board_width: int,
+        board_heigth: int,
+        free_cells: FreeCells | None = None,
+        pending_growth: int = 0
         ) -> None:
         """
-        Инициализирует параметры для появления еды.
+        Инициализирует змейку.
 
         Args:
-            segment_positions (list[tuple[int, int]]): Позиции сегментов.
+            segment_positions (list[int]): Номера клеток сегментов от головы к хвосту.
             initial_direction (str): Начальное направление.
+            board_width (int): Ширина поля в клетках.
+            board_heigth (int): Высота поля в клетках.
+            free_cells (FreeCells | None): Индекс свободных клеток поля, \
+                который змейка обновляет при движении.
+            pending_growth (int): Количество сегментов, на которое змейка \
+                еще вырастет, например при восстановлении сохраненной игры.
         """
-        self.__segment_positions = segment_positions
-        self.__previous_positions = self.__segment_positions
+        self.__BOARD_WIDTH = board_width
+        self.__BOARD_HEIGTH = board_heigth
+        self.__DELTAS = {
+            'Left': -1, 'Right': 1, 'Up': -board_width, 'Down': board_width
+            }
+
+        self.__segment_positions = deque(segment_positions)
+        self.__occupancy = bytearray(board_width * board_heigth)
+        self.__free_cells = free_cells
+        for position in self.__segment_positions:
+            self.__occupy(position)
+
+        self.__pending_growth = pending_growth
+        self.__last_tail = None
+        self.__last_move_grew = False
 
         self.__direction = initial_direction
+        self.__delta = self.__DELTAS[initial_direction]
+
+    def __occupy(self, position: int) -> None:
+        """
+        Отмечает клетку занятой еще одним сегментом.
+
+        Args:
+            position (int): Номер клетки.
+        """
+        count = self.__occupancy[position]
+        self.__occupancy[position] = count + 1
+        if not count and self.__free_cells is not None:
+            self.__free_cells.take(position)
 
-    def return_snake_to_previous_position(self, prev_position: list[tuple[int, int]]) -> None:
+    def __release(self, position: int) -> None:
         """
-        Возвращает змейку на предыдущее положение.
+        Освобождает клетку от одного сегмента.
 
         Args:
-            prev_position (list[tuple[int, int]]): Предыдущее положение змейки. 
+            position (int): Номер клетки.
+        """
+        count = self.__occupancy[position] - 1
+        self.__occupancy[position] = count
+        if not count and self.__free_cells is not None:
+            self.__free_cells.release(position)
+
+    def is_occupied(self, position: int) -> bool:
+        """
+        Проверяет, занята ли клетка змейкой.
+
+        Args:
+            position (int): Номер клетки.
+
+        Returns:
+            bool: Занята ли клетка.
+        """
+        return self.__occupancy[position] != 0
+
+    def get_occupancy(self) -> bytearray:
+        """
+        Получает сетку занятости клеток, которую змейка обновляет при движении.
+
+        Сетка возвращается без копирования и не должна изменяться
+        вызывающим кодом.
+
+        Returns:
+            bytearray: Количество сегментов змейки в каждой клетке поля.
         """
-        self.__segment_positions = prev_position
-    
-    def get_previous_position(self) -> list[tuple[int, int]]:
+        return self.__occupancy
+
+    def is_colliding_with_self(self) -> bool:
         """
-        Получает предыдущее положение змейки.
+        Проверяет, попала ли голова змейки на другой ее сегмент.
 
         Returns:
-            list[tuple[int, int]]: Предыдущее положение змейки.
+            bool: Столкнулась ли змейка сама с собой.
         """
-        return self.__previous_positions
+        return self.__occupancy[self.__segment_positions[0]] > 1
 
-    def get_segment_positions(self) -> list[tuple[int, int]]:
+    def is_heading_into_wall(self) -> bool:
+        """
+        Проверяет, выйдет ли голова за границу поля на следующем ходу.
+
+        Returns:
+            bool: Врежется ли змейка в стену.
+        """
+        head_y, head_x = divmod(self.__segment_positions[0], self.__BOARD_WIDTH)
+        direction = self.__direction
+        if direction == 'Left':
+            return head_x == 0
+        if direction == 'Right':
+            return head_x == self.__BOARD_WIDTH - 1
+        if direction == 'Up':
+            return head_y == 0
+        return head_y == self.__BOARD_HEIGTH - 1
+
+    def undo_move(self) -> None:
+        """
+        Возвращает змейку на положение до последнего хода.
+
+        Для отмены хранится только отброшенный хвост, поэтому отменить
+        можно лишь один последний ход.
+        """
+        self.__release(self.__segment_positions.popleft())
+        if self.__last_move_grew:
+            self.__pending_growth += 1
+        else:
+            self.__segment_positions.append(self.__last_tail)
+            self.__occupy(self.__last_tail)
+
+    def get_segment_positions(self) -> deque[int]:
         """
         Получает положение сегментов змейки.
 
         Returns:
-            list[tuple[int, int]]: Положение сегментов змейки.
+            deque[int]: Номера клеток сегментов змейки от головы к хвосту.
         """
         return self.__segment_positions
 
     def add_segment_to_end(self) -> None:
-        """Добавляет сегмент в конец змейки."""
-        tail = self.__segment_positions[-1]
-        self.__segment_positions.append(tail)
+        """
+        Добавляет сегмент в конец змейки.
 
-    def get_head_position(self) -> tuple[int, int]:
+        Хвост не дублируется: на следующем ходу змейка просто
+        не отбрасывает последний сегмент.
+        """
+        self.__pending_growth += 1
+
+    def get_pending_growth(self) -> int:
+        """
+        Получает количество сегментов, на которое змейка еще вырастет.
+
+        Returns:
+            int: Количество отложенных сегментов.
+        """
+        return self.__pending_growth
+
+    def get_head_position(self) -> int:
         """
         Получает положение головы.
 
         Returns:
-            tuple[int, int]: Положение головы.
+            int: Номер клетки головы.
         """
         return self.__segment_positions[0]
 
-    def change_direction(self, new_direction: dict[str, str]) -> None:
+    def get_direction(self) -> str:
+        """
+        Получает текущее направление движения.
+
+        Returns:
+            str: Направление движения.
+        """
+        return self.__direction
+
+    def change_direction(self, new_direction: str) -> None:
         """
         Разрешает двигаться по новому направлению.
 
         Args:
-            new_direction (dict[str, str]): Новое направление.
+            new_direction (str): Новое направление.
         """
         opposites = {
             'Up': 'Down', 'Down': 'Up', 'Left': 'Right', 'Right': 'Left'
             }
         if new_direction != opposites.get(self.__direction):
             self.__direction = new_direction
+            self.__delta = self.__DELTAS[new_direction]
 
     def move(self) -> None:
-        """Двигает змейку взависимости от направления."""
-        self.__previous_positions = list(self.__segment_positions)
-
-        head_x, head_y = self.__segment_positions[0]
-
-        if self.__direction == 'Left':
-            new_head = (head_x - 20, head_y)
-        elif self.__direction == 'Right':
-            new_head = (head_x + 20, head_y)
-        elif self.__direction == 'Up':
-            new_head = (head_x, head_y - 20)
-        elif self.__direction == 'Down':
-            new_head = (head_x, head_y + 20)
-
-        self.__segment_positions = [new_head] + self.__segment_positions[:-1]
+        """Двигает змейку на одну клетку взависимости от направления."""
+        new_head = self.__segment_positions[0] + self.__delta
+
+        if self.__pending_growth:
+            self.__pending_growth -= 1
+            self.__last_move_grew = True
+        else:
+            self.__last_tail = self.__segment_positions.pop()
+            self.__release(self.__last_tail)
+            self.__last_move_grew = False
+
+        self.__segment_positions.appendleft(new_head)
+        self.__occupy(new_head)
@@ -0,0 +1,144 @@
+"""
+Модуль отвечает за замеры времени этапов игрового цикла.
+
+Classes:
+    FrameProfiler: Содержит запись длительностей этапов в кольцевые
+    буферы фиксированного размера, подсчет скользящих перцентилей и
+    сохранение замеров в CSV.
+
+Imports:
+    csv: Для сохранения замеров.
+    array: Для кольцевых буферов замеров без создания объектов.
+    Path: Для написания аннотации типа пути к файлу замеров.
+"""
+import csv
+from array import array
+from pathlib import Path
+
+
+PERCENTILES = (50, 95, 99)
+
+
+class FrameProfiler:
+    """
+    Содержит запись длительностей этапов в кольцевые буферы
+    фиксированного размера, подсчет скользящих перцентилей и
+    сохранение замеров в CSV.
+
+    Запись замера не выделяет память: буферы создаются один раз,
+    а новые значения перезаписывают самые старые.
+    """
+    def __init__(self, *, sections: tuple[str, ...], size: int = 512) -> None:
+        """
+        Инициализирует пустые буферы замеров.
+
+        Args:
+            sections (tuple[str, ...]): Названия этапов.
+            size (int): Количество хранимых замеров каждого этапа.
+        """
+        self.__SECTIONS = sections
+        self.__SIZE = size
+
+        self.__samples = {
+            section: array('d', bytes(8 * size)) for section in sections
+            }
+        self.__indexes = dict.fromkeys(sections, 0)
+        self.__counts = dict.fromkeys(sections, 0)
+
+    def get_sections(self) -> tuple[str, ...]:
+        """
+        Получает названия этапов.
+
+        Returns:
+            tuple[str, ...]: Названия этапов.
+        """
+        return self.__SECTIONS
+
+    def record(self, section: str, seconds: float) -> None:
+        """
+        Записывает длительность этапа.
+
+        Args:
+            section (str): Название этапа.
+            seconds (float): Длительность в секундах.
+        """
+        index = self.__indexes[section]
+        self.__samples[section][index] = seconds
+        self.__indexes[section] = (index + 1) % self.__SIZE
+        if self.__counts[section] < self.__SIZE:
+            self.__counts[section] += 1
+
+    def get_samples(self, section: str) -> list[float]:
+        """
+        Получает хранимые замеры этапа от старых к новым.
+
+        Args:
+            section (str): Название этапа.
+
+        Returns:
+            list[float]: Длительности в секундах.
+        """
+        samples = self.__samples[section]
+        count = self.__counts[section]
+        if count < self.__SIZE:
+            return samples[:count].tolist()
+
+        index = self.__indexes[section]
+        return (samples[index:] + samples[:index]).tolist()
+
+    def get_percentiles(self, section: str) -> tuple[float, ...]:
+        """
+        Получает перцентили p50, p95 и p99 длительности этапа по
+        хранимым замерам.
+
+        Args:
+            section (str): Название этапа.
+
+        Returns:
+            tuple[float, ...]: Перцентили в миллисекундах или нули, если
+            замеров еще нет.
+        """
+        samples = sorted(self.get_samples(section))
+        if not samples:
+            return (0.0,) * len(PERCENTILES)
+
+        last_index = len(samples) - 1
+        return tuple(
+            samples[last_index * percentile // 100] * 1000
+            for percentile in PERCENTILES
+            )
+
+    def get_report(self) -> str:
+        """
+        Получает текстовую сводку перцентилей всех этапов.
+
+        Returns:
+            str: По строке на этап с перцентилями в миллисекундах.
+        """
+        lines = [f'{"мс":<7}' + ''.join(f'{f"p{p}":>7}' for p in PERCENTILES)]
+        for section in self.__SECTIONS:
+            p50, p95, p99 = self.get_percentiles(section)
+            lines.append(f'{section:<7}{p50:7.2f}{p95:7.2f}{p99:7.2f}')
+
+        return '\n'.join(lines)
+
+    def save_csv(self, path: Path) -> None:
+        """
+        Сохраняет хранимые замеры в CSV: по строке на замер с номером,
+        этапом и длительностью в миллисекундах.
+
+        Args:
+            path (Path): Путь к файлу.
+        """
+        with open(path, 'w', newline='', encoding='utf-8') as file:
+            writer = csv.writer(file)
+            writer.writerow(('section', 'sample', 'milliseconds'))
+            for section in self.__SECTIONS:
+                for number, seconds in enumerate(self.get_samples(section)):
+                    writer.writerow((section, number, f'{seconds * 1000:.4f}'))
+
+    def clear(self) -> None:
+        """Удаляет все замеры."""
+        for section in self.__SECTIONS:
+            self.__indexes[section] = 0
+            self.__counts[section] = 0
@@ -0,0 +1,414 @@
+"""
+Модуль отвечает за игровую логику без привязки к Tkinter.
+
+Модуль позволяет прогонять игру по тикам в тестах, ботах и на сервере
+без создания главного окна.
+
+Classes:
+    TickResult: Флаги событий, произошедших за один игровой тик.
+    GameEngine: Содержит игровые правила: движение змейки, коллизии,
+    жизни, очки и ускорение змейки.
+
+Imports:
+    Iterable: Для написания аннотации типа сегментов восстанавливаемой змейки.
+    IntFlag, auto: Для описания результата тика набором флагов.
+    Random, getrandbits: Для генератора случайных чисел игры и выбора
+    его зерна.
+
+    Snake, Food: Для создания и взаимодействия в классе GameEngine.
+    FreeCells: Для учета свободных клеток поля при размещении еды.
+"""
+from collections.abc import Iterable
+from enum import IntFlag, auto
+from random import Random, getrandbits
+
+from canvas_objects.snake import Snake
+from canvas_objects.food import Food
+from canvas_objects.free_cells import FreeCells
+
+
+class TickResult(IntFlag):
+    """Флаги событий, произошедших за один игровой тик."""
+    NONE = 0
+    ATE_FOOD = auto()
+    LOST_LIFE = auto()
+    GAME_OVER = auto()
+    BOARD_FULL = auto()
+
+
+class GameEngine:
+    """
+    Содержит игровые правила: движение змейки, коллизии со стенами,
+    едой и самой собой, учет жизней, очков и задержки движения.
+    """
+    def __init__(
+        self,
+        *,
+        settings: dict[str, int | str],
+        seed: int | None = None
+        ) -> None:
+        """
+        Инициализирует игровой движок.
+
+        Движок работает в координатах клеток поля, размер клетки в
+        пикселях важен только для отрисовки. Вся случайность игры берется
+        из генератора с зерном seed, поэтому игра с тем же зерном, настройками
+        и вводом повторяется в точности.
+
+        Args:
+            settings (dict[str, int | str]): Настройки игры.
+            seed (int | None): Зерно генератора случайных чисел. Если не \
+                задано, выбирается случайно.
+        """
+        self.__BOARD_WIDTH = settings.get('board width', 30)
+        self.__BOARD_HEIGTH = settings.get('board height', 30)
+        self.__INITIAL_LIVES = 3
+
+        self.__settings = settings
+
+        self.__rng = Random()
+        self.__free_cells = self.__init_free_cells()
+        self.reset(seed=seed)
+
+    def get_board_size(self) -> tuple[int, int]:
+        """
+        Получает размер игрового поля.
+
+        Returns:
+            tuple[int, int]: Ширина и высота поля в клетках.
+        """
+        return self.__BOARD_WIDTH, self.__BOARD_HEIGTH
+
+    def get_settings(self) -> dict[str, int | str]:
+        """
+        Получает настройки игры.
+
+        Returns:
+            dict[str, int | str]: Настройки игры.
+        """
+        return self.__settings
+
+    def get_seed(self) -> int:
+        """
+        Получает зерно генератора случайных чисел текущей игры.
+
+        Returns:
+            int: Зерно генератора.
+        """
+        return self.__seed
+
+    def get_snake(self) -> Snake:
+        """
+        Получает змейку.
+
+        Returns:
+            Snake: Экземпляр змейки.
+        """
+        return self.__snake
+
+    def get_food(self) -> Food:
+        """
+        Получает еду.
+
+        Returns:
+            Food: Экземпляр еды.
+        """
+        return self.__food
+
+    def get_score(self) -> int:
+        """
+        Получает заработанные очки.
+
+        Returns:
+            int: Заработанные очки.
+        """
+        return self.__score
+
+    def get_lives(self) -> int:
+        """
+        Получает количество жизней.
+
+        Returns:
+            int: Количество жизней.
+        """
+        return self.__lives
+
+    def get_move_delay(self) -> int:
+        """
+        Получает задержку между тиками.
+
+        Returns:
+            int: Задержка между тиками в миллисекундах.
+        """
+        return self.__move_delay
+
+    def get_rng_state(self) -> tuple:
+        """
+        Получает состояние генератора случайных чисел игры.
+
+        Returns:
+            tuple: Состояние в формате random.Random.getstate.
+        """
+        return self.__rng.getstate()
+
+    def is_board_full(self) -> bool:
+        """
+        Проверяет, заполнила ли змейка все поле.
+
+        Returns:
+            bool: Заполнено ли поле, то есть выиграна ли игра.
+        """
+        return self.__board_full
+
+    def is_game_over(self) -> bool:
+        """
+        Проверяет, закончилась ли игра.
+
+        Returns:
+            bool: Закончилась ли игра.
+        """
+        return self.__game_over
+
+    def __get_initial_move_delay(self) -> int:
+        """
+        Вычисляет стартовую задержку движения по скорости змейки.
+
+        Returns:
+            int: Задержка между тиками в миллисекундах.
+        """
+        snake_speed = self.__settings.get('snake speed', 10) * 10
+        return 200 - snake_speed
+
+    def __init_free_cells(self) -> FreeCells:
+        """
+        Инициализирует индекс свободных клеток поля.
+
+        Returns:
+            FreeCells: Индекс, в котором свободны все клетки поля.
+        """
+        return FreeCells(cell_count=self.__BOARD_WIDTH * self.__BOARD_HEIGTH)
+
+    def __init_snake(self) -> Snake:
+        """
+        Инициализирует змейку.
+
+        Returns:
+            Snake: Экземпляр змейки.
+        """
+        head_x = self.__BOARD_WIDTH // 2
+        head_y = self.__BOARD_HEIGTH // 2
+        initial_length = min(self.__settings.get('snake length', 3), head_x + 1)
+        head = head_y * self.__BOARD_WIDTH + head_x
+        initial_positions = []
+        for i in range(initial_length):
+            initial_positions.append(head - i)
+
+        initial_direction = 'Right'
+        self.__free_cells.release_all()
+        snake = Snake(
+            segment_positions=initial_positions,
+            initial_direction=initial_direction,
+            board_width=self.__BOARD_WIDTH,
+            board_heigth=self.__BOARD_HEIGTH,
+            free_cells=self.__free_cells
+            )
+
+        return snake
+
+    def __init_food(self) -> Food:
+        """
+        Инициализирует еду.
+
+        Returns:
+            Food: Экземпляр еды.
+        """
+        food = Food(rng=self.__rng)
+        food.set_new_position(free_cells=self.__free_cells)
+
+        return food
+
+    def reset(self, *, seed: int | None = None) -> None:
+        """
+        Перезапускает игровые параметры, показатели и объекты.
+
+        Args:
+            seed (int | None): Зерно генератора случайных чисел новой игры. \
+                Если не задано, выбирается случайно.
+        """
+        if seed is None:
+            seed = getrandbits(63)
+        self.__seed = seed
+        self.__rng.seed(seed)
+
+        self.__score = 0
+        self.__lives = self.__INITIAL_LIVES
+        self.__game_over = False
+        self.__board_full = False
+        self.__move_delay = self.__get_initial_move_delay()
+
+        self.__snake = self.__init_snake()
+        self.__food = self.__init_food()
+
+    def restore(
+        self,
+        *,
+        seed: int,
+        rng_state: tuple,
+        score: int,
+        lives: int,
+        move_delay: int,
+        segment_positions: Iterable[int],
+        direction: str,
+        pending_growth: int,
+        food_position: int | None,
+        game_over: bool = False,
+        board_full: bool = False
+        ) -> None:
+        """
+        Восстанавливает состояние игры, например из снимка.
+
+        Размещение еды зависит только от занятых клеток и состояния
+        генератора случайных чисел, поэтому восстановленная игра
+        продолжается так же, как исходная.
+
+        Args:
+            seed (int): Зерно генератора случайных чисел игры.
+            rng_state (tuple): Состояние генератора случайных чисел.
+            score (int): Заработанные очки.
+            lives (int): Количество жизней.
+            move_delay (int): Задержка между тиками в миллисекундах.
+            segment_positions (Iterable[int]): Номера клеток сегментов \
+                змейки от головы к хвосту.
+            direction (str): Направление движения змейки.
+            pending_growth (int): Количество сегментов, на которое змейка \
+                еще вырастет.
+            food_position (int | None): Номер клетки еды или None.
+            game_over (bool): Закончилась ли игра.
+            board_full (bool): Заполнено ли поле.
+        """
+        self.__seed = seed
+        self.__rng.setstate(rng_state)
+
+        self.__score = score
+        self.__lives = lives
+        self.__game_over = game_over
+        self.__board_full = board_full
+        self.__move_delay = move_delay
+
+        self.__free_cells.release_all()
+        self.__snake = Snake(
+            segment_positions=segment_positions,
+            initial_direction=direction,
+            board_width=self.__BOARD_WIDTH,
+            board_heigth=self.__BOARD_HEIGTH,
+            free_cells=self.__free_cells,
+            pending_growth=pending_growth
+            )
+        self.__food = Food(rng=self.__rng)
+        self.__food.set_position(food_position)
+
+    def __reset_snake(self) -> None:
+        """Пересоздает змейку."""
+        self.__snake = self.__init_snake()
+        self.__move_delay = self.__get_initial_move_delay()
+
+    def __lose_life(self) -> TickResult:
+        """
+        Отнимает жизнь и пересоздает змейку либо заканчивает игру.
+
+        Returns:
+            TickResult: Произошедшие события.
+        """
+        self.__lives -= 1
+        if self.__lives > 0:
+            self.__reset_snake()
+            return TickResult.LOST_LIFE
+
+        self.__game_over = True
+        return TickResult.LOST_LIFE | TickResult.GAME_OVER
+
+    def __handle_collision_with_walls(self) -> TickResult:
+        """
+        Отрабатывает коллизию змейки со стеной до хода, поэтому при
+        столкновении змейка остается на месте.
+
+        Returns:
+            TickResult: Произошедшие события.
+        """
+        if self.__snake.is_heading_into_wall():
+            return self.__lose_life()
+        return TickResult.NONE
+
+    def __handle_collision_with_food(self) -> TickResult:
+        """
+        Отрабатывает коллизию змейки с едой.
+
+        Returns:
+            TickResult: Произошедшие события.
+        """
+        head_position = self.__snake.get_head_position()
+        food_position = self.__food.get_position()
+        if head_position == food_position:
+            self.__snake.add_segment_to_end()
+            self.__score += 1
+            self.__move_delay = max(10, self.__move_delay - 2)
+            if not self.__food.set_new_position(
+                free_cells=self.__free_cells,
+                reserved_count=self.__snake.get_pending_growth()
+                ):
+                self.__board_full = True
+                self.__game_over = True
+                return TickResult.ATE_FOOD | TickResult.BOARD_FULL \
+                    | TickResult.GAME_OVER
+            return TickResult.ATE_FOOD
+        return TickResult.NONE
+
+    def __handle_collision_with_self(self) -> TickResult:
+        """
+        Отрабатывает коллизию змейки самой с собой.
+
+        Returns:
+            TickResult: Произошедшие события.
+        """
+        if self.__snake.is_colliding_with_self():
+            self.__snake.undo_move()
+            return self.__lose_life()
+        return TickResult.NONE
+
+    def change_direction(self, new_direction: str) -> None:
+        """
+        Меняет направление движения змейки.
+
+        Args:
+            new_direction (str): Новое направление.
+        """
+        self.__snake.change_direction(new_direction)
+
+    def step(self, direction: str | None = None) -> TickResult:
+        """
+        Выполняет один игровой тик.
+
+        Args:
+            direction (str | None): Новое направление змейки. Если не задано,
+                змейка продолжает двигаться в текущем направлении.
+
+        Returns:
+            TickResult: События, произошедшие за тик.
+        """
+        if self.__game_over:
+            return TickResult.GAME_OVER
+
+        if direction is not None:
+            self.__snake.change_direction(direction)
+
+        result = self.__handle_collision_with_walls()
+        if self.__game_over:
+            return result
+        if not result:
+            self.__snake.move()
+        result |= self.__handle_collision_with_food()
+        if self.__game_over:
+            return result
+        result |= self.__handle_collision_with_self()
+
+        return result
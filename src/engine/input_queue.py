@@ -0,0 +1,113 @@
+"""
+Модуль отвечает за буфер нажатий клавиш управления змейкой.
+
+Classes:
+    InputQueue: Содержит ограниченную очередь направлений, которые
+    применяются по одному за тик, и счетчики отброшенных нажатий.
+
+Imports:
+    deque: Для хранения очереди направлений.
+"""
+from collections import deque
+
+
+OPPOSITES = {'Up': 'Down', 'Down': 'Up', 'Left': 'Right', 'Right': 'Left'}
+
+
+class InputQueue:
+    """
+    Содержит ограниченную очередь направлений, которые применяются
+    по одному за тик, и счетчики отброшенных нажатий.
+
+    Новое направление проверяется по последнему направлению в очереди,
+    а не по текущему направлению змейки, поэтому быстрые нажатия между
+    тиками (например, вверх и влево при движении вправо) выполняются
+    на следующих тиках по порядку и не разворачивают змейку в шею.
+    """
+    def __init__(self, *, max_size: int = 3) -> None:
+        """
+        Инициализирует пустую очередь.
+
+        Args:
+            max_size (int): Наибольшее количество направлений в очереди.
+        """
+        self.__MAX_SIZE = max_size
+
+        self.__directions = deque()
+        self.__dropped_count = 0
+        self.__coalesced_count = 0
+
+    def push(self, direction: str, current_direction: str) -> bool:
+        """
+        Добавляет направление в очередь.
+
+        Повтор последнего направления объединяется с ним, а разворот
+        в противоположную сторону и нажатие при заполненной очереди
+        отбрасываются.
+
+        Args:
+            direction (str): Новое направление.
+            current_direction (str): Текущее направление змейки, с которым \
+                сравнивается нажатие, если очередь пуста.
+
+        Returns:
+            bool: Добавлено ли направление в очередь.
+        """
+        last_direction = current_direction
+        if self.__directions:
+            last_direction = self.__directions[-1]
+
+        if direction == last_direction:
+            self.__coalesced_count += 1
+            return False
+        if direction == OPPOSITES.get(last_direction) \
+            or len(self.__directions) >= self.__MAX_SIZE:
+            self.__dropped_count += 1
+            return False
+
+        self.__directions.append(direction)
+        return True
+
+    def pop(self) -> str | None:
+        """
+        Извлекает следующее направление.
+
+        Returns:
+            str | None: Направление или None, если очередь пуста.
+        """
+        if self.__directions:
+            return self.__directions.popleft()
+        return None
+
+    def clear(self) -> None:
+        """Очищает очередь и сбрасывает счетчики."""
+        self.__directions.clear()
+        self.__dropped_count = 0
+        self.__coalesced_count = 0
+
+    def get_size(self) -> int:
+        """
+        Получает количество направлений в очереди.
+
+        Returns:
+            int: Количество направлений.
+        """
+        return len(self.__directions)
+
+    def get_dropped_count(self) -> int:
+        """
+        Получает количество отброшенных нажатий.
+
+        Returns:
+            int: Количество разворотов и нажатий при заполненной очереди.
+        """
+        return self.__dropped_count
+
+    def get_coalesced_count(self) -> int:
+        """
+        Получает количество объединенных нажатий.
+
+        Returns:
+            int: Количество повторов последнего направления.
+        """
+        return self.__coalesced_count
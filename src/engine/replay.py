@@ -0,0 +1,407 @@
+"""
+Модуль отвечает за запись и воспроизведение игр.
+
+Игра полностью определяется зерном генератора случайных чисел,
+настройками и сменами направления по номерам тиков, поэтому запись
+хранит только их и итоговое состояние для проверки воспроизведения.
+
+Формат файла (порядок байтов little-endian):
+    заголовок: сигнатура b'SNKR', версия (1 байт), зерно (8 байт),
+    длина настроек (4 байта) и настройки в JSON (UTF-8);
+    события: количество (4 байта), затем для каждого события одно
+    varint-число (тиков от прошлого события << 2 | код направления);
+    итог: количество тиков varint, флаг наличия итогового состояния
+    (1 байт) и значения итогового состояния varint.
+
+Classes:
+    Replay: Содержит данные записи игры, ее сохранение и загрузку
+    в компактном двоичном формате.
+    ReplayRecorder: Содержит запись смен направления по тикам игры.
+
+Functions:
+    get_engine_state: Получает сводку состояния игрового движка.
+    play_replay: Воспроизводит запись на игровом движке без Tkinter.
+    verify_replay: Проверяет, что воспроизведение приводит к записанному итогу.
+
+Imports:
+    json: Для хранения настроек игры.
+    struct: Для упаковки заголовка файла.
+    array: Для подсчета контрольной суммы положения змейки.
+    crc32: Для подсчета контрольной суммы положения змейки.
+
+    GameEngine: Для воспроизведения игры.
+"""
+import json
+import struct
+from array import array
+from zlib import crc32
+
+from engine.game_engine import GameEngine
+
+
+DIRECTIONS = ('Up', 'Down', 'Left', 'Right')
+DIRECTION_CODES = {direction: code for code, direction in enumerate(DIRECTIONS)}
+STATE_KEYS = (
+    'ticks', 'score', 'lives', 'length', 'game over', 'board full', 'checksum'
+    )
+
+
+class Replay:
+    """
+    Содержит данные записи игры, ее сохранение и загрузку в компактном
+    двоичном формате.
+    """
+    MAGIC = b'SNKR'
+    VERSION = 2
+    __HEADER = struct.Struct('<4sBQI')
+    __COUNT = struct.Struct('<I')
+
+    def __init__(
+        self,
+        *,
+        seed: int,
+        settings: dict[str, int | str],
+        events: list[tuple[int, str]],
+        tick_count: int,
+        final_state: dict[str, int] | None = None
+        ) -> None:
+        """
+        Инициализирует запись.
+
+        Args:
+            seed (int): Зерно генератора случайных чисел игры.
+            settings (dict[str, int | str]): Настройки игры.
+            events (list[tuple[int, str]]): Смены направления: номер тика, \
+                перед которым сменилось направление, и новое направление.
+            tick_count (int): Количество выполненных тиков.
+            final_state (dict[str, int] | None): Итоговое состояние игры.
+        """
+        self.__seed = seed
+        self.__settings = settings
+        self.__events = events
+        self.__tick_count = tick_count
+        self.__final_state = final_state
+
+    def get_seed(self) -> int:
+        """
+        Получает зерно генератора случайных чисел игры.
+
+        Returns:
+            int: Зерно генератора.
+        """
+        return self.__seed
+
+    def get_settings(self) -> dict[str, int | str]:
+        """
+        Получает настройки игры.
+
+        Returns:
+            dict[str, int | str]: Настройки игры.
+        """
+        return self.__settings
+
+    def get_events(self) -> list[tuple[int, str]]:
+        """
+        Получает смены направления.
+
+        Returns:
+            list[tuple[int, str]]: Номер тика и новое направление.
+        """
+        return self.__events
+
+    def get_tick_count(self) -> int:
+        """
+        Получает количество выполненных тиков.
+
+        Returns:
+            int: Количество тиков.
+        """
+        return self.__tick_count
+
+    def get_final_state(self) -> dict[str, int] | None:
+        """
+        Получает итоговое состояние игры.
+
+        Returns:
+            dict[str, int] | None: Итоговое состояние или None, если оно \
+            не было записано.
+        """
+        return self.__final_state
+
+    @staticmethod
+    def __write_varint(buffer: bytearray, value: int) -> None:
+        """
+        Дописывает неотрицательное число в формате varint.
+
+        Args:
+            buffer (bytearray): Буфер записи.
+            value (int): Число.
+        """
+        while value >= 0x80:
+            buffer.append(value & 0x7F | 0x80)
+            value >>= 7
+        buffer.append(value)
+
+    @staticmethod
+    def __read_varint(data: bytes, offset: int) -> tuple[int, int]:
+        """
+        Читает число в формате varint.
+
+        Args:
+            data (bytes): Данные.
+            offset (int): Смещение начала числа.
+
+        Raises:
+            ValueError: Если данные закончились раньше числа.
+
+        Returns:
+            tuple[int, int]: Число и смещение после него.
+        """
+        value = 0
+        shift = 0
+        while True:
+            if offset >= len(data):
+                raise ValueError('Запись игры обрезана')
+            byte = data[offset]
+            offset += 1
+            value |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return value, offset
+            shift += 7
+
+    def to_bytes(self) -> bytes:
+        """
+        Упаковывает запись в двоичный формат.
+
+        Returns:
+            bytes: Упакованная запись.
+        """
+        settings = json.dumps(
+            self.__settings, ensure_ascii=False, separators=(',', ':')
+            ).encode('utf-8')
+        buffer = bytearray(self.__HEADER.pack(
+            self.MAGIC, self.VERSION, self.__seed, len(settings)
+            ))
+        buffer += settings
+
+        buffer += self.__COUNT.pack(len(self.__events))
+        previous_tick = 0
+        for tick, direction in self.__events:
+            self.__write_varint(
+                buffer, (tick - previous_tick) << 2 | DIRECTION_CODES[direction]
+                )
+            previous_tick = tick
+
+        self.__write_varint(buffer, self.__tick_count)
+        if self.__final_state is None:
+            buffer.append(0)
+        else:
+            buffer.append(1)
+            for key in STATE_KEYS:
+                self.__write_varint(buffer, self.__final_state[key])
+
+        return bytes(buffer)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'Replay':
+        """
+        Распаковывает запись из двоичного формата.
+
+        Args:
+            data (bytes): Упакованная запись.
+
+        Raises:
+            ValueError: Если данные не являются записью игры \
+            поддерживаемой версии, обрезаны или содержат лишние байты.
+
+        Returns:
+            Replay: Распакованная запись.
+        """
+        if len(data) < cls.__HEADER.size:
+            raise ValueError('Файл не является записью игры')
+        magic, version, seed, settings_length = cls.__HEADER.unpack_from(data)
+        if magic != cls.MAGIC:
+            raise ValueError('Файл не является записью игры')
+        if version != cls.VERSION:
+            raise ValueError(f'Неподдерживаемая версия записи: {version}')
+
+        offset = cls.__HEADER.size
+        if len(data) < offset + settings_length + cls.__COUNT.size:
+            raise ValueError('Запись игры обрезана')
+        settings = json.loads(data[offset:offset + settings_length])
+        offset += settings_length
+
+        (event_count,) = cls.__COUNT.unpack_from(data, offset)
+        offset += cls.__COUNT.size
+        events = []
+        tick = 0
+        for _ in range(event_count):
+            value, offset = cls.__read_varint(data, offset)
+            tick += value >> 2
+            events.append((tick, DIRECTIONS[value & 3]))
+
+        tick_count, offset = cls.__read_varint(data, offset)
+        if offset >= len(data):
+            raise ValueError('Запись игры обрезана')
+        has_final_state = data[offset]
+        offset += 1
+        final_state = None
+        if has_final_state:
+            final_state = {}
+            for key in STATE_KEYS:
+                final_state[key], offset = cls.__read_varint(data, offset)
+        if offset != len(data):
+            raise ValueError(
+                f'Размер записи {len(data)} байт не совпадает с ожидаемым '
+                f'{offset} байт'
+                )
+
+        return cls(
+            seed=seed,
+            settings=settings,
+            events=events,
+            tick_count=tick_count,
+            final_state=final_state
+            )
+
+    def save(self, path: str) -> None:
+        """
+        Сохраняет запись в файл.
+
+        Args:
+            path (str): Путь к файлу.
+        """
+        with open(path, 'wb') as file:
+            file.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: str) -> 'Replay':
+        """
+        Загружает запись из файла.
+
+        Args:
+            path (str): Путь к файлу.
+
+        Returns:
+            Replay: Загруженная запись.
+        """
+        with open(path, 'rb') as file:
+            return cls.from_bytes(file.read())
+
+
+class ReplayRecorder:
+    """Содержит запись смен направления по тикам игры."""
+    def __init__(self, *, seed: int, settings: dict[str, int | str]) -> None:
+        """
+        Инициализирует запись новой игры.
+
+        Args:
+            seed (int): Зерно генератора случайных чисел игры.
+            settings (dict[str, int | str]): Настройки игры.
+        """
+        self.__seed = seed
+        self.__settings = dict(settings)
+        self.__events = []
+        self.__tick_count = 0
+
+    def record_direction(self, direction: str) -> None:
+        """
+        Записывает смену направления перед следующим тиком.
+
+        Args:
+            direction (str): Новое направление.
+        """
+        self.__events.append((self.__tick_count, direction))
+
+    def record_tick(self) -> None:
+        """Записывает выполнение тика."""
+        self.__tick_count += 1
+
+    def finish(self, engine: GameEngine) -> Replay:
+        """
+        Завершает запись, сохраняя итоговое состояние игры.
+
+        Args:
+            engine (GameEngine): Игровой движок записанной игры.
+
+        Returns:
+            Replay: Запись игры.
+        """
+        return Replay(
+            seed=self.__seed,
+            settings=self.__settings,
+            events=list(self.__events),
+            tick_count=self.__tick_count,
+            final_state=get_engine_state(engine, self.__tick_count)
+            )
+
+
+def get_engine_state(engine: GameEngine, ticks: int) -> dict[str, int]:
+    """
+    Получает сводку состояния игрового движка.
+
+    Args:
+        engine (GameEngine): Игровой движок.
+        ticks (int): Количество выполненных тиков.
+
+    Returns:
+        dict[str, int]: Тики, очки, жизни, длина змейки, флаги окончания
+        игры и контрольная сумма положения змейки и еды.
+    """
+    snake_positions = engine.get_snake().get_segment_positions()
+    food_position = engine.get_food().get_position()
+    checksum = crc32(array('i', snake_positions).tobytes())
+    checksum = crc32(
+        struct.pack('<iI', -1 if food_position is None else food_position,
+                    engine.get_move_delay()),
+        checksum
+        )
+
+    return {
+        'ticks': ticks,
+        'score': engine.get_score(),
+        'lives': engine.get_lives(),
+        'length': len(snake_positions),
+        'game over': int(engine.is_game_over()),
+        'board full': int(engine.is_board_full()),
+        'checksum': checksum
+        }
+
+
+def play_replay(replay: Replay) -> dict[str, int]:
+    """
+    Воспроизводит запись на игровом движке без Tkinter с наибольшей скоростью.
+
+    Args:
+        replay (Replay): Запись игры.
+
+    Returns:
+        dict[str, int]: Итоговое состояние воспроизведенной игры.
+    """
+    engine = GameEngine(settings=replay.get_settings(), seed=replay.get_seed())
+    events = replay.get_events()
+    event_index = 0
+    event_count = len(events)
+
+    for tick in range(replay.get_tick_count()):
+        while event_index < event_count and events[event_index][0] == tick:
+            engine.change_direction(events[event_index][1])
+            event_index += 1
+        engine.step()
+
+    return get_engine_state(engine, replay.get_tick_count())
+
+
+def verify_replay(replay: Replay) -> bool:
+    """
+    Проверяет, что воспроизведение приводит к записанному итогу.
+
+    Args:
+        replay (Replay): Запись игры.
+
+    Returns:
+        bool: Совпало ли итоговое состояние. Запись без итогового \
+        состояния считается непроверенной и не проходит проверку.
+    """
+    final_state = replay.get_final_state()
+    return final_state is not None and play_replay(replay) == final_state
@@ -0,0 +1,314 @@
+"""
+Модуль отвечает за снимки состояния игры.
+
+Снимок хранит все, что нужно для продолжения игры: настройки, зерно и
+состояние генератора случайных чисел, очки, жизни, задержку движения,
+направление и сегменты змейки и позицию еды. Сегменты упаковываются
+одним массивом, поэтому сохранение и загрузка занимают O(длины змейки).
+
+Формат файла (порядок байтов little-endian):
+    заголовок: сигнатура b'SNKS', версия (1 байт), зерно (8 байт),
+    очки (4 байта), жизни (1 байт), задержка движения (2 байта),
+    код направления (1 байт), флаги окончания игры и заполнения поля
+    (1 байт), отложенный рост (4 байта), клетка еды (4 байта, -1 если
+    еды нет), длина настроек (4 байта) и количество сегментов (4 байта);
+    настройки в JSON (UTF-8);
+    состояние генератора: 625 чисел по 4 байта, флаг наличия
+    сохраненного значения gauss (1 байт) и само значение (8 байт);
+    сегменты змейки от головы к хвосту по 4 байта.
+
+Classes:
+    Snapshot: Содержит снимок состояния игры, его упаковку в компактный
+    двоичный формат, распаковку и восстановление игрового движка.
+
+Imports:
+    json: Для хранения настроек игры.
+    struct: Для упаковки заголовка и состояния генератора.
+    sys: Для определения порядка байтов платформы.
+    array: Для упаковки сегментов змейки одним массивом.
+
+    GameEngine: Для снятия и восстановления состояния игры.
+"""
+import json
+import struct
+import sys
+from array import array
+
+from engine.game_engine import GameEngine
+
+
+DIRECTIONS = ('Up', 'Down', 'Left', 'Right')
+DIRECTION_CODES = {direction: code for code, direction in enumerate(DIRECTIONS)}
+
+
+class Snapshot:
+    """
+    Содержит снимок состояния игры, его упаковку в компактный двоичный
+    формат, распаковку и восстановление игрового движка.
+    """
+    MAGIC = b'SNKS'
+    VERSION = 1
+    __HEADER = struct.Struct('<4sBQIBHBBIiII')
+    __RNG_STATE = struct.Struct('<625IBd')
+    __GAME_OVER = 1
+    __BOARD_FULL = 2
+
+    def __init__(
+        self,
+        *,
+        settings: dict[str, int | str],
+        state: dict[str, int | bool | str | None],
+        rng_state: tuple,
+        segment_positions: array
+        ) -> None:
+        """
+        Инициализирует снимок.
+
+        Args:
+            settings (dict[str, int | str]): Настройки игры.
+            state (dict[str, int | bool | str | None]): Зерно, очки, жизни, \
+                задержка движения, направление, отложенный рост, клетка еды \
+                и флаги окончания игры и заполнения поля.
+            rng_state (tuple): Состояние генератора случайных чисел.
+            segment_positions (array): Номера клеток сегментов змейки \
+                от головы к хвосту.
+        """
+        self.__settings = settings
+        self.__state = state
+        self.__rng_state = rng_state
+        self.__segment_positions = segment_positions
+
+    @classmethod
+    def from_engine(cls, engine: GameEngine) -> 'Snapshot':
+        """
+        Снимает состояние игрового движка.
+
+        Args:
+            engine (GameEngine): Игровой движок.
+
+        Returns:
+            Snapshot: Снимок состояния.
+        """
+        snake = engine.get_snake()
+        state = {
+            'seed': engine.get_seed(),
+            'score': engine.get_score(),
+            'lives': engine.get_lives(),
+            'move delay': engine.get_move_delay(),
+            'direction': snake.get_direction(),
+            'pending growth': snake.get_pending_growth(),
+            'food': engine.get_food().get_position(),
+            'game over': engine.is_game_over(),
+            'board full': engine.is_board_full()
+            }
+
+        return cls(
+            settings=dict(engine.get_settings()),
+            state=state,
+            rng_state=engine.get_rng_state(),
+            segment_positions=array('i', snake.get_segment_positions())
+            )
+
+    def get_settings(self) -> dict[str, int | str]:
+        """
+        Получает настройки игры.
+
+        Returns:
+            dict[str, int | str]: Настройки игры.
+        """
+        return self.__settings
+
+    def get_state(self) -> dict[str, int | bool | str | None]:
+        """
+        Получает показатели игры без сегментов змейки и состояния генератора.
+
+        Returns:
+            dict[str, int | bool | str | None]: Показатели игры.
+        """
+        return self.__state
+
+    def get_segment_positions(self) -> array:
+        """
+        Получает сегменты змейки.
+
+        Returns:
+            array: Номера клеток сегментов змейки от головы к хвосту.
+        """
+        return self.__segment_positions
+
+    def restore(self, engine: GameEngine | None = None) -> GameEngine:
+        """
+        Восстанавливает игровой движок из снимка.
+
+        Args:
+            engine (GameEngine | None): Движок с теми же настройками поля, \
+                в который восстанавливается состояние. Если не задан, \
+                создается новый.
+
+        Returns:
+            GameEngine: Игровой движок в состоянии снимка.
+        """
+        state = self.__state
+        if engine is None:
+            engine = GameEngine(settings=self.__settings, seed=state['seed'])
+        engine.restore(
+            seed=state['seed'],
+            rng_state=self.__rng_state,
+            score=state['score'],
+            lives=state['lives'],
+            move_delay=state['move delay'],
+            segment_positions=self.__segment_positions,
+            direction=state['direction'],
+            pending_growth=state['pending growth'],
+            food_position=state['food'],
+            game_over=state['game over'],
+            board_full=state['board full']
+            )
+
+        return engine
+
+    def to_bytes(self) -> bytes:
+        """
+        Упаковывает снимок в двоичный формат.
+
+        Returns:
+            bytes: Упакованный снимок.
+        """
+        state = self.__state
+        settings = json.dumps(
+            self.__settings, ensure_ascii=False, separators=(',', ':')
+            ).encode('utf-8')
+        flags = 0
+        if state['game over']:
+            flags |= self.__GAME_OVER
+        if state['board full']:
+            flags |= self.__BOARD_FULL
+        food = state['food']
+
+        buffer = bytearray(self.__HEADER.pack(
+            self.MAGIC,
+            self.VERSION,
+            state['seed'],
+            state['score'],
+            state['lives'],
+            state['move delay'],
+            DIRECTION_CODES[state['direction']],
+            flags,
+            state['pending growth'],
+            -1 if food is None else food,
+            len(settings),
+            len(self.__segment_positions)
+            ))
+        buffer += settings
+
+        _, internal_state, gauss_next = self.__rng_state
+        buffer += self.__RNG_STATE.pack(
+            *internal_state,
+            gauss_next is not None,
+            0.0 if gauss_next is None else gauss_next
+            )
+
+        segment_positions = self.__segment_positions
+        if sys.byteorder == 'big':
+            segment_positions = array('i', segment_positions)
+            segment_positions.byteswap()
+        buffer += segment_positions.tobytes()
+
+        return bytes(buffer)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'Snapshot':
+        """
+        Распаковывает снимок из двоичного формата.
+
+        Args:
+            data (bytes): Упакованный снимок.
+
+        Raises:
+            ValueError: Если данные не являются снимком игры \
+            поддерживаемой версии или их размер не совпадает с \
+            записанными длиной настроек и количеством сегментов.
+
+        Returns:
+            Snapshot: Распакованный снимок.
+        """
+        if len(data) < cls.__HEADER.size:
+            raise ValueError('Файл не является снимком игры')
+        (
+            magic, version, seed, score, lives, move_delay, direction_code,
+            flags, pending_growth, food, settings_length, segment_count
+            ) = cls.__HEADER.unpack_from(data)
+        if magic != cls.MAGIC:
+            raise ValueError('Файл не является снимком игры')
+        if version != cls.VERSION:
+            raise ValueError(f'Неподдерживаемая версия снимка: {version}')
+
+        offset = cls.__HEADER.size
+        expected_size = (
+            offset + settings_length + cls.__RNG_STATE.size
+            + segment_count * array('i').itemsize
+            )
+        if len(data) != expected_size:
+            raise ValueError(
+                f'Размер снимка {len(data)} байт не совпадает с ожидаемым '
+                f'{expected_size} байт'
+                )
+
+        settings = json.loads(data[offset:offset + settings_length])
+        offset += settings_length
+
+        *internal_state, has_gauss, gauss_next = cls.__RNG_STATE.unpack_from(
+            data, offset
+            )
+        offset += cls.__RNG_STATE.size
+        rng_state = (3, tuple(internal_state), gauss_next if has_gauss else None)
+
+        segment_positions = array('i')
+        segment_positions.frombytes(
+            data[offset:offset + segment_count * segment_positions.itemsize]
+            )
+        if sys.byteorder == 'big':
+            segment_positions.byteswap()
+
+        state = {
+            'seed': seed,
+            'score': score,
+            'lives': lives,
+            'move delay': move_delay,
+            'direction': DIRECTIONS[direction_code],
+            'pending growth': pending_growth,
+            'food': None if food < 0 else food,
+            'game over': bool(flags & cls.__GAME_OVER),
+            'board full': bool(flags & cls.__BOARD_FULL)
+            }
+
+        return cls(
+            settings=settings,
+            state=state,
+            rng_state=rng_state,
+            segment_positions=segment_positions
+            )
+
+    def save(self, path: str) -> None:
+        """
+        Сохраняет снимок в файл.
+
+        Args:
+            path (str): Путь к файлу.
+        """
+        with open(path, 'wb') as file:
+            file.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: str) -> 'Snapshot':
+        """
+        Загружает снимок из файла.
+
+        Args:
+            path (str): Путь к файлу.
+
+        Returns:
+            Snapshot: Загруженный снимок.
+        """
+        with open(path, 'rb') as file:
+            return cls.from_bytes(file.read())
@@ -0,0 +1,238 @@
+"""
+Модуль отвечает за планирование игровых тиков с фиксированным шагом.
+
+Тики привязываются к абсолютным моментам времени по time.perf_counter,
+поэтому время выполнения тика и отрисовки не накапливается в задержке
+между тиками.
+
+Classes:
+    LatePolicy: Способ обработки пропущенных тиков при отставании.
+    TickScheduler: Содержит запуск, остановку, паузу тиков по абсолютным
+    дедлайнам и подсчет достигнутой частоты тиков.
+
+Imports:
+    deque: Для хранения времени последних тиков.
+    Enum: Для перечисления способов обработки пропущенных тиков.
+    perf_counter: Для измерения времени.
+    Any, Callable: Для написания аннотаций типов функций обратного вызова.
+"""
+from collections import deque
+from enum import Enum
+from time import perf_counter
+from typing import Any, Callable
+
+
+class LatePolicy(Enum):
+    """Способ обработки пропущенных тиков при отставании."""
+    CATCH_UP = 'catch up'
+    DROP = 'drop'
+
+
+class TickScheduler:
+    """
+    Содержит запуск, остановку, паузу тиков по абсолютным дедлайнам и
+    подсчет достигнутой частоты тиков.
+
+    Планирование таймера выполняется переданными функциями, поэтому
+    планировщик работает как с Tk (after/after_cancel), так и без него.
+    На паузе запланированный вызов отменяется, а время до следующего
+    тика запоминается, поэтому пауза не расходует процессор, а после
+    нее тики не догоняют время паузы.
+    """
+    def __init__(
+        self,
+        *,
+        tick_callback: Callable[[], bool],
+        get_period: Callable[[], int],
+        schedule: Callable[[int, Callable[[], None]], Any],
+        cancel: Callable[[Any], None],
+        frame_callback: Callable[[], None] | None = None,
+        late_policy: LatePolicy = LatePolicy.CATCH_UP,
+        max_catch_up_ticks: int = 5,
+        clock: Callable[[], float] = perf_counter
+        ) -> None:
+        """
+        Инициализирует планировщик.
+
+        Args:
+            tick_callback (Callable[[], bool]): Выполняет один тик. Возвращает \
+                False, если тики нужно прекратить.
+            get_period (Callable[[], int]): Возвращает текущий период тика \
+                в миллисекундах.
+            schedule (Callable[[int, Callable[[], None]], Any]): Планирует \
+                вызов функции через заданное число миллисекунд.
+            cancel (Callable[[Any], None]): Отменяет запланированный вызов.
+            frame_callback (Callable[[], None] | None): Вызывается один раз \
+                после пачки тиков, например для отрисовки.
+            late_policy (LatePolicy): Способ обработки пропущенных тиков.
+            max_catch_up_ticks (int): Наибольшее число тиков, выполняемых \
+                за одно пробуждение при политике CATCH_UP.
+            clock (Callable[[], float]): Источник времени в секундах.
+        """
+        self.__tick_callback = tick_callback
+        self.__frame_callback = frame_callback
+        self.__get_period = get_period
+        self.__schedule = schedule
+        self.__cancel = cancel
+        self.__late_policy = late_policy
+        self.__MAX_CATCH_UP_TICKS = max_catch_up_ticks
+        self.__clock = clock
+
+        self.__after_id = None
+        self.__paused_remaining = None
+        self.__next_deadline = 0.0
+        self.__tick_times = deque(maxlen=64)
+        self.__dropped_ticks = 0
+
+    def get_target_rate(self) -> float:
+        """
+        Получает целевую частоту тиков.
+
+        Returns:
+            float: Целевая частота тиков в секунду.
+        """
+        return 1000 / self.__get_period()
+
+    def get_achieved_rate(self) -> float:
+        """
+        Получает достигнутую частоту тиков по последним тикам.
+
+        Returns:
+            float: Достигнутая частота тиков в секунду.
+        """
+        if len(self.__tick_times) < 2:
+            return 0.0
+        elapsed = self.__tick_times[-1] - self.__tick_times[0]
+        if elapsed <= 0:
+            return 0.0
+        return (len(self.__tick_times) - 1) / elapsed
+
+    def get_progress(self) -> float:
+        """
+        Получает долю текущего периода, прошедшую с последнего тика.
+
+        Returns:
+            float: Доля периода от 0 до 1.
+        """
+        period = self.__get_period() / 1000
+        if self.__paused_remaining is not None:
+            remaining = self.__paused_remaining
+        else:
+            remaining = self.__next_deadline - self.__clock()
+        return min(max(1 - remaining / period, 0.0), 1.0)
+
+    def get_dropped_ticks(self) -> int:
+        """
+        Получает количество пропущенных тиков.
+
+        Returns:
+            int: Количество тиков, которые были пропущены из-за отставания.
+        """
+        return self.__dropped_ticks
+
+    def is_running(self) -> bool:
+        """
+        Проверяет, запланирован ли следующий тик.
+
+        Returns:
+            bool: Запущен ли планировщик.
+        """
+        return self.__after_id is not None
+
+    def is_paused(self) -> bool:
+        """
+        Проверяет, стоит ли планировщик на паузе.
+
+        Returns:
+            bool: На паузе ли планировщик.
+        """
+        return self.__paused_remaining is not None
+
+    def pause(self) -> None:
+        """
+        Ставит тики на паузу: отменяет запланированный вызов и запоминает
+        время, оставшееся до следующего тика.
+        """
+        if self.__after_id is None:
+            return
+        self.__cancel(self.__after_id)
+        self.__after_id = None
+        self.__paused_remaining = max(0.0, self.__next_deadline - self.__clock())
+
+    def resume(self) -> None:
+        """
+        Продолжает тики после паузы. Следующий тик наступает через время,
+        которое оставалось до него в момент паузы.
+        """
+        if self.__paused_remaining is None:
+            return
+        remaining = self.__paused_remaining
+        self.__paused_remaining = None
+        self.__tick_times.clear()
+        self.__next_deadline = self.__clock() + remaining
+        self.__after_id = self.__schedule(round(remaining * 1000), self.__run)
+
+    def start(self, initial_delay: int) -> None:
+        """
+        Запускает тики.
+
+        Args:
+            initial_delay (int): Задержка перед первым тиком в миллисекундах.
+        """
+        self.stop()
+        self.__tick_times.clear()
+        self.__dropped_ticks = 0
+        self.__next_deadline = self.__clock() + initial_delay / 1000
+        self.__after_id = self.__schedule(initial_delay, self.__run)
+
+    def stop(self) -> None:
+        """Останавливает тики и отменяет запланированный вызов."""
+        self.__paused_remaining = None
+        if self.__after_id is not None:
+            self.__cancel(self.__after_id)
+            self.__after_id = None
+
+    def __count_due_ticks(self, now: float) -> int:
+        """
+        Подсчитывает количество тиков, дедлайн которых уже наступил.
+
+        Args:
+            now (float): Текущее время в секундах.
+
+        Returns:
+            int: Количество наступивших тиков.
+        """
+        period = self.__get_period() / 1000
+        return 1 + int((now - self.__next_deadline) / period)
+
+    def __run(self) -> None:
+        """Выполняет наступившие тики и планирует следующее пробуждение."""
+        self.__after_id = None
+        now = self.__clock()
+        due_ticks = max(1, self.__count_due_ticks(now))
+
+        if self.__late_policy is LatePolicy.CATCH_UP:
+            ticks_to_run = min(due_ticks, self.__MAX_CATCH_UP_TICKS)
+        else:
+            ticks_to_run = 1
+        self.__dropped_ticks += due_ticks - ticks_to_run
+
+        running = True
+        for _ in range(ticks_to_run):
+            running = self.__tick_callback()
+            self.__tick_times.append(self.__clock())
+            self.__next_deadline += self.__get_period() / 1000
+            if not running:
+                break
+
+        if self.__frame_callback is not None:
+            self.__frame_callback()
+        if not running:
+            return
+
+        now = self.__clock()
+        if due_ticks > ticks_to_run:
+            self.__next_deadline = now + self.__get_period() / 1000
+
+        delay = max(0, round((self.__next_deadline - now) * 1000))
+        self.__after_id = self.__schedule(delay, self.__run)
@@ -0,0 +1,413 @@
+"""
+Модуль отвечает за одновременную симуляцию множества игр на массивах NumPy.
+
+Правила игры те же, что у GameEngine: столкновение со стеной отнимает
+жизнь и возвращает змейку в начальное положение, еда удлиняет змейку
+и ускоряет ее, столкновение с собой отменяет ход и отнимает жизнь.
+Все игры продвигаются на один тик одним вызовом step без циклов по играм.
+
+Позиции хранятся номерами клеток поля: cell = y * width + x. Направления
+кодируются числами: 0 - вверх, 1 - вниз, 2 - влево, 3 - вправо.
+
+Classes:
+    VectorSnakeEnv: Содержит состояние множества игр и их продвижение
+    на один тик.
+
+Imports:
+    numpy: Для хранения состояния игр и векторных вычислений.
+
+    TickResult: Для флагов событий тика каждой игры.
+    spawn_food_batch: Для пакетного размещения еды.
+"""
+import numpy as np
+
+from engine.game_engine import TickResult
+from canvas_objects.food import spawn_food_batch
+
+
+UP, DOWN, LEFT, RIGHT = range(4)
+NO_ACTION = -1
+
+
+class VectorSnakeEnv:
+    """
+    Содержит состояние множества игр и их продвижение на один тик.
+
+    Тело каждой змейки хранится в кольцевом буфере на все клетки поля:
+    голова лежит в ячейке head_index, хвост - на length - 1 ячеек раньше.
+    Занятость клеток хранится счетчиками, как в Snake, чтобы голова,
+    попавшая на собственное тело, была видна до отмены хода.
+    """
+    def __init__(
+        self,
+        *,
+        game_count: int,
+        settings: dict[str, int | str],
+        seed: int | None = None
+        ) -> None:
+        """
+        Инициализирует игры и расставляет змеек и еду.
+
+        Args:
+            game_count (int): Количество одновременных игр.
+            settings (dict[str, int | str]): Настройки игры, общие для всех игр.
+            seed (int | None): Зерно генератора случайных чисел.
+        """
+        self.__GAME_COUNT = game_count
+        self.__BOARD_WIDTH = settings.get('board width', 30)
+        self.__BOARD_HEIGTH = settings.get('board height', 30)
+        self.__CELL_COUNT = self.__BOARD_WIDTH * self.__BOARD_HEIGTH
+        self.__INITIAL_LIVES = 3
+        self.__INITIAL_MOVE_DELAY = 200 - settings.get('snake speed', 10) * 10
+        self.__DELTAS = np.array(
+            [-self.__BOARD_WIDTH, self.__BOARD_WIDTH, -1, 1], dtype=np.int32
+            )
+        self.__OPPOSITES = np.array([DOWN, UP, RIGHT, LEFT], dtype=np.int8)
+
+        head_x = self.__BOARD_WIDTH // 2
+        head_y = self.__BOARD_HEIGTH // 2
+        self.__INITIAL_LENGTH = min(settings.get('snake length', 3), head_x + 1)
+        self.__INITIAL_HEAD = head_y * self.__BOARD_WIDTH + head_x
+        self.__INITIAL_BODY = np.arange(
+            self.__INITIAL_HEAD - self.__INITIAL_LENGTH + 1,
+            self.__INITIAL_HEAD + 1,
+            dtype=np.int32
+            )
+
+        self.__rng = np.random.default_rng(seed)
+        self.__games = np.arange(game_count)
+
+        self.__body = np.zeros((game_count, self.__CELL_COUNT), dtype=np.int32)
+        self.__occupancy = np.zeros(
+            (game_count, self.__CELL_COUNT), dtype=np.uint8
+            )
+        self.__head_index = np.zeros(game_count, dtype=np.int64)
+        self.__length = np.zeros(game_count, dtype=np.int64)
+        self.__pending_growth = np.zeros(game_count, dtype=np.int64)
+        self.__last_tail = np.zeros(game_count, dtype=np.int64)
+        self.__last_move_grew = np.zeros(game_count, dtype=bool)
+        self.__direction = np.zeros(game_count, dtype=np.int8)
+
+        self.__food = np.full(game_count, -1, dtype=np.int64)
+        self.__score = np.zeros(game_count, dtype=np.int64)
+        self.__lives = np.zeros(game_count, dtype=np.int64)
+        self.__move_delay = np.zeros(game_count, dtype=np.int64)
+        self.__game_over = np.zeros(game_count, dtype=bool)
+        self.__board_full = np.zeros(game_count, dtype=bool)
+
+        self.reset()
+
+    def get_game_count(self) -> int:
+        """
+        Получает количество игр.
+
+        Returns:
+            int: Количество игр.
+        """
+        return self.__GAME_COUNT
+
+    def get_board_size(self) -> tuple[int, int]:
+        """
+        Получает размер игрового поля.
+
+        Returns:
+            tuple[int, int]: Ширина и высота поля в клетках.
+        """
+        return self.__BOARD_WIDTH, self.__BOARD_HEIGTH
+
+    def get_heads(self) -> np.ndarray:
+        """
+        Получает положение голов змеек.
+
+        Returns:
+            ndarray: Номер клетки головы в каждой игре.
+        """
+        return self.__body[self.__games, self.__head_index]
+
+    def get_lengths(self) -> np.ndarray:
+        """
+        Получает длину змеек.
+
+        Returns:
+            ndarray: Длина змейки в каждой игре.
+        """
+        return self.__length
+
+    def get_directions(self) -> np.ndarray:
+        """
+        Получает направления движения змеек.
+
+        Returns:
+            ndarray: Код направления в каждой игре.
+        """
+        return self.__direction
+
+    def get_occupancy(self) -> np.ndarray:
+        """
+        Получает маску занятости клеток змейками.
+
+        Returns:
+            ndarray: Маска формы (игры, клетки), True - клетка занята.
+        """
+        return self.__occupancy > 0
+
+    def get_food(self) -> np.ndarray:
+        """
+        Получает положение еды.
+
+        Returns:
+            ndarray: Номер клетки еды в каждой игре или -1, если еды нет.
+        """
+        return self.__food
+
+    def get_scores(self) -> np.ndarray:
+        """
+        Получает заработанные очки.
+
+        Returns:
+            ndarray: Очки в каждой игре.
+        """
+        return self.__score
+
+    def get_lives(self) -> np.ndarray:
+        """
+        Получает количество жизней.
+
+        Returns:
+            ndarray: Жизни в каждой игре.
+        """
+        return self.__lives
+
+    def get_move_delays(self) -> np.ndarray:
+        """
+        Получает задержки между тиками.
+
+        Returns:
+            ndarray: Задержка в миллисекундах в каждой игре.
+        """
+        return self.__move_delay
+
+    def get_game_over(self) -> np.ndarray:
+        """
+        Получает признаки окончания игр.
+
+        Returns:
+            ndarray: Закончилась ли каждая игра.
+        """
+        return self.__game_over
+
+    def get_board_full(self) -> np.ndarray:
+        """
+        Получает признаки заполнения поля.
+
+        Returns:
+            ndarray: Заполнила ли змейка поле в каждой игре.
+        """
+        return self.__board_full
+
+    def get_segment_positions(self, game: int) -> list[int]:
+        """
+        Получает положение сегментов змейки одной игры.
+
+        Args:
+            game (int): Номер игры.
+
+        Returns:
+            list[int]: Номера клеток сегментов от головы к хвосту.
+        """
+        indexes = (
+            self.__head_index[game] - np.arange(self.__length[game])
+            ) % self.__CELL_COUNT
+        return self.__body[game, indexes].tolist()
+
+    def __reset_snakes(self, games: np.ndarray) -> None:
+        """
+        Возвращает змеек в начальное положение и сбрасывает задержку.
+
+        Args:
+            games (ndarray): Номера игр.
+        """
+        self.__occupancy[games] = 0
+        self.__occupancy[games[:, None], self.__INITIAL_BODY] = 1
+        self.__body[games, :self.__INITIAL_LENGTH] = self.__INITIAL_BODY
+        self.__head_index[games] = self.__INITIAL_LENGTH - 1
+        self.__length[games] = self.__INITIAL_LENGTH
+        self.__pending_growth[games] = 0
+        self.__last_move_grew[games] = False
+        self.__direction[games] = RIGHT
+        self.__move_delay[games] = self.__INITIAL_MOVE_DELAY
+
+    def reset(self, games: np.ndarray | None = None) -> None:
+        """
+        Перезапускает игры.
+
+        Args:
+            games (ndarray | None): Маска или номера перезапускаемых игр. \
+                Если не заданы, перезапускаются все игры.
+        """
+        if games is None:
+            games = self.__games
+        else:
+            games = self.__games[games]
+        if not games.size:
+            return
+
+        self.__score[games] = 0
+        self.__lives[games] = self.__INITIAL_LIVES
+        self.__game_over[games] = False
+        self.__board_full[games] = False
+        self.__reset_snakes(games)
+        self.__food[games] = spawn_food_batch(
+            self.__occupancy[games] > 0, self.__rng
+            )
+
+    def __lose_life(self, games: np.ndarray, results: np.ndarray) -> None:
+        """
+        Отнимает жизнь и возвращает змейку в начало либо заканчивает игру.
+
+        Args:
+            games (ndarray): Номера игр.
+            results (ndarray): Флаги событий тика, дополняемые на месте.
+        """
+        self.__lives[games] -= 1
+        results[games] |= np.uint8(TickResult.LOST_LIFE)
+        alive = self.__lives[games] > 0
+        self.__reset_snakes(games[alive])
+        dead = games[~alive]
+        self.__game_over[dead] = True
+        results[dead] |= np.uint8(TickResult.GAME_OVER)
+
+    def __get_wall_hits(self, heads: np.ndarray) -> np.ndarray:
+        """
+        Находит змеек, которые выйдут за границу поля на следующем ходу.
+
+        Args:
+            heads (ndarray): Номера клеток голов.
+
+        Returns:
+            ndarray: Врежется ли змейка в стену в каждой игре.
+        """
+        head_y, head_x = np.divmod(heads, self.__BOARD_WIDTH)
+        direction = self.__direction
+        return (
+            (direction == UP) & (head_y == 0)
+            | (direction == DOWN) & (head_y == self.__BOARD_HEIGTH - 1)
+            | (direction == LEFT) & (head_x == 0)
+            | (direction == RIGHT) & (head_x == self.__BOARD_WIDTH - 1)
+            )
+
+    def __move(self, games: np.ndarray, heads: np.ndarray) -> None:
+        """
+        Двигает змеек на одну клетку по их направлениям.
+
+        Args:
+            games (ndarray): Номера игр.
+            heads (ndarray): Номера клеток голов этих игр.
+        """
+        new_heads = heads + self.__DELTAS[self.__direction[games]]
+
+        grew = self.__pending_growth[games] > 0
+        self.__last_move_grew[games] = grew
+        growing = games[grew]
+        self.__pending_growth[growing] -= 1
+        self.__length[growing] += 1
+
+        shrinking = games[~grew]
+        tail_index = (
+            self.__head_index[shrinking] - self.__length[shrinking] + 1
+            ) % self.__CELL_COUNT
+        tails = self.__body[shrinking, tail_index]
+        self.__last_tail[shrinking] = tails
+        self.__occupancy[shrinking, tails] -= 1
+
+        head_index = (self.__head_index[games] + 1) % self.__CELL_COUNT
+        self.__head_index[games] = head_index
+        self.__body[games, head_index] = new_heads
+        self.__occupancy[games, new_heads] += 1
+
+    def __eat_food(self, games: np.ndarray, results: np.ndarray) -> None:
+        """
+        Удлиняет змеек, съевших еду, и размещает новую еду.
+
+        Args:
+            games (ndarray): Номера игр, в которых змейка съела еду.
+            results (ndarray): Флаги событий тика, дополняемые на месте.
+        """
+        self.__pending_growth[games] += 1
+        self.__score[games] += 1
+        self.__move_delay[games] = np.maximum(10, self.__move_delay[games] - 2)
+        results[games] |= np.uint8(TickResult.ATE_FOOD)
+
+        occupancy = self.__occupancy[games] > 0
+        free_counts = self.__CELL_COUNT - occupancy.sum(axis=1)
+        full = free_counts <= self.__pending_growth[games]
+
+        full_games = games[full]
+        self.__food[full_games] = -1
+        self.__board_full[full_games] = True
+        self.__game_over[full_games] = True
+        results[full_games] |= np.uint8(
+            TickResult.BOARD_FULL | TickResult.GAME_OVER
+            )
+
+        self.__food[games[~full]] = spawn_food_batch(occupancy[~full], self.__rng)
+
+    def __undo_move(self, games: np.ndarray) -> None:
+        """
+        Возвращает змеек на положение до последнего хода.
+
+        Args:
+            games (ndarray): Номера игр.
+        """
+        heads = self.__body[games, self.__head_index[games]]
+        self.__occupancy[games, heads] -= 1
+        self.__head_index[games] = (self.__head_index[games] - 1) % self.__CELL_COUNT
+
+        grew = self.__last_move_grew[games]
+        growing = games[grew]
+        self.__pending_growth[growing] += 1
+        self.__length[growing] -= 1
+
+        shrinking = games[~grew]
+        self.__occupancy[shrinking, self.__last_tail[shrinking]] += 1
+
+    def step(self, actions: np.ndarray | None = None) -> np.ndarray:
+        """
+        Выполняет один игровой тик во всех играх.
+
+        Args:
+            actions (ndarray | None): Код нового направления для каждой игры \
+                или NO_ACTION, если направление не меняется. Если не заданы, все \
+                змейки продолжают двигаться в текущем направлении.
+
+        Returns:
+            ndarray: Флаги TickResult событий тика в каждой игре.
+        """
+        results = np.zeros(self.__GAME_COUNT, dtype=np.uint8)
+        results[self.__game_over] = TickResult.GAME_OVER
+        active = ~self.__game_over
+
+        if actions is not None:
+            change = active & (actions >= 0)
+            change[change] = actions[change] != self.__OPPOSITES[self.__direction[change]]
+            self.__direction[change] = actions[change]
+
+        heads = self.get_heads()
+        wall_hits = active & self.__get_wall_hits(heads)
+        self.__lose_life(self.__games[wall_hits], results)
+
+        movers = self.__games[active & ~wall_hits]
+        self.__move(movers, heads[movers])
+
+        heads = self.get_heads()
+        active = ~self.__game_over
+        self.__eat_food(self.__games[active & (heads == self.__food)], results)
+
+        active = ~self.__game_over
+        collided = self.__games[active][
+            self.__occupancy[self.__games[active], heads[active]] > 1
+            ]
+        self.__undo_move(collided)
+        self.__lose_life(collided, results)
+
+        return results
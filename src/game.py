@@ -8,11 +8,19 @@ Classes:
 
 imports:
     tkinter: Для инициализации главного окна игры.
+    perf_counter: Для замера времени запуска игры.
+    Path: Для написания аннотации типа аргументов replay_dir, profile_dir, snapshot_path и scores_path класса Game.
     ScreensControl: Для создания игровых экранов.
+    AssetManager: Для загрузки изображений игры.
+    ScoreStore, SCORES_PATH: Для хранения результатов игр между запусками.
 """
 import tkinter as tk
+from pathlib import Path
+from time import perf_counter
 
 from screens.screens_control import ScreensControl
+from assets.asset_manager import AssetManager
+from scores.score_store import ScoreStore, SCORES_PATH
 
 
 class Game:
@@ -23,20 +31,88 @@ class Game:
         root (tk.Tk): Главное окно приложения.
         scr_control (ScreensControl): Управление игровыми экранами.
     """
-    def __init__(self) -> None:
-        """Инициализирует главное окно игры и создает игровые экраны."""
+    def __init__(
+        self,
+        *,
+        started_at: float | None = None,
+        import_time: float = 0.0,
+        replay_dir: Path | None = None,
+        profile_dir: Path | None = None,
+        snapshot_path: Path | None = None,
+        scores_path: Path = SCORES_PATH
+        ) -> None:
+        """
+        Инициализирует главное окно игры и создает игровые экраны.
+
+        Args:
+            started_at (float | None): Момент запуска программы по \
+                time.perf_counter. Если не задан, отсчет идет от создания игры.
+            import_time (float): Время импорта модулей игры в секундах.
+            replay_dir (Path | None): Папка для сохранения записей игр. \
+                Если не задана, записи не сохраняются.
+            profile_dir (Path | None): Папка для сохранения замеров времени \
+                этапов игрового цикла в CSV.
+            snapshot_path (Path | None): Файл снимка состояния игры, \
+                сохраняемого клавишей F5 и загружаемого клавишей F9.
+            scores_path (Path): Файл базы результатов игр.
+        """
+        init_started_at = perf_counter()
+        if started_at is None:
+            started_at = init_started_at
+        self.__started_at = started_at
+        self.__startup_times = {'import': import_time}
+        self.__exit_after_first_frame = False
+
         self.root = tk.Tk()
         self.root.title('Змейка')
         self.root.resizable(False, False)
-        self.root.geometry('620x660')
+        self.root.minsize(620, 660)
 
-        scr_control = ScreensControl(master=self.root, quit_callback=self.quit_)
+        self.__score_store = ScoreStore(path=scores_path)
+        scr_control = ScreensControl(
+            master=self.root,
+            quit_callback=self.quit_,
+            assets=AssetManager(),
+            replay_dir=replay_dir,
+            profile_dir=profile_dir,
+            snapshot_path=snapshot_path,
+            score_store=self.__score_store
+            )
         scr_control.create_screens()
-        
+
+        self.__startup_times['init'] = perf_counter() - init_started_at
+
+    def get_startup_report(self) -> dict[str, float]:
+        """
+        Получает время этапов запуска игры.
+
+        Returns:
+            dict[str, float]: Время импорта модулей, создания окна с
+            экранами и время от запуска программы до первого кадра в
+            миллисекундах. Время первого кадра появляется после его отрисовки.
+        """
+        return {key: value * 1000 for key, value in self.__startup_times.items()}
+
+    def __handle_first_frame(self) -> None:
+        """Запоминает время до первого отрисованного кадра."""
+        self.root.update_idletasks()
+        self.__startup_times['first frame'] = perf_counter() - self.__started_at
+        if self.__exit_after_first_frame:
+            self.quit_()
+
     def quit_(self) -> None:
         """Завершить работу приложения."""
         self.root.quit()
 
-    def run(self) -> None:
-        """Запустить главный цикл обработки событий окна приложения."""
+    def run(self, *, exit_after_first_frame: bool = False) -> None:
+        """
+        Запустить главный цикл обработки событий окна приложения.
+
+        Args:
+            exit_after_first_frame (bool): Завершить работу после первого \
+                кадра, например для замера времени запуска.
+        """
+        self.__exit_after_first_frame = exit_after_first_frame
+        self.root.after_idle(self.__handle_first_frame)
         self.root.mainloop()
+        self.__score_store.close()
@@ -1,20 +1,86 @@
 """
 Главный модуль, предназначен для запуска игры.
 
+С флагом --startup-report игра закрывается после первого кадра и
+выводит время этапов запуска.
+С флагом --record-replays DIR записи законченных игр сохраняются в
+папку DIR и могут быть воспроизведены командой play_replay.py.
+С флагом --profile-dir DIR замеры времени этапов игрового цикла,
+включаемые в игре клавишей F3, сохраняются в CSV в папку DIR.
+С флагом --snapshot FILE клавиша F5 сохраняет состояние игры в файл
+FILE, а F9 продолжает игру из него, в том числе после перезапуска.
+Флаг --scores FILE задает файл базы результатов игр.
+
 Funcions:
     main: Осуществляет запуск игры
 
 Imports:
+    argparse: Для разбора аргументов командной строки.
+    Path: Для путей к папкам записей игр, замеров времени и файлам снимка и результатов.
+    perf_counter: Для замера времени импорта модулей игры.
     Game: Для инициализации и запуска игры.
+    SCORES_PATH: Для файла базы результатов игр по умолчанию.
 """
+import argparse
+from pathlib import Path
+from time import perf_counter
+
+STARTED_AT = perf_counter()
+
 from game import Game
+from scores.score_store import SCORES_PATH
+
+IMPORT_TIME = perf_counter() - STARTED_AT
 
 
 def main() -> None:
     """Главная функция для инициализации и запуска игры."""
+    parser = argparse.ArgumentParser(description='Игра «Змейка».')
+    parser.add_argument(
+        '--startup-report',
+        action='store_true',
+        help='закрыть игру после первого кадра и вывести время запуска'
+        )
+    parser.add_argument(
+        '--record-replays',
+        metavar='DIR',
+        type=Path,
+        help='сохранять записи законченных игр в папку'
+        )
+    parser.add_argument(
+        '--profile-dir',
+        metavar='DIR',
+        type=Path,
+        help='сохранять замеры времени игрового цикла (F3) в папку'
+        )
+    parser.add_argument(
+        '--snapshot',
+        metavar='FILE',
+        type=Path,
+        help='файл снимка игры: F5 сохраняет игру, F9 продолжает ее'
+        )
+    parser.add_argument(
+        '--scores',
+        metavar='FILE',
+        type=Path,
+        default=SCORES_PATH,
+        help=f'файл базы результатов игр (по умолчанию {SCORES_PATH})'
+        )
+    args = parser.parse_args()
+
     try:
-        game = Game()
-        game.run()
+        game = Game(
+            started_at=STARTED_AT,
+            import_time=IMPORT_TIME,
+            replay_dir=args.record_replays,
+            profile_dir=args.profile_dir,
+            snapshot_path=args.snapshot,
+            scores_path=args.scores
+            )
+        game.run(exit_after_first_frame=args.startup_report)
+        if args.startup_report:
+            for stage, milliseconds in game.get_startup_report().items():
+                print(f'{stage}: {milliseconds:.1f} мс')
     except Exception as ex:
         print(ex)
 
@@ -0,0 +1,73 @@
+"""
+Модуль предназначен для воспроизведения записей игр без Tkinter.
+
+Записи воспроизводятся с наибольшей скоростью, итоговое состояние
+сравнивается с записанным:
+
+    python play_replay.py replays/*.snkr
+
+Funcions:
+    parse_args: Разбирает аргументы командной строки.
+    main: Воспроизводит записи и сообщает о расхождениях.
+
+Imports:
+    argparse: Для разбора аргументов командной строки.
+    sys: Для кода завершения при расхождениях.
+    perf_counter: Для измерения скорости воспроизведения.
+
+    Replay, play_replay: Для загрузки и воспроизведения записей.
+"""
+import argparse
+import sys
+from time import perf_counter
+
+from engine.replay import Replay, play_replay
+
+
+def parse_args() -> argparse.Namespace:
+    """
+    Разбирает аргументы командной строки.
+
+    Returns:
+        Namespace: Аргументы командной строки.
+    """
+    parser = argparse.ArgumentParser(
+        description='Воспроизведение и проверка записей игр змейки.'
+        )
+    parser.add_argument('replays', nargs='+', help='файлы записей игр')
+
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Воспроизводит записи и сообщает о расхождениях."""
+    args = parse_args()
+
+    mismatches = 0
+    for path in args.replays:
+        replay = Replay.load(path)
+        start = perf_counter()
+        state = play_replay(replay)
+        elapsed = perf_counter() - start
+
+        expected = replay.get_final_state()
+        if expected is None:
+            verdict = 'нет итога для проверки'
+        elif state == expected:
+            verdict = 'совпадает'
+        else:
+            verdict = f'РАСХОЖДЕНИЕ, ожидалось {expected}'
+            mismatches += 1
+
+        ticks_per_second = state['ticks'] / elapsed if elapsed > 0 else 0.0
+        print(
+            f'{path}: счет {state["score"]}, тиков {state["ticks"]} '
+            f'({ticks_per_second:.0f} тиков/с) — {verdict}'
+            )
+
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+"""
+Модуль предназначен для продолжения сохраненных игр без Tkinter.
+
+Снимок загружается, выводится его состояние, после чего игра может
+быть продолжена агентом автоматической игры. Один снимок можно
+продолжать разными агентами для сравнения:
+
+    python play_snapshot.py snapshot.snks --agent astar --ticks 10000
+
+Funcions:
+    parse_args: Разбирает аргументы командной строки.
+    main: Загружает снимок и продолжает игру агентом.
+
+Imports:
+    argparse: Для разбора аргументов командной строки.
+    perf_counter: Для измерения скорости игры.
+
+    Snapshot: Для загрузки снимка.
+    get_engine_state: Для вывода состояния игры.
+    create_agent: Для создания агента, продолжающего игру.
+"""
+import argparse
+from time import perf_counter
+
+from engine.snapshot import Snapshot
+from engine.replay import get_engine_state
+from agents.registry import create_agent
+
+
+def parse_args() -> argparse.Namespace:
+    """
+    Разбирает аргументы командной строки.
+
+    Returns:
+        Namespace: Аргументы командной строки.
+    """
+    parser = argparse.ArgumentParser(
+        description='Продолжение сохраненных игр змейки агентом.'
+        )
+    parser.add_argument('snapshot', help='файл снимка игры')
+    parser.add_argument(
+        '--agent', default='astar', help='агент, продолжающий игру'
+        )
+    parser.add_argument(
+        '--ticks',
+        type=int,
+        default=0,
+        help='наибольшее количество тиков продолжения (0 — только вывести снимок)'
+        )
+    parser.add_argument(
+        '--seed', type=int, default=None, help='зерно генератора агента'
+        )
+
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Загружает снимок и продолжает игру агентом."""
+    args = parse_args()
+
+    start = perf_counter()
+    engine = Snapshot.load(args.snapshot).restore()
+    elapsed = perf_counter() - start
+    print(f'снимок ({elapsed * 1000:.1f} мс): {get_engine_state(engine, 0)}')
+    if args.ticks <= 0:
+        return
+
+    agent = create_agent(args.agent, seed=args.seed)
+    agent.reset(engine)
+    ticks = 0
+    start = perf_counter()
+    while ticks < args.ticks and not engine.is_game_over():
+        engine.step(agent.choose_direction(engine))
+        ticks += 1
+    elapsed = perf_counter() - start
+
+    ticks_per_second = ticks / elapsed if elapsed > 0 else 0.0
+    print(
+        f'{args.agent}: {get_engine_state(engine, ticks)} '
+        f'({ticks_per_second:.0f} тиков/с)'
+        )
+
+
+if __name__ == '__main__':
+    main()
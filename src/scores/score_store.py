@@ -0,0 +1,214 @@
+"""
+Модуль отвечает за хранение результатов игр между запусками.
+
+Результаты хранятся в базе SQLite в режиме WAL. Все обращения к базе
+выполняются в отдельном потоке, поэтому запись результата и запрос
+лучших результатов не задерживают главный поток Tk: методы хранилища
+сразу возвращают Future, готовность которого можно проверять через after.
+
+Classes:
+    ScoreStore: Содержит запись результатов игр и запрос лучших
+    результатов для настроек игры.
+
+Functions:
+    get_score_key: Получает настройки игры, от которых зависят результаты.
+
+Imports:
+    sqlite3: Для хранения результатов.
+    Future: Для получения результатов запросов из потока базы.
+    datetime: Для времени окончания игры.
+    Path: Для пути к файлу базы.
+    Queue: Для передачи запросов в поток базы.
+    Thread: Для выполнения запросов вне главного потока.
+    Any, Callable: Для написания аннотаций типов запросов.
+"""
+import sqlite3
+from concurrent.futures import Future
+from datetime import datetime
+from pathlib import Path
+from queue import Queue
+from threading import Thread
+from typing import Any, Callable
+
+
+SCORES_PATH = Path.home() / '.snake_scores.sqlite3'
+
+
+def get_score_key(settings: dict[str, int | str]) -> tuple[int, int, int, int]:
+    """
+    Получает настройки игры, от которых зависят результаты: скорость
+    и длину змейки и размер поля. Цвета на результаты не влияют.
+
+    Args:
+        settings (dict[str, int | str]): Настройки игры.
+
+    Returns:
+        tuple[int, int, int, int]: Скорость, длина змейки, ширина и
+        высота поля.
+    """
+    return (
+        settings.get('snake speed', 10),
+        settings.get('snake length', 3),
+        settings.get('board width', 30),
+        settings.get('board height', 30)
+        )
+
+
+class ScoreStore:
+    """
+    Содержит запись результатов игр и запрос лучших результатов для
+    настроек игры.
+
+    Запросы выполняются по очереди в одном потоке со своим соединением
+    с базой, поэтому запрос лучших результатов после записи всегда
+    видит записанный результат.
+    """
+    __SCHEMA = (
+        '''
+        CREATE TABLE IF NOT EXISTS scores (
+            id INTEGER PRIMARY KEY,
+            snake_speed INTEGER NOT NULL,
+            snake_length INTEGER NOT NULL,
+            board_width INTEGER NOT NULL,
+            board_height INTEGER NOT NULL,
+            score INTEGER NOT NULL,
+            played_at TEXT NOT NULL
+            )
+        ''',
+        '''
+        CREATE INDEX IF NOT EXISTS scores_by_settings ON scores (
+            snake_speed, snake_length, board_width, board_height, score DESC
+            )
+        '''
+        )
+
+    def __init__(self, *, path: Path = SCORES_PATH, top_count: int = 5) -> None:
+        """
+        Инициализирует хранилище и запускает поток базы.
+
+        Args:
+            path (Path): Путь к файлу базы.
+            top_count (int): Количество лучших результатов по умолчанию.
+        """
+        self.__PATH = path
+        self.__TOP_COUNT = top_count
+
+        self.__requests = Queue()
+        self.__thread = Thread(target=self.__run, daemon=True)
+        self.__thread.start()
+
+    def __connect(self) -> sqlite3.Connection:
+        """
+        Открывает базу и создает таблицу результатов, если ее нет.
+
+        Returns:
+            Connection: Соединение с базой.
+        """
+        self.__PATH.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.__PATH)
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute('PRAGMA synchronous=NORMAL')
+        with connection:
+            for statement in self.__SCHEMA:
+                connection.execute(statement)
+
+        return connection
+
+    def __run(self) -> None:
+        """Выполняет запросы из очереди до получения запроса остановки."""
+        connection = None
+        while True:
+            request = self.__requests.get()
+            if request is None:
+                break
+
+            function, future = request
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                if connection is None:
+                    connection = self.__connect()
+                future.set_result(function(connection))
+            except Exception as ex:
+                future.set_exception(ex)
+
+        if connection is not None:
+            connection.close()
+
+    def __submit(self, function: Callable[[sqlite3.Connection], Any]) -> Future:
+        """
+        Ставит запрос в очередь потока базы.
+
+        Args:
+            function (Callable[[Connection], Any]): Запрос к базе.
+
+        Returns:
+            Future: Результат запроса.
+        """
+        future = Future()
+        self.__requests.put((function, future))
+
+        return future
+
+    def add_score(self, settings: dict[str, int | str], score: int) -> Future:
+        """
+        Записывает результат игры в фоне.
+
+        Args:
+            settings (dict[str, int | str]): Настройки игры.
+            score (int): Заработанные очки.
+
+        Returns:
+            Future: Завершается после записи результата.
+        """
+        played_at = datetime.now().isoformat(' ', 'seconds')
+        row = (*get_score_key(settings), score, played_at)
+
+        def insert(connection: sqlite3.Connection) -> None:
+            with connection:
+                connection.execute(
+                    'INSERT INTO scores (snake_speed, snake_length, board_width, '
+                    'board_height, score, played_at) VALUES (?, ?, ?, ?, ?, ?)',
+                    row
+                    )
+
+        return self.__submit(insert)
+
+    def get_top_scores(
+        self, settings: dict[str, int | str], count: int | None = None
+        ) -> Future:
+        """
+        Запрашивает в фоне лучшие результаты для настроек игры.
+
+        Args:
+            settings (dict[str, int | str]): Настройки игры.
+            count (int | None): Количество результатов. Если не задано, \
+                используется количество по умолчанию.
+
+        Returns:
+            Future: Список пар из очков и времени окончания игры от
+            лучшего результата к худшему.
+        """
+        if count is None:
+            count = self.__TOP_COUNT
+        parameters = (*get_score_key(settings), count)
+
+        def select(connection: sqlite3.Connection) -> list[tuple[int, str]]:
+            return connection.execute(
+                'SELECT score, played_at FROM scores WHERE snake_speed = ? '
+                'AND snake_length = ? AND board_width = ? AND board_height = ? '
+                'ORDER BY score DESC LIMIT ?',
+                parameters
+                ).fetchall()
+
+        return self.__submit(select)
+
+    def close(self, timeout: float = 5.0) -> None:
+        """
+        Дожидается записи результатов из очереди и останавливает поток базы.
+
+        Args:
+            timeout (float): Наибольшее время ожидания в секундах.
+        """
+        self.__requests.put(None)
+        self.__thread.join(timeout)
@@ -0,0 +1,378 @@
+"""
+Модуль отвечает за инкрементальную отрисовку игровых объектов на холсте.
+
+Вместо удаления и пересоздания всех фигур каждый тик рендерер хранит
+идентификаторы фигур сегментов змейки и еды и меняет только те из них,
+положение которых изменилось.
+
+Classes:
+    CanvasRenderer: Содержит отрисовку змейки и еды по разнице с
+    предыдущим кадром, плавное движение между тиками и подсчет
+    обращений к Tk.
+
+Imports:
+    tkinter: Для написания аннотации типа аргумента canvas класса CanvasRenderer.
+    deque: Для хранения фигур сегментов змейки с быстрым доступом к обоим концам.
+    Sequence: Для написания аннотации типа позиций сегментов змейки.
+    islice: Для получения хвостовых сегментов без копирования всей змейки.
+"""
+import tkinter as tk
+from collections import deque
+from collections.abc import Sequence
+from itertools import islice
+
+
+class CanvasRenderer:
+    """
+    Содержит отрисовку змейки и еды по разнице с предыдущим кадром
+    и подсчет обращений к Tk за кадр.
+    """
+    def __init__(
+        self,
+        *,
+        canvas: tk.Canvas,
+        cell_size: int,
+        board_width: int,
+        snake_color: str,
+        food_color: str = 'red'
+        ) -> None:
+        """
+        Инициализирует рендерер.
+
+        Args:
+            canvas (Canvas): Игровой холст.
+            cell_size (int): Размер клетки в пикселях.
+            board_width (int): Ширина поля в клетках.
+            snake_color (str): Цвет змейки.
+            food_color (str): Цвет еды.
+        """
+        self.__canvas = canvas
+        self.__CELL_SIZE = cell_size
+        self.__BOARD_WIDTH = board_width
+        self.__snake_color = snake_color
+        self.__food_color = food_color
+
+        self.__segment_items = deque()
+        self.__segment_cells = deque()
+        self.__food_item = None
+        self.__food_cell = None
+
+        self.__MAX_SHIFT = 8
+        self.__head_from = None
+        self.__tail_from = None
+        self.__progress = 1.0
+
+        self.__tk_calls = 0
+        self.__frame_tk_calls = 0
+        self.__total_tk_calls = 0
+        self.__frames = 0
+
+    def get_tk_calls_per_frame(self) -> int:
+        """
+        Получает количество обращений к Tk за последний кадр.
+
+        Returns:
+            int: Количество обращений к Tk.
+        """
+        return self.__frame_tk_calls
+
+    def get_average_tk_calls(self) -> float:
+        """
+        Получает среднее количество обращений к Tk за кадр.
+
+        Returns:
+            float: Среднее количество обращений к Tk.
+        """
+        if self.__frames == 0:
+            return 0.0
+        return self.__total_tk_calls / self.__frames
+
+    def __get_coords(
+        self, x: float, y: float
+        ) -> tuple[float, float, float, float]:
+        """
+        Вычисляет координаты фигуры на холсте по координатам поля.
+
+        Args:
+            x (float): Столбец клетки.
+            y (float): Строка клетки.
+
+        Returns:
+            tuple[float, float, float, float]: Координаты левого верхнего и
+            правого нижнего углов в пикселях.
+        """
+        x *= self.__CELL_SIZE
+        y *= self.__CELL_SIZE
+        return x, y, x + self.__CELL_SIZE, y + self.__CELL_SIZE
+
+    def __get_cell_coords(self, cell: int) -> tuple[int, int, int, int]:
+        """
+        Вычисляет координаты фигуры клетки на холсте.
+
+        Args:
+            cell (int): Номер клетки.
+
+        Returns:
+            tuple[int, int, int, int]: Координаты левого верхнего и
+            правого нижнего углов в пикселях.
+        """
+        y, x = divmod(cell, self.__BOARD_WIDTH)
+        return self.__get_coords(x, y)
+
+    def __create_segment(self, cell: int) -> int:
+        """
+        Создает фигуру сегмента змейки.
+
+        Args:
+            cell (int): Номер клетки сегмента.
+
+        Returns:
+            int: Идентификатор фигуры.
+        """
+        self.__tk_calls += 1
+        return self.__canvas.create_rectangle(
+            *self.__get_cell_coords(cell), fill=self.__snake_color
+            )
+
+    def __move_item(self, item: int, cell: int) -> None:
+        """
+        Перемещает фигуру в клетку.
+
+        Args:
+            item (int): Идентификатор фигуры.
+            cell (int): Номер новой клетки фигуры.
+        """
+        self.__tk_calls += 1
+        self.__canvas.coords(item, *self.__get_cell_coords(cell))
+
+    def __delete_item(self, item: int) -> None:
+        """
+        Удаляет фигуру с холста.
+
+        Args:
+            item (int): Идентификатор фигуры.
+        """
+        self.__tk_calls += 1
+        self.__canvas.delete(item)
+
+    def __redraw_snake(self, snake_positions: Sequence[int]) -> None:
+        """
+        Полностью перерисовывает змейку.
+
+        Args:
+            snake_positions (Sequence[int]): Номера клеток сегментов змейки.
+        """
+        for item in self.__segment_items:
+            self.__delete_item(item)
+        self.__segment_items = deque(
+            self.__create_segment(cell) for cell in snake_positions
+            )
+        self.__segment_cells = deque(snake_positions)
+
+    def __find_shift(self, snake_positions: Sequence[int]) -> int:
+        """
+        Находит, на сколько клеток змейка сдвинулась относительно
+        предыдущего кадра.
+
+        Args:
+            snake_positions (Sequence[int]): Номера клеток сегментов змейки.
+
+        Returns:
+            int: Количество клеток сдвига или 0, если змейку нужно
+            перерисовать целиком.
+        """
+        cells = self.__segment_cells
+        length = len(snake_positions)
+        if not cells:
+            return 0
+
+        for shift in range(1, min(self.__MAX_SHIFT, length - 1) + 1):
+            if snake_positions[shift] != cells[0]:
+                continue
+            tail_index = min(length - 1 - shift, len(cells) - 1)
+            if snake_positions[tail_index + shift] == cells[tail_index]:
+                return shift
+            return 0
+        return 0
+
+    def __draw_snake(self, snake_positions: Sequence[int]) -> None:
+        """
+        Отрисовывает змейку, перемещая только изменившиеся сегменты.
+
+        Фигуры, освободившиеся в хвосте, переиспользуются для новых
+        клеток головы.
+
+        Args:
+            snake_positions (Sequence[int]): Номера клеток сегментов змейки.
+        """
+        shift = self.__find_shift(snake_positions)
+        self.__head_from = None
+        self.__tail_from = None
+        if not shift:
+            if len(snake_positions) != len(self.__segment_cells) or \
+                any(a != b for a, b in zip(snake_positions, self.__segment_cells)):
+                self.__redraw_snake(snake_positions)
+            return
+
+        surplus = len(self.__segment_cells) - (len(snake_positions) - shift)
+        free_items = []
+        vacated_cell = None
+        for _ in range(surplus):
+            vacated_cell = self.__segment_cells.pop()
+            free_items.append(self.__segment_items.pop())
+
+        if shift == 1:
+            self.__head_from = self.__segment_cells[0]
+            if surplus == 1:
+                self.__tail_from = vacated_cell
+
+        for index in range(shift - 1, -1, -1):
+            cell = snake_positions[index]
+            if free_items:
+                item = free_items.pop()
+                self.__move_item(item, cell)
+            else:
+                item = self.__create_segment(cell)
+            self.__segment_cells.appendleft(cell)
+            self.__segment_items.appendleft(item)
+
+        for item in free_items:
+            self.__delete_item(item)
+
+        for cell in islice(snake_positions, len(self.__segment_cells), None):
+            self.__segment_cells.append(cell)
+            self.__segment_items.append(self.__create_segment(cell))
+
+    def __move_item_between(
+        self,
+        item: int,
+        from_cell: int,
+        to_cell: int,
+        progress: float
+        ) -> None:
+        """
+        Перемещает фигуру в промежуточное положение между клетками.
+
+        Args:
+            item (int): Идентификатор фигуры.
+            from_cell (int): Клетка, из которой движется фигура.
+            to_cell (int): Клетка, в которую движется фигура.
+            progress (float): Доля пройденного пути от 0 до 1.
+        """
+        from_y, from_x = divmod(from_cell, self.__BOARD_WIDTH)
+        to_y, to_x = divmod(to_cell, self.__BOARD_WIDTH)
+        x = from_x + (to_x - from_x) * progress
+        y = from_y + (to_y - from_y) * progress
+        self.__tk_calls += 1
+        self.__canvas.coords(item, *self.__get_coords(x, y))
+
+    def __draw_interpolated(self, progress: float) -> None:
+        """
+        Сдвигает голову и хвост змейки в промежуточное положение между
+        предыдущим и текущим тиком.
+
+        Args:
+            progress (float): Доля прошедшего тика от 0 до 1.
+        """
+        if self.__head_from is None:
+            return
+
+        progress = min(max(progress, 0.0), 1.0)
+        if progress == self.__progress:
+            return
+        self.__progress = progress
+
+        self.__move_item_between(
+            self.__segment_items[0],
+            self.__head_from,
+            self.__segment_cells[0],
+            progress
+            )
+        if self.__tail_from is not None:
+            self.__move_item_between(
+                self.__segment_items[-1],
+                self.__tail_from,
+                self.__segment_cells[-1],
+                progress
+                )
+
+    def __draw_food(self, food_position: int | None) -> None:
+        """
+        Отрисовывает еду, если она появилась или переместилась.
+
+        Args:
+            food_position (int | None): Номер клетки еды или None, \
+                если еды на поле нет.
+        """
+        if food_position == self.__food_cell:
+            return
+
+        if food_position is None:
+            self.__delete_item(self.__food_item)
+            self.__food_item = None
+            self.__food_cell = None
+            return
+
+        if self.__food_item is None:
+            self.__tk_calls += 1
+            self.__food_item = self.__canvas.create_oval(
+                *self.__get_cell_coords(food_position), fill=self.__food_color
+                )
+        else:
+            self.__move_item(self.__food_item, food_position)
+        self.__food_cell = food_position
+
+    def clear(self) -> None:
+        """Удаляет все фигуры с холста и сбрасывает состояние рендерера."""
+        self.__canvas.delete(tk.ALL)
+        self.__segment_items.clear()
+        self.__segment_cells.clear()
+        self.__food_item = None
+        self.__food_cell = None
+        self.__head_from = None
+        self.__tail_from = None
+
+    def __begin_frame(self) -> None:
+        """Начинает подсчет обращений к Tk для нового кадра."""
+        self.__tk_calls = 0
+
+    def __end_frame(self) -> None:
+        """Завершает подсчет обращений к Tk для кадра."""
+        self.__frame_tk_calls = self.__tk_calls
+        self.__total_tk_calls += self.__tk_calls
+        self.__frames += 1
+
+    def render(
+        self,
+        *,
+        snake_positions: Sequence[int],
+        food_position: int | None,
+        progress: float | None = None
+        ) -> None:
+        """
+        Отрисовывает кадр нового игрового состояния.
+
+        Args:
+            snake_positions (Sequence[int]): Номера клеток сегментов змейки.
+            food_position (int | None): Позиция еды.
+            progress (float | None): Доля прошедшего тика для плавного \
+                движения. Если не задана, сегменты ставятся точно в клетки.
+        """
+        self.__begin_frame()
+        self.__draw_snake(snake_positions)
+        self.__draw_food(food_position)
+        if progress is not None:
+            self.__progress = 1.0
+            self.__draw_interpolated(progress)
+        self.__end_frame()
+
+    def interpolate(self, progress: float) -> None:
+        """
+        Отрисовывает промежуточный кадр между игровыми тиками.
+
+        Args:
+            progress (float): Доля прошедшего тика от 0 до 1.
+        """
+        self.__begin_frame()
+        self.__draw_interpolated(progress)
+        self.__end_frame()
@@ -3,7 +3,7 @@
 
 Classes:
     GameOverScreen: Содержит функционал инициализации экрана проигрыша и создания 
-    его виджетов.
+    его виджетов, а также вывода лучших результатов.
 
 Imports:
     tkinter: Для написания аннотации типа аргумента master класса GameOverScreen.
@@ -40,6 +40,8 @@ class GameOverScreen(Screen):
             master (Tk): Родительское окно.
             buttons (dict[str, Callable[[], None]]): Словарь кнопок с \
                 их названиями и функциями обратного вызова.
+            score (int): Заработанные очки.
+            record (int): Рекорд очков игрока.
         """
         self.master = master
         self.frame = tk.Frame(self.master)
@@ -63,17 +65,47 @@ class GameOverScreen(Screen):
 
     def __create_score(self) -> None:
         """Создает заработанные очки на экране."""
-        score_label = tk.Label(
+        self.__score_label = tk.Label(
             self.frame, text=f'Счет: {self.__score}', font=self.__MAIN_FONT
             )
-        score_label.pack(pady=self.__MAIN_PADY / 2)
+        self.__score_label.pack(pady=self.__MAIN_PADY / 2)
 
     def __create_record(self) -> None:
         """Создает рекорд очков на экране."""
-        record_label = tk.Label(
+        self.__record_label = tk.Label(
             self.frame, text=f'Рекорд: {self.__record}', font=self.__MAIN_FONT
             )
-        record_label.pack(pady=self.__MAIN_PADY)
+        self.__record_label.pack(pady=self.__MAIN_PADY)
+
+    def __create_top_scores(self) -> None:
+        """Создает список лучших результатов на экране."""
+        self.__top_scores_label = tk.Label(
+            self.frame,
+            text='',
+            font=(self.__MAIN_FONT[0], self.__MAIN_FONT[1] * 3 // 4),
+            justify=tk.LEFT
+            )
+        self.__top_scores_label.pack(pady=self.__MAIN_PADY / 2)
+
+    def set_top_scores(self, top_scores: list[tuple[int, str]] | None) -> None:
+        """
+        Выводит лучшие результаты для настроек игры.
+
+        Args:
+            top_scores (list[tuple[int, str]] | None): Очки и время окончания \
+                игры от лучшего результата к худшему или None, пока \
+                результаты загружаются.
+        """
+        if top_scores is None:
+            text = 'Загрузка лучших результатов...'
+        elif not top_scores:
+            text = ''
+        else:
+            lines = ['Лучшие результаты:']
+            for place, (score, played_at) in enumerate(top_scores, start=1):
+                lines.append(f'{place}. {score} — {played_at}')
+            text = '\n'.join(lines)
+        self.__top_scores_label.config(text=text)
 
     def __create_buttons(self) -> None:
         """Создает кнопки на экране."""
@@ -92,4 +124,18 @@ class GameOverScreen(Screen):
         self.__create_game_over()
         self.__create_score()
         self.__create_record()
+        self.__create_top_scores()
         self.__create_buttons()
+
+    def set_result(self, score: int, record: int) -> None:
+        """
+        Обновляет очки и рекорд на уже созданном экране.
+
+        Args:
+            score (int): Заработанные очки.
+            record (int): Рекорд очков игрока.
+        """
+        self.__score = score
+        self.__record = record
+        self.__score_label.config(text=f'Счет: {score}')
+        self.__record_label.config(text=f'Рекорд: {record}')
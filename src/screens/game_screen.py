@@ -3,8 +3,8 @@
 
 Classes:
     GameCanvas: Содержит создание, обновление, постановка на паузу, 
-    перезагрузка игрового холста, управление змейкой, инициализация 
-    игровых объектов, их отрисовка и отработка коллизий.
+    перезагрузка игрового холста, управление змейкой и отрисовку
+    игровых объектов поверх игрового движка.
     StatusBar: Содержит создание, обновление игровых параметров статус бара.
     GameScreen: Содержит функционал инициализации экрана игрового экрана
     и создания его виджетов, а также старта игры, обновления статус бара, 
@@ -15,28 +15,52 @@ Imports:
     tkinter: Для написания аннотации типа аргумента master всех классов.
     Callable: Для написания аннотации типа аргумента buttons всех классов.
     override: Для определения переопределенных методов GameScreen.
-
-    Image, ImageTk: Для загрузки изображения жизней.
+    datetime: Для имени файла записи игры.
+    perf_counter: Для замеров времени этапов игрового цикла.
+    Path: Для написания аннотации типа папки записей игр.
 
     Screen: Является родительским классом класса StartScreen.
-    Snake, Food: Для создания и взаимодействия в классе GameCanvas.
+    AssetManager: Для получения изображения жизней из общего кэша.
+    CanvasRenderer: Для инкрементальной отрисовки игровых объектов.
+    GameEngine, TickResult: Для выполнения игровых правил в классе GameCanvas.
+    TickScheduler, LatePolicy: Для планирования тиков с фиксированным шагом
+    и отдельной от них отрисовки кадров.
+    Replay, ReplayRecorder: Для записи игры.
+    InputQueue: Для буферизации нажатий клавиш между тиками.
+    FrameProfiler: Для скользящих перцентилей времени этапов игрового цикла.
+    Snapshot: Для сохранения и восстановления состояния игры.
+    create_agent: Для создания автопилота, управляющего змейкой.
 """
 import tkinter as tk
+from datetime import datetime
+from pathlib import Path
+from time import perf_counter
 from typing import Callable, override
 
-from PIL import Image, ImageTk
-
 from screens.screen import Screen
-from canvas_objects.snake import Snake
-from canvas_objects.food import Food
+from assets.asset_manager import AssetManager
+from screens.canvas_renderer import CanvasRenderer
+from engine.game_engine import GameEngine, TickResult
+from engine.tick_scheduler import TickScheduler, LatePolicy
+from engine.replay import Replay, ReplayRecorder
+from engine.input_queue import InputQueue
+from engine.frame_profiler import FrameProfiler
+from engine.snapshot import Snapshot
+from agents.registry import create_agent
 
 
 class GameCanvas:
     """
     Содержит функционал игрового процесса: создание, обновление,
     постановка на паузу, перезагрузка игрового холста, управление 
-    змейкой, инициализация игровых объектов, их отрисовка и 
-    отработка коллизий.
+    змейкой и отрисовка игровых объектов. Игровые правила выполняет
+    GameEngine.
+
+    По клавише F3 включается замер времени этапов игрового цикла
+    с выводом перцентилей поверх холста. Пока замер выключен, этапы
+    не замеряются. Если задан файл снимка, клавиша F5 сохраняет в него
+    состояние игры, а F9 продолжает игру из него. Клавиши P и пробел
+    ставят игру на паузу и снимают с нее.
 
     Attributes:
         master (Frame): Родительский экран.
@@ -46,215 +70,517 @@ class GameCanvas:
         *,
         master: tk.Frame,
         update_status_bar_callback: Callable[[int, int], None],
-        game_over_callback: Callable[[int], None],
-        settings: dict[str, int | str]
+        game_over_callback: Callable[[int, dict[str, int | str]], None],
+        settings_changed_callback: Callable[[dict[str, int | str]], None],
+        settings: dict[str, int | str],
+        replay_dir: Path | None = None,
+        profile_dir: Path | None = None,
+        snapshot_path: Path | None = None
         ) -> None:
         """
         Инициализирует игровой холст.
 
         Args:
             master (Frame): Родительский экран.
-            game_over_callback (Callable[[int], None]): Возвращаемая функция проигрыша.
+            game_over_callback (Callable[[int, dict[str, int | str]], None]): \
+                Возвращаемая функция проигрыша, получающая очки и настройки \
+                сыгранной игры.
+            settings_changed_callback (Callable[[dict[str, int | str]], None]): \
+                Возвращаемая функция смены настроек игры при продолжении \
+                игры из снимка.
             settings (dict[str, int | str]): Настройки игры.
+            replay_dir (Path | None): Папка для сохранения записей игр. \
+                Если не задана, записи не сохраняются.
+            profile_dir (Path | None): Папка для сохранения замеров времени \
+                в CSV при проигрыше, если замер включен.
+            snapshot_path (Path | None): Файл снимка состояния игры.
         """
         self.master = master
 
-        self.__CANVAS_WIDTH = 600
-        self.__CANVAS_HEIGTH = 600
-        self.__CELL_SIZE = 20
+        self.__MIN_CELL_SIZE = 2
+        self.__RESERVED_HEIGTH = 160
 
-        self.__score = 0
-        self.__lives = 3
+        self.__REPLAY_DIR = replay_dir
+        self.__recorder = None
+        self.__last_replay = None
+
+        self.__SNAPSHOT_PATH = snapshot_path
+
+        self.__PROFILE_DIR = profile_dir
+        self.__PROFILE_SECTIONS = ('input', 'step', 'status', 'render', 'idle')
+        self.__OVERLAY_PERIOD = 0.25
+        self.__profiler = None
+        self.__overlay_id = None
+        self.__pause_id = None
+        self.__overlay_updated_at = 0.0
+        self.__callback_end = 0.0
 
-        self.__game_over = False
-        self.__after_id = None
+        self.__input_queue = InputQueue()
+        self.__ticks = 0
+        self.__rendered_ticks = 0
+        self.__status_changed = False
 
         self.__update_status_bar_callback = update_status_bar_callback
         self.__game_over_callback = game_over_callback
+        self.__settings_changed_callback = settings_changed_callback
+
+        self.__apply_settings(settings)
+
+    def __apply_settings(self, settings: dict[str, int | str]) -> None:
+        """
+        Создает игровой движок и планировщики по настройкам игры.
+
+        Args:
+            settings (dict[str, int | str]): Настройки игры.
+        """
+        self.__FRAME_PERIOD = 1000 // settings.get('render fps', 60)
 
         self.__settings = settings
-        __snake_speed = self.__settings.get('snake speed', 10) * 10
-        self.__move_delay = 200 - __snake_speed
+        self.__engine = GameEngine(settings=self.__settings)
+        board_width, board_heigth = self.__engine.get_board_size()
+        self.__CELL_SIZE = self.__get_cell_size(board_width, board_heigth)
+        self.__CANVAS_WIDTH = board_width * self.__CELL_SIZE
+        self.__CANVAS_HEIGTH = board_heigth * self.__CELL_SIZE
+        self.__smooth_movement = bool(
+            self.__settings.get('smooth movement', False)
+            )
+        self.__agent = None
+        if self.__settings.get('autopilot'):
+            self.__agent = create_agent(self.__settings['autopilot'])
+        self.__scheduler = TickScheduler(
+            tick_callback=self.__update,
+            frame_callback=self.__handle_ticks_done,
+            get_period=self.__engine.get_move_delay,
+            schedule=self.master.after,
+            cancel=self.master.after_cancel,
+            late_policy=LatePolicy(
+                self.__settings.get('late tick policy', 'catch up')
+                )
+            )
+        self.__render_scheduler = TickScheduler(
+            tick_callback=self.__draw_frame,
+            get_period=self.__get_frame_period,
+            schedule=self.master.after,
+            cancel=self.master.after_cancel,
+            late_policy=LatePolicy.DROP
+            )
+
+    def __get_cell_size(self, board_width: int, board_heigth: int) -> int:
+        """
+        Получает размер клетки из настроек, уменьшенный так, чтобы поле
+        вместе со статус баром помещалось на экране: окно не меняет
+        размер, и не поместившиеся кнопки были бы недоступны.
+
+        Args:
+            board_width (int): Ширина поля в клетках.
+            board_heigth (int): Высота поля в клетках.
+
+        Returns:
+            int: Размер клетки в пикселях.
+        """
+        screen_width = self.master.winfo_screenwidth()
+        screen_heigth = self.master.winfo_screenheight() - self.__RESERVED_HEIGTH
+        fitting_cell_size = min(
+            screen_width // board_width, screen_heigth // board_heigth
+            )
+
+        return max(
+            self.__MIN_CELL_SIZE,
+            min(self.__settings.get('cell size', 20), fitting_cell_size)
+            )
+
+    def __get_frame_period(self) -> int:
+        """
+        Получает период отрисовки кадров.
+
+        Returns:
+            int: Период отрисовки в миллисекундах.
+        """
+        return self.__FRAME_PERIOD
+
+    def get_tick_rates(self) -> tuple[float, float]:
+        """
+        Получает достигнутую и целевую частоту тиков.
+
+        Returns:
+            tuple[float, float]: Достигнутая и целевая частота тиков в секунду.
+        """
+        return (
+            self.__scheduler.get_achieved_rate(),
+            self.__scheduler.get_target_rate()
+            )
 
     def stop(self) -> None:
         """Останавливает игровой холст."""
-        if self.__after_id is not None:
-            self.master.after_cancel(self.__after_id)
-            self.__after_id = None
-        self.__game_over = True
+        self.__scheduler.stop()
+        self.__render_scheduler.stop()
+
+    def is_paused(self) -> bool:
+        """
+        Проверяет, стоит ли игра на паузе.
+
+        Returns:
+            bool: На паузе ли игра.
+        """
+        return self.__scheduler.is_paused()
+
+    def pause(self) -> None:
+        """
+        Ставит игру на паузу: отменяет запланированные тики и отрисовку
+        и замораживает время до следующего тика, поэтому игра на паузе
+        не расходует процессор.
+        """
+        if not self.__scheduler.is_running():
+            return
+
+        self.__scheduler.pause()
+        self.__render_scheduler.pause()
+        self.__pause_id = self.canvas.create_text(
+            self.__CANVAS_WIDTH // 2, self.__CANVAS_HEIGTH // 2,
+            text='Пауза', font=('Arial', 30), fill='gray50'
+            )
+
+    def resume(self) -> None:
+        """Снимает игру с паузы без догоняющих тиков за время паузы."""
+        if not self.__scheduler.is_paused():
+            return
+
+        if self.__pause_id is not None:
+            self.canvas.delete(self.__pause_id)
+            self.__pause_id = None
+        self.__callback_end = perf_counter()
+        self.__scheduler.resume()
+        self.__render_scheduler.resume()
+
+    def toggle_pause(self) -> None:
+        """Ставит игру на паузу или снимает с нее."""
+        if self.is_paused():
+            self.resume()
+        else:
+            self.pause()
 
     def handle_button_presses(self, event: tk.Event) -> None:
         """
-        Обрабатывает нажатие кнопки.
+        Обрабатывает нажатие кнопки, добавляя направление в очередь
+        нажатий, из которой на каждом тике применяется одно направление.
+        При включенном автопилоте и на паузе нажатия не меняют
+        направление змейки.
         
         Returns:
             event (tk.Event): Игровые события.
         """
+        if event.keysym == 'F3':
+            self.toggle_profiling()
+            return
+        if event.keysym in ('F5', 'F9') and self.__SNAPSHOT_PATH is not None:
+            if event.keysym == 'F5':
+                self.get_snapshot().save(self.__SNAPSHOT_PATH)
+            elif self.__SNAPSHOT_PATH.exists():
+                self.restore_snapshot(Snapshot.load(self.__SNAPSHOT_PATH))
+            return
+
         key = event.keysym.lower()
+        if key in ('p', 'space'):
+            self.toggle_pause()
+            return
+        if self.__agent is not None or self.is_paused():
+            return
+
         key_directions = {'w': 'Up', 'a': 'Left', 's': 'Down', 'd': 'Right'}
         if key in key_directions:
-            new_direction = key_directions[key]
-            self.__snake.change_direction(new_direction)
+            self.__input_queue.push(
+                key_directions[key], self.__engine.get_snake().get_direction()
+                )
 
-    def __reset_game_parameters(self) -> None:
-        """Перезапускает игровые параметры и показатели."""
-        self.__score = 0
-        self.__lives = 3
-        self.__game_over = False
-        __snake_speed = self.__settings.get('snake speed', 10) * 10
-        self.__move_delay = 200 - __snake_speed
-        self.__update_status_bar_callback(self.__score, self.__lives)
+    def get_input_counts(self) -> dict[str, int]:
+        """
+        Получает счетчики нажатий, не попавших в очередь в текущей игре.
+
+        Returns:
+            dict[str, int]: Количество отброшенных и объединенных нажатий.
+        """
+        return {
+            'dropped': self.__input_queue.get_dropped_count(),
+            'coalesced': self.__input_queue.get_coalesced_count()
+            }
+
+    def toggle_profiling(self) -> None:
+        """Включает или выключает замер времени этапов игрового цикла."""
+        if self.__profiler is None:
+            self.__profiler = FrameProfiler(sections=self.__PROFILE_SECTIONS)
+            self.__callback_end = perf_counter()
+            return
+
+        self.__profiler = None
+        if self.__overlay_id is not None:
+            self.canvas.delete(self.__overlay_id)
+            self.__overlay_id = None
 
-    def __init_snake(self) -> Snake:
+    def get_profiler(self) -> FrameProfiler | None:
         """
-        Инициализирует змейку.
+        Получает замеры времени этапов игрового цикла.
 
         Returns:
-            Snake: Экземпляр змейки.
-        """
-        head_x = (
-            self.__CANVAS_WIDTH // self.__CELL_SIZE
-            ) // 2 * self.__CELL_SIZE
-        head_y = (
-            self.__CANVAS_HEIGTH // self.__CELL_SIZE
-            ) // 2 * self.__CELL_SIZE
-        initial_length = self.__settings.get('snake length', 3)
-        initial_positions = []
-        for i in range(initial_length):
-            initial_positions.append((head_x - i * self.__CELL_SIZE, head_y))
-
-        initial_direction = 'Right'
-        snake = Snake(
-            segment_positions=initial_positions,
-            initial_direction=initial_direction
-            )
+            FrameProfiler | None: Замеры или None, если замер выключен.
+        """
+        return self.__profiler
+
+    def __draw_overlay(self) -> None:
+        """Выводит перцентили времени этапов поверх холста."""
+        text = self.__profiler.get_report()
+        if self.__overlay_id is None:
+            self.__overlay_id = self.canvas.create_text(
+                4, 4, text=text, anchor=tk.NW,
+                font=('Courier', 10), fill='gray50'
+                )
+        else:
+            self.canvas.itemconfig(self.__overlay_id, text=text)
+            self.canvas.tag_raise(self.__overlay_id)
+
+    def __save_profile(self) -> None:
+        """Сохраняет замеры времени игры в CSV, если задана папка замеров."""
+        if self.__PROFILE_DIR is None:
+            return
 
-        return snake
+        self.__PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+        file_name = f'{datetime.now():%Y%m%d-%H%M%S}-{self.__engine.get_seed()}.csv'
+        self.__profiler.save_csv(self.__PROFILE_DIR / file_name)
 
-    def __init_food(self) -> Food:
+    def get_last_replay(self) -> Replay | None:
         """
-        Инициализирует еду.
+        Получает запись последней законченной игры.
 
         Returns:
-            Food: Экземпляр еды.
+            Replay | None: Запись игры или None, если ни одна игра \
+            еще не закончилась.
         """
-        snake_positions = self.__snake.get_segment_positions()
-        food = Food(
-            canvas_width=self.__CANVAS_WIDTH,
-            canvas_heigth=self.__CANVAS_HEIGTH,
-            cell_size=self.__CELL_SIZE,
-            )
-        food.set_new_position(snake_positions=snake_positions)
-
-        return food
-
-    def __init_game_objects(self) -> None:
-        """Инициализует игровые объекты."""
-        self.__snake = self.__init_snake()
-        self.__food = self.__init_food()
-
-    def __reset_snake(self) -> None:
-        """Пересоздает змейку."""
-        self.__snake = self.__init_snake()
-        __snake_speed = self.__settings.get('snake speed', 10) * 10
-        self.__move_delay = 200 - __snake_speed
-
-    def __handle_collision_with_walls(self) -> None:
-        """Отрабатывает коллизию змейки со стеной."""
-        head_x, head_y = self.__snake.get_head_position()
-        if head_x < 0 or head_y < 0 or \
-            head_x >= self.__CANVAS_WIDTH or head_y >= self.__CANVAS_HEIGTH:
-            self.__lives -= 1
-            self.__update_status_bar_callback(self.__score, self.__lives)
-            if self.__lives > 0:
-                self.__reset_snake()
-            else:
-                previous_snake_position = self.__snake.get_previous_position()
-                self.__snake.return_snake_to_previous_position(
-                    prev_position=previous_snake_position
-                    )
-                self.__game_over_callback(self.__score)
-                self.__game_over = True
-
-    def __handle_collision_with_food(self) -> None:
-        """Отрабатывает коллизию змейки с едой."""
-        head_position = self.__snake.get_head_position()
-        snake_positions = self.__snake.get_segment_positions()
-        food_position = self.__food.get_position()
-        if head_position == food_position:
-            self.__snake.add_segment_to_end()
-            self.__score += 1
-            self.__update_status_bar_callback(self.__score, self.__lives)
-            self.__food.set_new_position(snake_positions=snake_positions)
-            self.__move_delay = max(10, self.__move_delay - 2)
-
-    def __handle_collision_with_self(self) -> None:
-        """Отрабатывает коллизию змейки самой с собой."""
-        snake_positions = self.__snake.get_segment_positions()
-        head_position = self.__snake.get_head_position()
-        if head_position in snake_positions[1:]:
-            self.__lives -= 1
-            self.__update_status_bar_callback(self.__score, self.__lives)
-            if self.__lives > 0:
-                self.__reset_snake()
-            else:
-                previous_snake_position = self.__snake.get_previous_position()
-                self.__snake.return_snake_to_previous_position(
-                    prev_position=previous_snake_position
-                    )
-                self.__game_over_callback(self.__score)
-                self.__game_over = True
-
-    def __handle_collisions(self) -> None:
-        """Отрабатывает коллизии игровых объектов."""
-        self.__handle_collision_with_walls()
-        self.__handle_collision_with_food()
-        self.__handle_collision_with_self()
-
-    def __draw_snake(self) -> None:
-        """Отрисовывает змейку."""
-        snake_positions = self.__snake.get_segment_positions()
-        snake_color = self.__settings.get('snake color', 'green')
-        for x, y in snake_positions:
-            self.canvas.create_rectangle(
-                x,
-                y,
-                x + self.__CELL_SIZE,
-                y + self.__CELL_SIZE,
-                fill=snake_color
+        return self.__last_replay
+
+    def get_snapshot(self) -> Snapshot:
+        """
+        Получает снимок текущего состояния игры.
+
+        Returns:
+            Snapshot: Снимок состояния.
+        """
+        return Snapshot.from_engine(self.__engine)
+
+    def restore_snapshot(self, snapshot: Snapshot) -> None:
+        """
+        Применяет настройки снимка и продолжает игру с его состояния.
+
+        Args:
+            snapshot (Snapshot): Снимок состояния игры.
+        """
+        self.set_settings(snapshot.get_settings())
+        self.__settings_changed_callback(self.__settings)
+        self.start(snapshot=snapshot)
+
+    def __finish_replay(self) -> None:
+        """
+        Завершает запись игры и сохраняет ее, если задана папка записей.
+        Игры, продолженные из снимка, не записываются.
+        """
+        if self.__recorder is None:
+            return
+
+        self.__last_replay = self.__recorder.finish(self.__engine)
+        self.__recorder = None
+        if self.__REPLAY_DIR is None:
+            return
+
+        self.__REPLAY_DIR.mkdir(parents=True, exist_ok=True)
+        file_name = f'{datetime.now():%Y%m%d-%H%M%S}-{self.__engine.get_seed()}.snkr'
+        self.__last_replay.save(self.__REPLAY_DIR / file_name)
+
+    def __reset_game_parameters(self, snapshot: Snapshot | None = None) -> None:
+        """
+        Перезапускает игровые параметры, показатели и объекты.
+
+        Args:
+            snapshot (Snapshot | None): Снимок, с состояния которого \
+                продолжается игра. Если не задан, начинается новая игра.
+        """
+        if snapshot is None:
+            self.__engine.reset()
+            self.__recorder = ReplayRecorder(
+                seed=self.__engine.get_seed(), settings=self.__settings
                 )
+        else:
+            snapshot.restore(self.__engine)
+            self.__recorder = None
+        self.__input_queue.clear()
+        if self.__profiler is not None:
+            self.__profiler.clear()
+        if self.__agent is not None:
+            self.__agent.reset(self.__engine)
+        self.__status_changed = False
+        self.__update_status_bar_callback(
+            self.__engine.get_score(), self.__engine.get_lives()
+            )
+
+    def __update_objects(self, progress: float | None = None) -> None:
+        """
+        Обновляет отрисовку игровых объектов.
 
-    def __draw_food(self) -> None:
-        """Отрисовывает еду."""
-        x, y = self.__food.get_position()
-        self.canvas.create_oval(
-            x, y, x + self.__CELL_SIZE, y + self.__CELL_SIZE, fill='red'
+        Args:
+            progress (float | None): Доля прошедшего тика для плавного движения.
+        """
+        self.__rendered_ticks = self.__ticks
+        self.__renderer.render(
+            snake_positions=self.__engine.get_snake().get_segment_positions(),
+            food_position=self.__engine.get_food().get_position(),
+            progress=progress
             )
 
-    def __update_objects(self) -> None:
-        """Обновляет отрисовку игровых объектов."""
-        self.canvas.delete(tk.ALL)
-        self.__draw_snake()
-        self.__draw_food()
+    def __update(self) -> bool:
+        """
+        Выполняет игровой тик. Перед тиком применяется следующее
+        направление из очереди нажатий или, если включен автопилот,
+        направление, выбранное им.
+
+        Returns:
+            bool: Продолжается ли игра.
+        """
+        profiler = self.__profiler
+        if profiler is not None:
+            started_at = perf_counter()
+            profiler.record('idle', started_at - self.__callback_end)
+
+        if self.__agent is not None:
+            direction = self.__agent.choose_direction(self.__engine)
+        else:
+            direction = self.__input_queue.pop()
+        recorder = self.__recorder
+        if direction is not None:
+            self.__engine.change_direction(direction)
+            if recorder is not None:
+                recorder.record_direction(direction)
+
+        if profiler is not None:
+            step_started_at = perf_counter()
+            profiler.record('input', step_started_at - started_at)
+
+        result = self.__engine.step()
+        if recorder is not None:
+            recorder.record_tick()
+        self.__ticks += 1
+        if result:
+            self.__status_changed = True
+
+        if profiler is not None:
+            self.__callback_end = perf_counter()
+            profiler.record('step', self.__callback_end - step_started_at)
+
+        return not result & TickResult.GAME_OVER
+
+    def __handle_ticks_done(self) -> None:
+        """
+        Обновляет статус бар не чаще одного раза за пачку тиков
+        и обрабатывает проигрыш после выполнения тиков.
+        """
+        profiler = self.__profiler
+        if self.__status_changed:
+            self.__status_changed = False
+            if profiler is not None:
+                started_at = perf_counter()
+            self.__update_status_bar_callback(
+                self.__engine.get_score(), self.__engine.get_lives()
+                )
+            if profiler is not None:
+                self.__callback_end = perf_counter()
+                profiler.record('status', self.__callback_end - started_at)
+
+        if self.__engine.is_game_over():
+            self.__finish_replay()
+            if profiler is not None:
+                self.__save_profile()
+            self.__render_scheduler.stop()
+            self.__update_objects()
+            self.__game_over_callback(
+                self.__engine.get_score(), self.__engine.get_settings()
+                )
 
-    def __update(self) -> None:
-        """Обновляет игровой холст."""
-        if self.__game_over:
-            return
+    def __draw_frame(self) -> bool:
+        """
+        Отрисовывает кадр, если после прошлого кадра прошел тик
+        или включено плавное движение.
 
-        self.__snake.move()
-        self.__handle_collisions()
+        Returns:
+            bool: Продолжать ли отрисовку кадров.
+        """
+        profiler = self.__profiler
+        if profiler is not None:
+            started_at = perf_counter()
+            profiler.record('idle', started_at - self.__callback_end)
+
+        if self.__ticks != self.__rendered_ticks:
+            progress = None
+            if self.__smooth_movement:
+                progress = self.__scheduler.get_progress()
+            self.__update_objects(progress)
+        elif self.__smooth_movement:
+            self.__renderer.interpolate(self.__scheduler.get_progress())
+
+        if profiler is not None:
+            self.__callback_end = perf_counter()
+            profiler.record('render', self.__callback_end - started_at)
+            if self.__callback_end - self.__overlay_updated_at >= self.__OVERLAY_PERIOD:
+                self.__overlay_updated_at = self.__callback_end
+                self.__draw_overlay()
+
+        return True
+
+    def start(self, *, snapshot: Snapshot | None = None) -> None:
+        """
+        Запускает игровой процесс.
+
+        Args:
+            snapshot (Snapshot | None): Снимок, с состояния которого \
+                продолжается игра. Если не задан, начинается новая игра.
+        """
+        self.__reset_game_parameters(snapshot)
+        self.__renderer.clear()
+        self.__overlay_id = None
+        self.__pause_id = None
         self.__update_objects()
-        self.__after_id = self.master.after(
-            self.__move_delay, self.__update
+        self.__scheduler.start(100)
+        self.__render_scheduler.start(self.__FRAME_PERIOD)
+
+    def __create_renderer(self) -> CanvasRenderer:
+        """
+        Создает рендерер игровых объектов.
+
+        Returns:
+            CanvasRenderer: Экземпляр рендерера.
+        """
+        renderer = CanvasRenderer(
+            canvas=self.canvas,
+            cell_size=self.__CELL_SIZE,
+            board_width=self.__engine.get_board_size()[0],
+            snake_color=self.__settings.get('snake color', 'green')
             )
 
-    def start(self) -> None:
-        """Запускает игровой процесс."""
-        self.__reset_game_parameters()
-        self.__init_game_objects()
-        self.__update_objects()
-        self.__after_id = self.master.after(100, self.__update)
+        return renderer
+
+    def set_settings(self, settings: dict[str, int | str]) -> None:
+        """
+        Применяет новые настройки к уже созданному холсту.
+
+        Args:
+            settings (dict[str, int | str]): Настройки игры.
+        """
+        self.stop()
+        self.__renderer.clear()
+        self.__overlay_id = None
+        self.__pause_id = None
+        self.__apply_settings(settings)
+        self.canvas.config(
+            bg=self.__settings.get('canvas color', 'black'),
+            width=self.__CANVAS_WIDTH,
+            height=self.__CANVAS_HEIGTH
+            )
+        self.__renderer = self.__create_renderer()
 
     def create(self) -> None:
         """Создание игрового холста."""
@@ -266,12 +592,17 @@ class GameCanvas:
             )
         self.canvas.pack()
 
+        self.__renderer = self.__create_renderer()
+
 
 class StatusBar:
     """
     Содержит функционал статус бара: создание, обновление 
     игровых параметров.
 
+    Виджеты жизней создаются один раз и только показываются или
+    скрываются, а надписи меняются лишь при изменении их значений.
+
     Attributes:
         master (Tk): Родительский экран.
         frame (Frame): Сам статус бар.
@@ -283,7 +614,8 @@ class StatusBar:
         buttons: dict[str, Callable[[], None]],
         initial_score: int,
         record_score: int,
-        lives: int
+        lives: int,
+        assets: AssetManager
         ) -> None:
         """
         Инициализирует статус бар  и привязывает его к родительскому окну.
@@ -295,6 +627,7 @@ class StatusBar:
             initial_score (int): Стартовое количество игровых очков.
             record_score (int): Рекордное количетсво очков.
             lives (int): Количество жизней.
+            assets (AssetManager): Менеджер изображений.
         """
         self.master = master
         self.frame = tk.Frame(self.master)
@@ -308,42 +641,56 @@ class StatusBar:
         self.__record_score = record_score
         self.__lives = lives
 
-        self.__heart_photo = self.__load_hearts()
+        self.__heart_photo = assets.get_photo('heart.png', (30, 30))
 
-    def __delete_heart(self) -> None:
-        """Удаляет жизнь."""
-        for heart_label in self.heart_labels:
-            heart_label.pack_forget()
-        self.heart_labels.clear()
+        self.__shown_score = None
+        self.__shown_record = None
+        self.__shown_lives = 0
 
-    def __add_hearts(self, lives: int) -> None:
+    def __show_hearts(self, lives: int) -> None:
         """
-        Создает жизни.
+        Показывает нужное количество жизней из заранее созданных виджетов.
 
         Args:
-            lives (int): Количество жизней. 
+            lives (int): Количество жизней.
         """
-        for _ in range(lives):
-            heart_label = tk.Label(self.hearts_frame, image=self.__heart_photo)
+        lives = min(lives, len(self.heart_labels))
+        for heart_label in self.heart_labels[lives:self.__shown_lives]:
+            heart_label.pack_forget()
+        for heart_label in self.heart_labels[self.__shown_lives:lives]:
             heart_label.pack(side=tk.LEFT)
-            self.heart_labels.append(heart_label)
+        self.__shown_lives = lives
 
     def _update_result_label(
         self, score: int, record_score: int, lives: int
         ) -> None:
         """
-        Обновляет виджеты игровых параметров.
+        Обновляет виджеты игровых параметров, значения которых изменились.
         
         Args:
             score (int): Количетсво заработанных очков.
             record_score (int): Рекорд заработанных очков.
             lives (int): Количество жизней.
         """
-        self.__score_label.config(text=f'Счет: {score}  ')
-        self.__record_label.config(text=f'Рекорд: {record_score}  ')
+        if score != self.__shown_score:
+            self.__score_label.config(text=f'Счет: {score}  ')
+            self.__shown_score = score
+        if record_score != self.__shown_record:
+            self.__record_label.config(text=f'Рекорд: {record_score}  ')
+            self.__shown_record = record_score
+        if lives != self.__shown_lives:
+            self.__show_hearts(lives)
 
-        self.__delete_heart()
-        self.__add_hearts(lives)
+    def set_record(self, record_score: int) -> None:
+        """
+        Обновляет только рекорд очков, например после его загрузки.
+
+        Args:
+            record_score (int): Рекорд заработанных очков.
+        """
+        if record_score != self.__shown_record:
+            self.__record_label.config(text=f'Рекорд: {record_score}  ')
+            self.__shown_record = record_score
 
     def __create_score(self, master: tk.Frame) -> None:
         """
@@ -369,19 +716,6 @@ class StatusBar:
             )
         self.__record_label.pack(side=tk.LEFT)
 
-    def __load_hearts(self) -> ImageTk.PhotoImage:
-        """
-        Загружает изображение жизни. 
-        
-        Returns:
-            PhotoImage: Изображение жизни.
-        """
-        image = Image.open(r'./images/heart.png')
-        image = image.resize((30, 30))
-        photo = ImageTk.PhotoImage(image)
-
-        return photo
-
     def __create_hearts(self, master: tk.Frame) -> None:
         """
         Создание виджета жизней.
@@ -392,11 +726,11 @@ class StatusBar:
         self.hearts_frame = tk.Frame(master)
         self.hearts_frame.pack(side=tk.LEFT)
 
-        self.heart_labels = []
-        for _ in range(self.__lives):
-            heart_label = tk.Label(self.hearts_frame, image=self.__heart_photo)
-            heart_label.pack(side=tk.LEFT)
-            self.heart_labels.append(heart_label)
+        self.heart_labels = [
+            tk.Label(self.hearts_frame, image=self.__heart_photo)
+            for _ in range(self.__lives)
+            ]
+        self.__show_hearts(self.__lives)
 
     def __create_changing_parameters(self) -> None:
         """Создание виджета игровых параметров."""
@@ -440,9 +774,14 @@ class GameScreen(Screen):
         *,
         master: tk.Tk,
         buttons: dict[str, Callable[[], None]],
-        game_over_callback: Callable[[int], None],
+        game_over_callback: Callable[[int, int, dict[str, int | str]], None],
+        settings_changed_callback: Callable[[dict[str, int | str]], None],
         record_score: int,
-        settings: dict[str, int | str]
+        settings: dict[str, int | str],
+        assets: AssetManager,
+        replay_dir: Path | None = None,
+        profile_dir: Path | None = None,
+        snapshot_path: Path | None = None
         ) -> None:
         """
         Инициализирует экран и привязывает его к родительскому окну.
@@ -451,27 +790,59 @@ class GameScreen(Screen):
             master (Tk): Родительское окно.
             buttons (dict[str, Callable[[], None]]): Словарь кнопок с \
                 их названиями и функциями обратного вызова.
-            game_over_callback (Callable[[int], None]): Возвращаемая функция проигрыша.
+            game_over_callback (Callable[[int, int, dict[str, int | str]], None]): \
+                Возвращаемая функция проигрыша, получающая очки, рекорд \
+                и настройки сыгранной игры.
+            settings_changed_callback (Callable[[dict[str, int | str]], None]): \
+                Возвращаемая функция смены настроек игры при продолжении \
+                игры из снимка.
             record_score (int): Рекорд очков пользователя.
             settings (dict[str, int | str]): Настройки игры.
+            assets (AssetManager): Менеджер изображений.
+            replay_dir (Path | None): Папка для сохранения записей игр.
+            profile_dir (Path | None): Папка для сохранения замеров времени.
+            snapshot_path (Path | None): Файл снимка состояния игры.
         """
         self.master = master
         self.frame = tk.Frame(self.master)
 
         self.__buttons = buttons
+        self.__replay_dir = replay_dir
+        self.__profile_dir = profile_dir
+        self.__snapshot_path = snapshot_path
 
         self.__record_score = record_score
         self.__settings = settings
+        self.__assets = assets
 
         self.__lives = 3
 
         self.__game_over_callback = game_over_callback
+        self.__settings_changed_callback = settings_changed_callback
 
     def __start_game(self) -> None:
         """Запускает игоровой холст, что приводит к запуску игрового процесса"""
         self.master.bind('<Key>', self.__game_canvas.handle_button_presses)
+        self.master.bind('<Unmap>', self._handle_window_hidden)
+        self.master.bind('<FocusOut>', self._handle_window_hidden)
         self.__game_canvas.start()
 
+    def _handle_window_hidden(self, event: tk.Event) -> None:
+        """
+        Ставит игру на паузу, когда окно свернуто или потеряло фокус,
+        чтобы игра в фоне не расходовала процессор. Игра продолжается
+        клавишей паузы, а не сама, чтобы змейка не разбилась, пока
+        игрок возвращается к окну.
+
+        События дочерних виджетов, например скрытия жизней в статус баре,
+        пропускаются.
+
+        Args:
+            event (tk.Event): Событие окна.
+        """
+        if event.widget is self.master:
+            self.__game_canvas.pause()
+
     def __create_status_bar(self) -> StatusBar:
         """
         Создает статус бар на экране.
@@ -484,7 +855,8 @@ class GameScreen(Screen):
             buttons=self.__buttons,
             initial_score=0,
             record_score=self.__record_score,
-            lives=self.__lives
+            lives=self.__lives,
+            assets=self.__assets
             )
         status_bar.create()
 
@@ -505,22 +877,60 @@ class GameScreen(Screen):
             score, self.__record_score, lives
             )
 
+    def set_record_score(self, record_score: int) -> None:
+        """
+        Обновляет рекорд очков, например после его загрузки из хранилища
+        результатов. Рекорд, уже побитый в текущей игре, не уменьшается.
+
+        Args:
+            record_score (int): Рекорд очков пользователя.
+        """
+        if record_score > self.__record_score:
+            self.__record_score = record_score
+            self.__status_bar.set_record(record_score)
+
+    def reset_record_score(self, record_score: int) -> None:
+        """
+        Заменяет рекорд очков, например после продолжения игры из снимка
+        с другими настройками, для которых рекорд считается отдельно.
+
+        Args:
+            record_score (int): Рекорд очков пользователя.
+        """
+        self.__record_score = record_score
+        self.__status_bar.set_record(record_score)
+
     @override
     def hide(self) -> None:
         """Скрывает экран."""
         self.frame.pack_forget()
         self.__game_canvas.stop()
         self.master.unbind('<Key>')
+        self.master.unbind('<Unmap>')
+        self.master.unbind('<FocusOut>')
 
-    def _handle_game_over(self, score: int) -> None:
+    def _handle_game_over(
+        self, score: int, settings: dict[str, int | str]
+        ) -> None:
         """
         Обрабатывает проигрыш.
 
         Args:
             score (int): Заработанные очки игрока.
+            settings (dict[str, int | str]): Настройки сыгранной игры.
         """
         self.hide()
-        self.__game_over_callback(score, self.__record_score)
+        self.__game_over_callback(score, self.__record_score, settings)
+
+    def _handle_settings_changed(self, settings: dict[str, int | str]) -> None:
+        """
+        Запоминает настройки игры, продолженной из снимка.
+
+        Args:
+            settings (dict[str, int | str]): Настройки игры.
+        """
+        self.__settings = settings
+        self.__settings_changed_callback(settings)
 
     def __create_game_canvas(self) -> GameCanvas:
         """
@@ -533,7 +943,11 @@ class GameScreen(Screen):
             master=self.frame,
             update_status_bar_callback=self._update_status_bar,
             game_over_callback=self._handle_game_over,
-            settings=self.__settings
+            settings_changed_callback=self._handle_settings_changed,
+            settings=self.__settings,
+            replay_dir=self.__replay_dir,
+            profile_dir=self.__profile_dir,
+            snapshot_path=self.__snapshot_path
             )
         game_canvas.create()
 
@@ -544,6 +958,24 @@ class GameScreen(Screen):
         self.__status_bar = self.__create_status_bar()
         self.__game_canvas = self.__create_game_canvas()
 
+    def reset(
+        self, *, record_score: int, settings: dict[str, int | str]
+        ) -> None:
+        """
+        Подготавливает уже созданный экран к новой игре без пересоздания
+        виджетов.
+
+        Args:
+            record_score (int): Рекорд очков пользователя.
+            settings (dict[str, int | str]): Настройки игры.
+        """
+        self.__record_score = record_score
+        self.__settings = settings
+        self.__game_canvas.set_settings(settings)
+        self.__status_bar._update_result_label(
+            0, self.__record_score, self.__lives
+            )
+
     @override
     def show(self) -> None:
         """Показывает экран."""
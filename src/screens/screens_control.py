@@ -1,30 +1,54 @@
 """
 Модуль отвечает за инициализацию, создание экранов и их переключение.
 
+Каждый экран создается при первом переходе на него, а модуль экрана
+импортируется только при его создании, что ускоряет запуск игры. Экраны
+игры и проигрыша затем переиспользуются: перед новой игрой они получают
+новые настройки и очки вместо пересоздания виджетов.
+
 Classes:
     ScreensControl: Содержит инициализацию, создание экранов и переключение между ними.
 
 Imports:
     tkinter: Для написания аннотации типа аргумента master класса ScreensControl.
     Callable: Для написания аннотации типа аргумента quit_callback класса ScreensControl.
+    TYPE_CHECKING: Для импорта классов экранов только для аннотаций типов.
+    Path: Для написания аннотации типа аргументов replay_dir, profile_dir и snapshot_path класса ScreensControl.
+    Future: Для написания аннотации типа результатов запросов к хранилищу результатов.
+    partial: Для передачи настроек игры в обработку загруженного рекорда.
+    Any: Для написания аннотации типа результата запроса к хранилищу результатов.
     
+    Screen: Для написания аннотаций типов созданных экранов.
+    AssetManager: Для написания аннотации типа аргумента assets класса ScreensControl.
+    ScoreStore, get_score_key: Для хранения результатов игр по настройкам игры.
+
+    Классы экранов импортируются в методах их создания:
     StartScreen: Для инициализации, создания стартового экрана и его переключения. 
     SettingsScreen: Для инициализации, создания экрана настроек и его переключения. 
+    ProgramInfoScreen: Для инициализации, создания экрана информации о программе и его переключения. 
     HelpScreen: Для инициализации, создания экрана справки и его переключения. 
     AboutDeveloperScreen: Для инициализации, создания экрана "О разработчике" и его переключения. 
     GameScreen: Для инициализации, создания игрового экрана и его переключения. 
     GameOverScreen: Для инициализации, создания экрана проигрыша и его переключения. 
 """
 import tkinter as tk
-from typing import Callable
+from concurrent.futures import Future
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable
+
+from screens.screen import Screen
+from assets.asset_manager import AssetManager
+from scores.score_store import ScoreStore, get_score_key
 
-from screens.start_screen import StartScreen
-from screens.settings_screen import SettingsScreen
-from screens.program_info_screen import ProgramInfoScreen
-from screens.help_screen import HelpScreen
-from screens.info_about_developer_screen import AboutDeveloperScreen
-from screens.game_screen import GameScreen
-from screens.game_over_screen import GameOverScreen
+if TYPE_CHECKING:
+    from screens.start_screen import StartScreen
+    from screens.settings_screen import SettingsScreen
+    from screens.program_info_screen import ProgramInfoScreen
+    from screens.help_screen import HelpScreen
+    from screens.info_about_developer_screen import AboutDeveloperScreen
+    from screens.game_screen import GameScreen
+    from screens.game_over_screen import GameOverScreen
 
 
 class ScreensControl:
@@ -32,7 +56,15 @@ class ScreensControl:
     Отвечает за создание игровых экранов и переключение между ними.
     """
     def __init__(
-        self, *, master: tk.Tk, quit_callback: Callable[[], None]
+        self,
+        *,
+        master: tk.Tk,
+        quit_callback: Callable[[], None],
+        assets: AssetManager,
+        replay_dir: Path | None = None,
+        profile_dir: Path | None = None,
+        snapshot_path: Path | None = None,
+        score_store: ScoreStore | None = None
         ) -> None:
         """
         Инициализирует экземпляр ScreensControl.
@@ -40,33 +72,92 @@ class ScreensControl:
         Args:
             master (Tk): Главное окно Tkinter.
             quit_callback (Callable[[], None]): Функция обратного вызова для выхода из приложения.
+            assets (AssetManager): Менеджер изображений.
+            replay_dir (Path | None): Папка для сохранения записей игр.
+            profile_dir (Path | None): Папка для сохранения замеров времени.
+            snapshot_path (Path | None): Файл снимка состояния игры.
+            score_store (ScoreStore | None): Хранилище результатов игр. \
+                Если не задано, рекорд хранится только до выхода из игры.
         """
         self.__master = master
+        self.__assets = assets
+        self.__replay_dir = replay_dir
+        self.__profile_dir = profile_dir
+        self.__snapshot_path = snapshot_path
+        self.__score_store = score_store
+        self.__POLL_PERIOD = 50
+        self.__POLL_LIMIT = 100
 
         self.__record_score = 0
+        self.__score_key = None
 
         self.__quit_callback = quit_callback
 
         self.__game_over_screen = None
         self.__game_screen = None
 
+        self.__screens = {}
+        self.__screen_factories = {
+            'start': self.__create_start_screen,
+            'program info': self.__create_program_info_screen,
+            'help': self.__create_help_screen,
+            'about developer': self.__create_info_about_developer_screen,
+            'settings': self.__create_settings_screen
+            }
+
+    def __get_screen(self, name: str) -> Screen:
+        """
+        Получает экран, создавая его при первом обращении.
+
+        Args:
+            name (str): Название экрана.
+
+        Returns:
+            Screen: Экземпляр экрана.
+        """
+        screen = self.__screens.get(name)
+        if screen is None:
+            screen = self.__screen_factories[name]()
+            self.__screens[name] = screen
+
+        return screen
+
+    def __hide_screens(self, *names: str) -> None:
+        """
+        Скрывает уже созданные экраны.
+
+        Args:
+            *names (str): Названия экранов.
+        """
+        for name in names:
+            screen = self.__screens.get(name)
+            if screen is not None:
+                screen.hide()
+
     def _show_info_about_program_screen(self) -> None:
         """Показывает экран информации о программе."""
-        self.__start_screen.hide()
-        self.__program_info_screen.show()
+        self.__hide_screens('start')
+        self.__get_screen('program info').show()
 
     def _show_settings_screen(self) -> None:
-        """Показывает экран настроек."""
-        self.__start_screen.hide()
-        self.__settings_screen.show()
+        """
+        Показывает экран настроек и начинает фоновую загрузку
+        изображений игрового экрана.
+        """
+        self.__hide_screens('start')
+        self.__get_screen('settings').show()
+        if self.__game_screen is None and not self.__assets.is_preloading():
+            self.__assets.preload([('heart.png', (30, 30))])
 
-    def __create_start_screen(self) -> StartScreen:
+    def __create_start_screen(self) -> 'StartScreen':
         """
         Создает стартовый экран.
 
         Returns:
             StartScreen: Экземпляр стартового экрана.
         """
+        from screens.start_screen import StartScreen
+
         start_screen = StartScreen(
             master=self.__master,
             buttons={
@@ -81,13 +172,13 @@ class ScreensControl:
 
     def _show_help_screen(self) -> None:
         """Показывает экран справки."""
-        self.__program_info_screen.hide()
-        self.__help_screen.show()
+        self.__hide_screens('program info')
+        self.__get_screen('help').show()
 
     def _show_info_about_developer_screen(self) -> None:
         """Показывает экран информации о разработчике."""
-        self.__program_info_screen.hide()
-        self.__about_developer_screen.show()
+        self.__hide_screens('program info')
+        self.__get_screen('about developer').show()
 
     def _show_start_screen(self) -> None:
         """Показывает стартовый экран."""
@@ -97,18 +188,18 @@ class ScreensControl:
         if self.__game_over_screen is not None:
             self.__game_over_screen.hide()
 
-        self.__program_info_screen.hide()
-        self.__about_developer_screen.hide()
-        self.__settings_screen.hide()
-        self.__start_screen.show()
+        self.__hide_screens('program info', 'about developer', 'settings')
+        self.__get_screen('start').show()
 
-    def __create_program_info_screen(self) -> ProgramInfoScreen:
+    def __create_program_info_screen(self) -> 'ProgramInfoScreen':
         """
         Создает экран информации о программе.
 
         Returns:
             ProgramInfoScreen: Экземпляр экрана информации о программе.
         """
+        from screens.program_info_screen import ProgramInfoScreen
+
         program_info_screen = ProgramInfoScreen(
             master=self.__master,
             buttons={
@@ -123,17 +214,18 @@ class ScreensControl:
 
     def _show_program_info_screen(self) -> None:
         """Показывает экран информации о программе."""
-        self.__help_screen.hide()
-        self.__about_developer_screen.hide()
-        self.__program_info_screen.show()
+        self.__hide_screens('help', 'about developer')
+        self.__get_screen('program info').show()
 
-    def __create_help_screen(self) -> HelpScreen:
+    def __create_help_screen(self) -> 'HelpScreen':
         """
         Создает экран справки.
 
         Returns:
             HelpScreen: Экземпляр экрана справки.
         """
+        from screens.help_screen import HelpScreen
+
         help_screen = HelpScreen(
             master=self.__master,
             buttons={'Назад': self._show_program_info_screen}
@@ -142,13 +234,15 @@ class ScreensControl:
 
         return help_screen
 
-    def __create_info_about_developer_screen(self) -> AboutDeveloperScreen:
+    def __create_info_about_developer_screen(self) -> 'AboutDeveloperScreen':
         """
         Создает экран информации о разработчике.
 
         Returns:
             AboutDeveloperScreen: Экземпляр экрана информации о разработчике.
         """
+        from screens.info_about_developer_screen import AboutDeveloperScreen
+
         about_developer_screen = AboutDeveloperScreen(
             master=self.__master,
             buttons={'Назад': self._show_program_info_screen}
@@ -162,21 +256,143 @@ class ScreensControl:
         self.__game_over_screen.hide()
         self.__game_screen.show()
 
-    def _show_game_over_screen(self, score: int, record_score: int) -> None:
+    def __poll_future(
+        self,
+        future: Future,
+        callback: Callable[[Any], None],
+        polls_left: int | None = None
+        ) -> None:
+        """
+        Передает результат запроса к хранилищу результатов в функцию
+        обратного вызова, когда он будет готов, не блокируя главный поток.
+        Ошибки хранилища пропускаются: результаты игр не обязательны.
+
+        Готовность проверяется в главном потоке таймером, так как Tk
+        нельзя вызывать из потока хранилища. Таймер работает, только пока
+        запрос не выполнен, и не дольше POLL_LIMIT проверок: экраны меню
+        и проигрыша не планируют таймеров после загрузки результатов.
+
+        Args:
+            future (Future): Результат запроса.
+            callback (Callable[[Any], None]): Функция обратного вызова.
+            polls_left (int | None): Оставшееся количество проверок. \
+                Если не задано, равно POLL_LIMIT.
+        """
+        if polls_left is None:
+            polls_left = self.__POLL_LIMIT
+        if not future.done():
+            if polls_left:
+                self.__master.after(
+                    self.__POLL_PERIOD,
+                    self.__poll_future, future, callback, polls_left - 1
+                    )
+            return
+        if future.exception() is None:
+            callback(future.result())
+
+    def __set_loaded_record(
+        self,
+        score_key: tuple[int, int, int, int],
+        top_scores: list[tuple[int, str]]
+        ) -> None:
+        """
+        Применяет рекорд, загруженный из хранилища результатов. Рекорд,
+        загруженный для уже смененных настроек игры, пропускается.
+
+        Args:
+            score_key (tuple[int, int, int, int]): Настройки игры, для \
+                которых загружен рекорд.
+            top_scores (list[tuple[int, str]]): Лучшие результаты.
         """
-        Показывает экран окончания игры.
+        if score_key != self.__score_key:
+            return
+        if top_scores and top_scores[0][0] > self.__record_score:
+            self.__record_score = top_scores[0][0]
+            self.__game_screen.set_record_score(self.__record_score)
+
+    def __apply_score_key(self, settings: dict[str, int | str]) -> bool:
+        """
+        Запоминает настройки игры, для которых считается рекорд. При их
+        смене рекорд обнуляется до загрузки из хранилища результатов.
+
+        Args:
+            settings (dict[str, int | str]): Настройки игры.
+
+        Returns:
+            bool: Сменились ли настройки, для которых считается рекорд.
+        """
+        score_key = get_score_key(settings)
+        if score_key == self.__score_key:
+            return False
+
+        self.__score_key = score_key
+        self.__record_score = 0
+        return True
+
+    def __load_record(self, settings: dict[str, int | str]) -> None:
+        """
+        Загружает в фоне рекорд для настроек игры.
+
+        Args:
+            settings (dict[str, int | str]): Настройки игры.
+        """
+        if self.__score_store is None:
+            return
+
+        score_key = get_score_key(settings)
+        self.__poll_future(
+            self.__score_store.get_top_scores(settings, 1),
+            partial(self.__set_loaded_record, score_key)
+            )
+
+    def _handle_game_settings_changed(
+        self, settings: dict[str, int | str]
+        ) -> None:
+        """
+        Переключает рекорд на настройки игры, продолженной из снимка.
+
+        Args:
+            settings (dict[str, int | str]): Настройки игры.
+        """
+        if self.__apply_score_key(settings):
+            self.__game_screen.reset_record_score(self.__record_score)
+            self.__load_record(settings)
+
+    def _show_game_over_screen(
+        self, score: int, record_score: int, settings: dict[str, int | str]
+        ) -> None:
+        """
+        Показывает экран окончания игры, записывает результат в фоне
+        и выводит лучшие результаты, когда они загрузятся. Результат
+        записывается для настроек сыгранной игры, а не экрана настроек,
+        так как игра могла быть продолжена из снимка.
 
         Args:
             score (int): Заработанные очки.
             record_score (int): Рекорд очков игрока.
+            settings (dict[str, int | str]): Настройки сыгранной игры.
         """
+        if self.__apply_score_key(settings):
+            record_score = score
+            self.__game_screen.reset_record_score(record_score)
         if record_score > self.__record_score:
             self.__record_score = record_score
 
-        self.__game_over_screen = self.__create_game_over_screen(score)
+        if self.__game_over_screen is None:
+            self.__game_over_screen = self.__create_game_over_screen(score)
+        else:
+            self.__game_over_screen.set_result(score, self.__record_score)
+
+        if self.__score_store is not None and not settings.get('autopilot'):
+            self.__score_store.add_score(settings, score)
+            self.__game_over_screen.set_top_scores(None)
+            self.__poll_future(
+                self.__score_store.get_top_scores(settings),
+                self.__game_over_screen.set_top_scores
+                )
         self.__game_over_screen.show()
 
-    def __create_game_over_screen(self, score: int) -> GameOverScreen:
+    def __create_game_over_screen(self, score: int) -> 'GameOverScreen':
         """
         Создает экран окончания игры.
 
@@ -186,6 +402,8 @@ class ScreensControl:
         Returns:
             GameOverScreen: Экземпляр экрана окончания игры.
         """
+        from screens.game_over_screen import GameOverScreen
+
         game_over_screen = GameOverScreen(
             master=self.__master,
             buttons={
@@ -207,42 +425,66 @@ class ScreensControl:
         Returns:
             dict[str, int | str]: Настройки игры.
         """
-        game_settings = self.__settings_screen.get_settings()
+        game_settings = self.__get_screen('settings').get_settings()
         
         return game_settings
 
-    def __create_game_screen(self) -> GameScreen:
+    def __create_game_screen(self) -> 'GameScreen':
         """
         Создает экран игры с учетом настроек.
 
         Returns:
             GameScreen: Экземпляр экрана игры.
         """
+        from screens.game_screen import GameScreen
+
         game_settings = self.get_game_settings()
         game_screen = GameScreen(
             master=self.__master,
             buttons={'Главное меню': self._show_start_screen},
             game_over_callback=self._show_game_over_screen,
+            settings_changed_callback=self._handle_game_settings_changed,
             record_score=self.__record_score,
-            settings=game_settings
+            settings=game_settings,
+            assets=self.__assets,
+            replay_dir=self.__replay_dir,
+            profile_dir=self.__profile_dir,
+            snapshot_path=self.__snapshot_path
             )
         game_screen.create()
 
         return game_screen
 
     def _show_game_screen(self) -> None:
-        """Показывает экран игры."""
-        self.__settings_screen.hide()
-        self.__game_screen = self.__create_game_screen()
+        """
+        Показывает экран игры. Рекорд для новых настроек игры
+        загружается из хранилища результатов в фоне.
+        """
+        self.__hide_screens('settings')
+        settings = self.get_game_settings()
+        is_new_score_key = self.__apply_score_key(settings)
+
+        if self.__game_screen is None:
+            self.__game_screen = self.__create_game_screen()
+        else:
+            self.__game_screen.reset(
+                record_score=self.__record_score,
+                settings=settings
+                )
         self.__game_screen.show()
 
-    def __create_settings_screen(self) -> SettingsScreen:
+        if is_new_score_key:
+            self.__load_record(settings)
+
+    def __create_settings_screen(self) -> 'SettingsScreen':
         """
         Создает экран настроек.
 
         Returns:
             SettingsScreen: Экземпляр экрана настроек.
         """
+        from screens.settings_screen import SettingsScreen
+
         settings_screen = SettingsScreen(
             master=self.__master,
             buttons={
@@ -253,10 +495,28 @@ class ScreensControl:
         settings_screen.create()
         return settings_screen
 
+    def get_widget_count(self) -> int:
+        """
+        Получает количество виджетов, созданных в главном окне.
+
+        Экраны игры и проигрыша создаются один раз и переиспользуются,
+        поэтому количество не должно расти от игры к игре.
+
+        Returns:
+            int: Количество виджетов во всех экранах.
+        """
+        widget_count = 0
+        widgets = self.__master.winfo_children()
+        while widgets:
+            widget = widgets.pop()
+            widget_count += 1
+            widgets.extend(widget.winfo_children())
+
+        return widget_count
+
     def create_screens(self) -> None:
-        """Создает игровые экраны."""
-        self.__start_screen = self.__create_start_screen()
-        self.__program_info_screen = self.__create_program_info_screen()
-        self.__help_screen = self.__create_help_screen()
-        self.__about_developer_screen = self.__create_info_about_developer_screen()
-        self.__settings_screen = self.__create_settings_screen()
+        """
+        Создает стартовый экран. Остальные экраны создаются при первом
+        переходе на них.
+        """
+        self.__get_screen('start')
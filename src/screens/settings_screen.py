@@ -63,6 +63,12 @@ class SettingsScreen(Screen):
             'Розовый': 'Pink'
             }
 
+        self.__autopilots = {
+            'Выключен': '',
+            'Поиск пути': 'astar',
+            'Гамильтонов цикл': 'hamiltonian'
+            }
+
     def get_settings(self) -> dict[str, int | str]:
         """
         Получает настройки игры.
@@ -74,11 +80,21 @@ class SettingsScreen(Screen):
         snake_length = self.snake_length.get()
         snake_color = self.snake_color.get()
         canvas_color = self.canvas_color.get()
+        smooth_movement = self.smooth_movement.get()
+        board_width = self.board_width.get()
+        board_heigth = self.board_heigth.get()
+        cell_size = self.cell_size.get()
+        autopilot = self.autopilot.get()
         settings = {
             'snake speed': snake_speed,
             'snake length': snake_length,
             'snake color': self.__snake_colours[snake_color],
-            'canvas color': self.__canvas_colours[canvas_color]
+            'canvas color': self.__canvas_colours[canvas_color],
+            'smooth movement': smooth_movement,
+            'board width': board_width,
+            'board height': board_heigth,
+            'cell size': cell_size,
+            'autopilot': self.__autopilots[autopilot]
             }
         return settings
 
@@ -174,6 +190,88 @@ class SettingsScreen(Screen):
         menu = self.master.nametowidget(canvas_color_menu.menuname)
         menu.config(font=self.__FONT)
 
+    def __create_board_size_selection(self) -> None:
+        """Создает выбор размера игрового поля в клетках на экране."""
+        board_size_label = tk.Label(
+            self.frame,
+            text='Размер поля (ширина, высота):',
+            font=self.__FONT,
+            width=self.__WIDGETS_WIDTH * 2
+            )
+        board_size_label.pack(pady=self.__LABELS_PADY)
+
+        board_size_frame = tk.Frame(self.frame)
+        board_size_frame.pack()
+
+        self.board_width = tk.IntVar(value=30)
+        self.board_heigth = tk.IntVar(value=30)
+        for variable in (self.board_width, self.board_heigth):
+            board_size_scale = tk.Scale(
+                board_size_frame,
+                from_=10,
+                to=100,
+                resolution=10,
+                font=self.__FONT,
+                width=self.__WIDGETS_WIDTH,
+                length=self.__SCALES_LENGTH,
+                orient=tk.HORIZONTAL,
+                variable=variable
+                )
+            board_size_scale.pack(side=tk.LEFT)
+
+    def __create_cell_size_selection(self) -> None:
+        """Создает выбор размера клетки в пикселях на экране."""
+        cell_size_label = tk.Label(
+            self.frame,
+            text='Размер клетки:',
+            font=self.__FONT,
+            width=self.__WIDGETS_WIDTH
+            )
+        cell_size_label.pack(pady=self.__LABELS_PADY)
+
+        self.cell_size = tk.IntVar(value=20)
+        cell_size_scale = tk.Scale(
+            self.frame,
+            from_=2,
+            to=40,
+            font=self.__FONT,
+            width=self.__WIDGETS_WIDTH,
+            length=self.__SCALES_LENGTH,
+            orient=tk.HORIZONTAL,
+            variable=self.cell_size
+            )
+        cell_size_scale.pack()
+
+    def __create_smooth_movement_selection(self) -> None:
+        """Создает выбор плавного движения змейки на экране."""
+        self.smooth_movement = tk.BooleanVar(value=False)
+        smooth_movement_checkbutton = tk.Checkbutton(
+            self.frame,
+            text='Плавное движение',
+            font=self.__FONT,
+            variable=self.smooth_movement
+            )
+        smooth_movement_checkbutton.pack(pady=self.__LABELS_PADY)
+
+    def __create_autopilot_selection(self) -> None:
+        """Создает выбор автопилота, управляющего змейкой, на экране."""
+        autopilot_label = tk.Label(
+            self.frame,
+            text='Автопилот:',
+            font=self.__FONT,
+            width=self.__WIDGETS_WIDTH
+            )
+        autopilot_label.pack(pady=self.__LABELS_PADY)
+
+        self.autopilot = tk.StringVar(value='Выключен')
+        autopilot_menu = tk.OptionMenu(
+            self.frame, self.autopilot, *self.__autopilots
+            )
+        autopilot_menu.config(font=self.__FONT, width=self.__WIDGETS_WIDTH)
+        autopilot_menu.pack()
+        menu = self.master.nametowidget(autopilot_menu.menuname)
+        menu.config(font=self.__FONT)
+
     def __create_buttons(self) -> None:
         """Создает кнопки на экране."""
         for key, value in self.__buttons.items():
@@ -192,4 +290,8 @@ class SettingsScreen(Screen):
         self.__create_snake_lenght_selection()
         self.__create_snake_colour_selection()
         self.__create_canvas_colour_selection()
+        self.__create_board_size_selection()
+        self.__create_cell_size_selection()
+        self.__create_smooth_movement_selection()
+        self.__create_autopilot_selection()
         self.__create_buttons()
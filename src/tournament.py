@@ -0,0 +1,194 @@
+"""
+Модуль предназначен для проведения турнира агентов автоматической игры.
+
+Каждый агент играет с каждым зерном при каждом сочетании скорости и
+длины змейки. Игры выполняются в пуле процессов, итоги записываются в
+CSV или JSONL по мере завершения, в конце выводятся распределения очков:
+
+    python tournament.py --agents random greedy --seeds 100 --output results.csv
+
+Агента из стороннего модуля можно указать путем вида 'модуль:Класс'.
+
+Funcions:
+    parse_args: Разбирает аргументы командной строки.
+    open_writer: Открывает потоковую запись итогов игр.
+    print_summary: Выводит сводку распределений очков.
+    main: Проводит турнир, записывает итоги и выводит сводку.
+
+Imports:
+    argparse: Для разбора аргументов командной строки.
+    csv: Для записи итогов в CSV.
+    json: Для записи итогов в JSONL.
+    perf_counter: Для измерения времени турнира.
+    Callable, TextIO: Для написания аннотаций типов функции записи.
+
+    get_agent_names: Для списка встроенных агентов.
+    build_games, run_tournament, summarize_results: Для проведения турнира.
+"""
+import argparse
+import csv
+import json
+from time import perf_counter
+from typing import Callable, TextIO
+
+from agents.registry import get_agent_names
+from tournaments.tournament_runner import (
+    build_games,
+    run_tournament,
+    summarize_results
+    )
+
+
+RESULT_FIELDS = (
+    'agent', 'seed', 'speed', 'length', 'board', 'score', 'lives', 'ticks',
+    'board full', 'finish', 'seconds'
+    )
+
+
+def parse_args() -> argparse.Namespace:
+    """
+    Разбирает аргументы командной строки.
+
+    Returns:
+        Namespace: Аргументы командной строки.
+    """
+    parser = argparse.ArgumentParser(
+        description='Турнир агентов автоматической игры в змейку.'
+        )
+    parser.add_argument(
+        '--agents', nargs='+', default=get_agent_names(),
+        help=f'агенты: {", ".join(get_agent_names())} или модуль:Класс'
+        )
+    parser.add_argument(
+        '--seeds', type=int, default=20, help='количество зерен на сочетание настроек'
+        )
+    parser.add_argument(
+        '--first-seed', type=int, default=0, help='первое зерно'
+        )
+    parser.add_argument(
+        '--speeds', type=int, nargs='+', default=[5, 10, 15],
+        help='скорости змейки от 5 до 15'
+        )
+    parser.add_argument(
+        '--lengths', type=int, nargs='+', default=[3, 9, 15],
+        help='начальные длины змейки от 3 до 15'
+        )
+    parser.add_argument(
+        '--board', type=int, default=30, help='ширина и высота поля в клетках'
+        )
+    parser.add_argument(
+        '--max-ticks', type=int, default=20_000,
+        help='наибольшее количество тиков одной игры'
+        )
+    parser.add_argument(
+        '--workers', type=int, help='количество процессов (по умолчанию по числу ядер)'
+        )
+    parser.add_argument(
+        '--batch-size', type=int, default=16, help='количество игр в одном пакете'
+        )
+    parser.add_argument(
+        '--output', default='tournament_results.csv',
+        help='файл итогов игр, .csv или .jsonl'
+        )
+    parser.add_argument(
+        '--by-settings', action='store_true',
+        help='сводка отдельно по каждому сочетанию скорости и длины'
+        )
+
+    args = parser.parse_args()
+    for speed in args.speeds:
+        if not 5 <= speed <= 15:
+            parser.error(f'скорость должна быть от 5 до 15: {speed}')
+    for length in args.lengths:
+        if not 3 <= length <= 15:
+            parser.error(f'длина должна быть от 3 до 15: {length}')
+
+    return args
+
+
+def open_writer(
+    file: TextIO, path: str
+    ) -> Callable[[list[dict[str, int | float | str]]], None]:
+    """
+    Открывает потоковую запись итогов игр в CSV или JSONL по расширению файла.
+
+    Args:
+        file (TextIO): Открытый файл.
+        path (str): Путь к файлу.
+
+    Returns:
+        Callable[[list[dict[str, int | float | str]]], None]: Функция,
+        дописывающая итоги пакета игр в файл.
+    """
+    if path.endswith('.jsonl'):
+        def write(results: list[dict[str, int | float | str]]) -> None:
+            for result in results:
+                file.write(json.dumps(result, ensure_ascii=False) + '\n')
+            file.flush()
+
+        return write
+
+    writer = csv.DictWriter(file, fieldnames=RESULT_FIELDS)
+    writer.writeheader()
+
+    def write(results: list[dict[str, int | float | str]]) -> None:
+        writer.writerows(results)
+        file.flush()
+
+    return write
+
+
+def print_summary(summary: list[dict[str, int | float | str]]) -> None:
+    """
+    Выводит сводку распределений очков.
+
+    Args:
+        summary (list[dict[str, int | float | str]]): Сводка по группам.
+    """
+    for row in summary:
+        name = row['agent']
+        if 'speed' in row:
+            name += f' speed={row["speed"]} length={row["length"]}'
+        print(
+            f'{name:<40} игр {row["games"]:>6}  среднее {row["mean"]:>8.2f}  '
+            f'min/p10/p50/p90/max {row["min"]}/{row["p10"]:.0f}/{row["p50"]:.0f}/'
+            f'{row["p90"]:.0f}/{row["max"]}  поле заполнено {row["board full"]:.1%}  '
+            f'тиков {row["mean ticks"]:.0f}'
+            )
+
+
+def main() -> None:
+    """Проводит турнир, записывает итоги и выводит сводку."""
+    args = parse_args()
+
+    games = build_games(
+        agents=args.agents,
+        seeds=list(range(args.first_seed, args.first_seed + args.seeds)),
+        speeds=args.speeds,
+        lengths=args.lengths,
+        board_size=args.board,
+        max_ticks=args.max_ticks
+        )
+
+    start = perf_counter()
+    results = []
+    with open(args.output, 'w', encoding='utf-8', newline='') as file:
+        write = open_writer(file, args.output)
+        for batch_results in run_tournament(
+            games, workers=args.workers, batch_size=args.batch_size
+            ):
+            write(batch_results)
+            results.extend(batch_results)
+            print(f'\rСыграно игр: {len(results)}/{len(games)}', end='', flush=True)
+    elapsed = perf_counter() - start
+
+    total_ticks = sum(result['ticks'] for result in results)
+    print(
+        f'\nИтоги записаны в {args.output}. Время {elapsed:.1f} с, '
+        f'{total_ticks / elapsed:.0f} игровых тиков/с'
+        )
+    print_summary(summarize_results(results, by_settings=args.by_settings))
+
+
+if __name__ == '__main__':
+    main()
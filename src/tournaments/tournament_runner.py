@@ -0,0 +1,212 @@
+"""
+Модуль отвечает за проведение турнира агентов на игровом движке без Tkinter.
+
+Игры турнира делятся на пакеты, которые выполняются в пуле процессов.
+Результаты пакетов передаются вызывающему коду по мере завершения, что
+позволяет сразу записывать их в файл.
+
+Functions:
+    build_games: Составляет список игр турнира.
+    play_game: Проводит одну игру агента.
+    play_games: Проводит пакет игр в процессе пула.
+    run_tournament: Проводит турнир в пуле процессов.
+    summarize_results: Сводит распределения очков по агентам и настройкам.
+
+Imports:
+    ProcessPoolExecutor, as_completed: Для параллельного выполнения игр.
+    product: Для перебора сочетаний агентов, настроек и зерен.
+    quantiles: Для процентилей очков.
+    perf_counter: Для измерения времени игры.
+    Iterator: Для написания аннотации типа результата run_tournament.
+
+    GameEngine: Для проведения игр.
+    create_agent: Для создания агентов.
+"""
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import product
+from statistics import quantiles
+from time import perf_counter
+from typing import Iterator
+
+from engine.game_engine import GameEngine
+from agents.registry import create_agent
+
+
+def build_games(
+    *,
+    agents: list[str],
+    seeds: list[int],
+    speeds: list[int],
+    lengths: list[int],
+    board_size: int,
+    max_ticks: int
+    ) -> list[dict[str, int | str]]:
+    """
+    Составляет список игр турнира: каждый агент играет с каждым зерном
+    при каждом сочетании скорости и длины змейки.
+
+    Args:
+        agents (list[str]): Имена агентов.
+        seeds (list[int]): Зерна генератора случайных чисел игр.
+        speeds (list[int]): Скорости змейки.
+        lengths (list[int]): Начальные длины змейки.
+        board_size (int): Ширина и высота поля в клетках.
+        max_ticks (int): Наибольшее количество тиков одной игры.
+
+    Returns:
+        list[dict[str, int | str]]: Описания игр.
+    """
+    return [
+        {
+            'agent': agent,
+            'seed': seed,
+            'speed': speed,
+            'length': length,
+            'board': board_size,
+            'max ticks': max_ticks
+            }
+        for agent, speed, length, seed in product(agents, speeds, lengths, seeds)
+        ]
+
+
+def play_game(game: dict[str, int | str]) -> dict[str, int | float | str]:
+    """
+    Проводит одну игру агента до ее окончания или предела тиков.
+
+    Args:
+        game (dict[str, int | str]): Описание игры.
+
+    Returns:
+        dict[str, int | float | str]: Описание игры и ее итог: очки,
+        жизни, количество тиков, заполнено ли поле, причина окончания
+        и время игры в секундах.
+    """
+    start = perf_counter()
+    engine = GameEngine(
+        settings={
+            'snake speed': game['speed'],
+            'snake length': game['length'],
+            'board width': game['board'],
+            'board height': game['board']
+            },
+        seed=game['seed']
+        )
+    agent = create_agent(game['agent'], seed=game['seed'])
+    agent.reset(engine)
+
+    ticks = 0
+    while not engine.is_game_over() and ticks < game['max ticks']:
+        engine.step(agent.choose_direction(engine))
+        ticks += 1
+
+    return {
+        'agent': game['agent'],
+        'seed': game['seed'],
+        'speed': game['speed'],
+        'length': game['length'],
+        'board': game['board'],
+        'score': engine.get_score(),
+        'lives': engine.get_lives(),
+        'ticks': ticks,
+        'board full': int(engine.is_board_full()),
+        'finish': 'game over' if engine.is_game_over() else 'tick limit',
+        'seconds': round(perf_counter() - start, 6)
+        }
+
+
+def play_games(
+    games: list[dict[str, int | str]]
+    ) -> list[dict[str, int | float | str]]:
+    """
+    Проводит пакет игр в процессе пула.
+
+    Args:
+        games (list[dict[str, int | str]]): Описания игр.
+
+    Returns:
+        list[dict[str, int | float | str]]: Итоги игр.
+    """
+    return [play_game(game) for game in games]
+
+
+def run_tournament(
+    games: list[dict[str, int | str]],
+    *,
+    workers: int | None = None,
+    batch_size: int = 16
+    ) -> Iterator[list[dict[str, int | float | str]]]:
+    """
+    Проводит турнир в пуле процессов.
+
+    Игры отправляются в пул пакетами, чтобы накладные расходы на передачу
+    данных между процессами не съедали выигрыш от параллельности.
+
+    Args:
+        games (list[dict[str, int | str]]): Описания игр.
+        workers (int | None): Количество процессов. Если не задано, \
+            используется количество ядер.
+        batch_size (int): Количество игр в одном пакете.
+
+    Yields:
+        list[dict[str, int | float | str]]: Итоги пакета игр по мере
+        его завершения.
+    """
+    batches = [
+        games[index:index + batch_size]
+        for index in range(0, len(games), batch_size)
+        ]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(play_games, batch) for batch in batches]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def summarize_results(
+    results: list[dict[str, int | float | str]], *, by_settings: bool = False
+    ) -> list[dict[str, int | float | str]]:
+    """
+    Сводит распределения очков по агентам.
+
+    Args:
+        results (list[dict[str, int | float | str]]): Итоги игр.
+        by_settings (bool): Сводить отдельно по каждому сочетанию \
+            скорости и длины змейки.
+
+    Returns:
+        list[dict[str, int | float | str]]: Для каждой группы количество
+        игр, среднее, минимум, 10-й, 50-й, 90-й процентили и максимум очков,
+        доля игр с заполненным полем и среднее количество тиков.
+    """
+    groups = {}
+    for result in results:
+        key = (result['agent'],)
+        if by_settings:
+            key += (result['speed'], result['length'])
+        groups.setdefault(key, []).append(result)
+
+    summary = []
+    for key, group in sorted(groups.items()):
+        scores = sorted(result['score'] for result in group)
+        if len(scores) > 1:
+            deciles = quantiles(scores, n=10, method='inclusive')
+            p10, p50, p90 = deciles[0], deciles[4], deciles[8]
+        else:
+            p10 = p50 = p90 = scores[0]
+
+        row = {'agent': key[0]}
+        if by_settings:
+            row['speed'], row['length'] = key[1], key[2]
+        row.update({
+            'games': len(group),
+            'mean': sum(scores) / len(scores),
+            'min': scores[0],
+            'p10': p10,
+            'p50': p50,
+            'p90': p90,
+            'max': scores[-1],
+            'board full': sum(result['board full'] for result in group) / len(group),
+            'mean ticks': sum(result['ticks'] for result in group) / len(group)
+            })
+        summary.append(row)
+
+    return summary
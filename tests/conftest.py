@@ -0,0 +1,11 @@
+"""
+Общие настройки тестов.
+
+Модули игры импортируются от папки src, как при запуске из нее,
+поэтому папка добавляется в пути поиска модулей.
+"""
+import sys
+from pathlib import Path
+
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
@@ -0,0 +1,49 @@
+"""
+Тесты агентов автоматической игры.
+"""
+import pytest
+
+from agents.registry import create_agent
+from engine.game_engine import GameEngine
+
+
+def play(
+    agent_name: str, *, width: int, height: int, seed: int, max_ticks: int
+    ) -> GameEngine:
+    """Играет агентом до окончания игры или заданного количества тиков."""
+    engine = GameEngine(
+        settings={'board width': width, 'board height': height}, seed=seed
+        )
+    agent = create_agent(agent_name, seed=seed)
+    agent.reset(engine)
+    for _ in range(max_ticks):
+        if engine.is_game_over():
+            break
+        engine.step(agent.choose_direction(engine))
+
+    return engine
+
+
+@pytest.mark.parametrize('seed', range(4))
+def test_astar_does_not_circle_forever(seed: int) -> None:
+    engine = play('astar', width=12, height=12, seed=seed, max_ticks=30_000)
+
+    assert engine.is_game_over()
+    assert engine.get_score() >= 100
+
+
+def test_hamiltonian_fills_even_board() -> None:
+    engine = play('hamiltonian', width=12, height=10, seed=0, max_ticks=100_000)
+
+    assert engine.is_board_full()
+
+
+@pytest.mark.parametrize('board_size', [(11, 11), (9, 7)])
+def test_hamiltonian_eats_on_odd_board(board_size: tuple[int, int]) -> None:
+    width, height = board_size
+    engine = play(
+        'hamiltonian', width=width, height=height, seed=0, max_ticks=100_000
+        )
+
+    assert engine.is_game_over()
+    assert engine.get_score() >= 50
@@ -0,0 +1,70 @@
+"""
+Тесты учета свободных клеток поля.
+"""
+from random import Random
+
+import pytest
+
+from canvas_objects.free_cells import FreeCells
+
+
+def test_take_and_release_update_count() -> None:
+    free_cells = FreeCells(cell_count=10)
+
+    free_cells.take(3)
+    free_cells.take(3)
+    free_cells.take(7)
+
+    assert free_cells.get_cell_count() == 10
+    assert free_cells.get_free_count() == 8
+    assert not free_cells.is_free(3)
+    assert free_cells.is_free(4)
+
+    free_cells.release(3)
+    free_cells.release(3)
+
+    assert free_cells.get_free_count() == 9
+    assert free_cells.is_free(3)
+
+
+def test_release_all_frees_every_cell() -> None:
+    free_cells = FreeCells(cell_count=10)
+    for cell in range(0, 10, 2):
+        free_cells.take(cell)
+
+    free_cells.release_all()
+
+    assert free_cells.get_free_count() == 10
+    assert all(free_cells.is_free(cell) for cell in range(10))
+
+
+@pytest.mark.parametrize('cell_count', [1, 64, 100, 4096, 4097, 20000])
+def test_free_cells_are_numbered_in_cell_order(cell_count: int) -> None:
+    rng = Random(cell_count)
+    free_cells = FreeCells(cell_count=cell_count)
+    for cell in rng.sample(range(cell_count), cell_count // 2):
+        free_cells.take(cell)
+    for cell in rng.sample(range(cell_count), cell_count // 5):
+        free_cells.release(cell)
+
+    free = [cell for cell in range(cell_count) if free_cells.is_free(cell)]
+
+    assert free_cells.get_free_count() == len(free)
+    assert [free_cells.get_free_cell(index) for index in range(len(free))] == free
+
+
+def test_numbering_does_not_depend_on_history() -> None:
+    taken = Random(0).sample(range(5000), 3000)
+    first = FreeCells(cell_count=5000)
+    second = FreeCells(cell_count=5000)
+    for cell in taken:
+        first.take(cell)
+    for cell in range(5000):
+        second.take(cell)
+    for cell in reversed(range(5000)):
+        if cell not in taken:
+            second.release(cell)
+
+    assert first.get_free_count() == second.get_free_count() == 2000
+    assert [first.get_free_cell(index) for index in range(2000)] \
+        == [second.get_free_cell(index) for index in range(2000)]
@@ -0,0 +1,142 @@
+"""
+Тесты игровой логики движка без Tkinter.
+"""
+import pytest
+
+from agents.simple_agents import GreedyAgent
+from engine.game_engine import GameEngine, TickResult
+
+
+SETTINGS = {
+    'board width': 10,
+    'board height': 8,
+    'snake speed': 5,
+    'snake length': 3
+    }
+INITIAL_DELAY = 200 - 5 * 10
+
+
+def place(
+    engine: GameEngine,
+    segment_positions: list[int],
+    direction: str,
+    *,
+    food: int | None,
+    lives: int = 3,
+    pending_growth: int = 0
+    ) -> None:
+    """Ставит змейку и еду на поле движка."""
+    engine.restore(
+        seed=engine.get_seed(),
+        rng_state=engine.get_rng_state(),
+        score=0,
+        lives=lives,
+        move_delay=engine.get_move_delay(),
+        segment_positions=segment_positions,
+        direction=direction,
+        pending_growth=pending_growth,
+        food_position=food
+        )
+
+
+@pytest.fixture
+def engine() -> GameEngine:
+    return GameEngine(settings=SETTINGS, seed=3)
+
+
+def test_new_game(engine: GameEngine) -> None:
+    snake = engine.get_snake()
+
+    assert engine.get_board_size() == (10, 8)
+    assert (engine.get_score(), engine.get_lives()) == (0, 3)
+    assert engine.get_move_delay() == INITIAL_DELAY
+    assert list(snake.get_segment_positions()) == [45, 44, 43]
+    assert snake.get_direction() == 'Right'
+    assert not snake.is_occupied(engine.get_food().get_position())
+
+
+def test_step_moves_snake(engine: GameEngine) -> None:
+    place(engine, [45, 44, 43], 'Right', food=0)
+
+    assert engine.step() == TickResult.NONE
+    assert list(engine.get_snake().get_segment_positions()) == [46, 45, 44]
+
+    assert engine.step('Down') == TickResult.NONE
+    assert engine.get_snake().get_head_position() == 56
+
+
+def test_eating_food_grows_snake_on_next_move(engine: GameEngine) -> None:
+    place(engine, [45, 44, 43], 'Right', food=46)
+
+    assert engine.step() == TickResult.ATE_FOOD
+    snake = engine.get_snake()
+    assert engine.get_score() == 1
+    assert engine.get_move_delay() == INITIAL_DELAY - 2
+    assert snake.get_pending_growth() == 1
+    assert len(snake.get_segment_positions()) == 3
+    food = engine.get_food().get_position()
+    assert food is not None and not snake.is_occupied(food)
+
+    engine.step()
+    assert len(snake.get_segment_positions()) == 4
+
+
+def test_wall_costs_a_life_and_resets_snake(engine: GameEngine) -> None:
+    place(engine, [49, 48, 47], 'Right', food=0)
+
+    assert engine.step() == TickResult.LOST_LIFE
+    assert engine.get_lives() == 2
+    assert list(engine.get_snake().get_segment_positions()) == [45, 44, 43]
+    assert engine.get_move_delay() == INITIAL_DELAY
+
+
+def test_last_life_ends_game(engine: GameEngine) -> None:
+    place(engine, [49, 48, 47], 'Right', food=0, lives=1)
+
+    assert engine.step() == TickResult.LOST_LIFE | TickResult.GAME_OVER
+    assert engine.is_game_over()
+    assert engine.get_lives() == 0
+    assert list(engine.get_snake().get_segment_positions()) == [49, 48, 47]
+    assert engine.step() == TickResult.GAME_OVER
+
+
+def test_self_collision_undoes_move(engine: GameEngine) -> None:
+    place(engine, [22, 23, 33, 32, 31], 'Left', food=0, lives=1)
+
+    assert engine.step('Down') == TickResult.LOST_LIFE | TickResult.GAME_OVER
+    snake = engine.get_snake()
+    assert list(snake.get_segment_positions()) == [22, 23, 33, 32, 31]
+    assert sum(snake.get_occupancy()) == 5
+
+
+def test_following_tail_is_safe(engine: GameEngine) -> None:
+    place(engine, [22, 23, 33, 32], 'Left', food=0)
+
+    assert engine.step('Down') == TickResult.NONE
+    assert engine.get_lives() == 3
+
+
+def test_filling_board_ends_game() -> None:
+    engine = GameEngine(
+        settings={'board width': 3, 'board height': 1, 'snake length': 2}, seed=0
+        )
+    place(engine, [1, 0], 'Right', food=2)
+
+    assert engine.step() == (
+        TickResult.ATE_FOOD | TickResult.BOARD_FULL | TickResult.GAME_OVER
+        )
+    assert engine.is_board_full()
+    assert engine.is_game_over()
+    assert engine.get_food().get_position() is None
+
+
+def test_reset_with_seed_repeats_game(engine: GameEngine) -> None:
+    agent = GreedyAgent()
+
+    def play() -> list[TickResult]:
+        engine.reset(seed=11)
+        return [engine.step(agent.choose_direction(engine)) for _ in range(300)]
+
+    first = play()
+    assert TickResult.ATE_FOOD in first
+    assert play() == first
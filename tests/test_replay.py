@@ -0,0 +1,113 @@
+"""
+Тесты записи и воспроизведения игр.
+"""
+from random import Random
+
+import pytest
+
+from agents.simple_agents import GreedyAgent
+from engine.game_engine import GameEngine
+from engine.replay import Replay, ReplayRecorder, verify_replay
+
+
+DIRECTIONS = ('Up', 'Down', 'Left', 'Right')
+SETTINGS = {
+    'board width': 12,
+    'board height': 10,
+    'snake speed': 10,
+    'snake length': 4
+    }
+
+
+def record_game(seed: int, max_ticks: int = 2000) -> Replay:
+    """Записывает игру, в которой направление меняют агент и случайные нажатия."""
+    engine = GameEngine(settings=SETTINGS, seed=seed)
+    recorder = ReplayRecorder(seed=seed, settings=SETTINGS)
+    agent = GreedyAgent()
+    rng = Random(seed)
+
+    for _ in range(max_ticks):
+        if engine.is_game_over():
+            break
+        roll = rng.random()
+        if roll < 0.6:
+            direction = agent.choose_direction(engine)
+        elif roll < 0.8:
+            direction = rng.choice(DIRECTIONS)
+        else:
+            direction = None
+        if direction is not None:
+            recorder.record_direction(direction)
+            engine.change_direction(direction)
+        engine.step()
+        recorder.record_tick()
+
+    return recorder.finish(engine)
+
+
+@pytest.mark.parametrize('seed', [1, 7, 2024])
+def test_round_trip_verifies(seed: int) -> None:
+    replay = record_game(seed)
+    assert replay.get_events()
+    assert replay.get_final_state()['score'] > 0
+
+    loaded = Replay.from_bytes(replay.to_bytes())
+
+    assert loaded.get_seed() == seed
+    assert loaded.get_settings() == SETTINGS
+    assert loaded.get_events() == replay.get_events()
+    assert loaded.get_tick_count() == replay.get_tick_count()
+    assert loaded.get_final_state() == replay.get_final_state()
+    assert verify_replay(loaded)
+
+
+@pytest.mark.parametrize('seed', [1, 7, 2024])
+def test_tampered_event_fails_verification(seed: int) -> None:
+    replay = record_game(seed)
+    events = list(replay.get_events())
+    tick, direction = events[0]
+    turns = ('Left', 'Right') if direction in ('Up', 'Down') else ('Up', 'Down')
+    events[0] = (tick, turns[0])
+
+    tampered = Replay.from_bytes(Replay(
+        seed=replay.get_seed(),
+        settings=replay.get_settings(),
+        events=events,
+        tick_count=replay.get_tick_count(),
+        final_state=replay.get_final_state()
+        ).to_bytes())
+
+    assert not verify_replay(tampered)
+
+
+def test_round_trip_without_final_state() -> None:
+    replay = record_game(1, max_ticks=50)
+    replay = Replay(
+        seed=replay.get_seed(),
+        settings=replay.get_settings(),
+        events=replay.get_events(),
+        tick_count=replay.get_tick_count()
+        )
+
+    loaded = Replay.from_bytes(replay.to_bytes())
+
+    assert loaded.get_events() == replay.get_events()
+    assert loaded.get_final_state() is None
+
+
+def test_truncated_data_is_rejected() -> None:
+    data = record_game(7).to_bytes()
+
+    for size in range(len(data)):
+        with pytest.raises(ValueError):
+            Replay.from_bytes(data[:size])
+    with pytest.raises(ValueError):
+        Replay.from_bytes(data + bytes(1))
+
+
+@pytest.mark.parametrize(
+    'data', [b'', b'SNKR', b'XXXX' + bytes(64), b'SNKR' + bytes([99]) + bytes(64)]
+    )
+def test_invalid_data_is_rejected(data: bytes) -> None:
+    with pytest.raises(ValueError):
+        Replay.from_bytes(data)
@@ -0,0 +1,45 @@
+"""
+Тесты переключения экранов. Нужен дисплей, без него тесты пропускаются.
+"""
+import tkinter as tk
+
+import pytest
+
+from assets.asset_manager import AssetManager
+
+ScreensControl = pytest.importorskip('screens.screens_control').ScreensControl
+
+
+@pytest.fixture
+def root() -> tk.Tk:
+    try:
+        root = tk.Tk()
+    except tk.TclError as ex:
+        pytest.skip(f'Дисплей недоступен: {ex}')
+    root.withdraw()
+    yield root
+    root.destroy()
+
+
+def play_cycle(control: ScreensControl, root: tk.Tk, score: int) -> None:
+    """Проходит экраны меню, игры, проигрыша и снова меню."""
+    control._show_game_screen()
+    root.update()
+    control._show_game_over_screen(score, score, control.get_game_settings())
+    root.update()
+    control._show_start_screen()
+    root.update()
+
+
+def test_widget_count_does_not_grow(root: tk.Tk) -> None:
+    control = ScreensControl(
+        master=root, quit_callback=root.quit, assets=AssetManager()
+        )
+    control.create_screens()
+    play_cycle(control, root, 0)
+    widget_count = control.get_widget_count()
+
+    for score in range(1, 20):
+        play_cycle(control, root, score)
+
+    assert control.get_widget_count() == widget_count
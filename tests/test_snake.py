@@ -0,0 +1,127 @@
+"""
+Тесты движения, роста и отмены хода змейки.
+"""
+from canvas_objects.free_cells import FreeCells
+from canvas_objects.snake import Snake
+
+
+WIDTH = 10
+HEIGHT = 8
+
+
+def make_snake(segment_positions: list[int], direction: str = 'Right') -> Snake:
+    """Создает змейку на поле WIDTH x HEIGHT с учетом свободных клеток."""
+    return Snake(
+        segment_positions=segment_positions,
+        initial_direction=direction,
+        board_width=WIDTH,
+        board_heigth=HEIGHT,
+        free_cells=FreeCells(cell_count=WIDTH * HEIGHT)
+        )
+
+
+def test_move_shifts_segments_and_occupancy() -> None:
+    snake = make_snake([12, 11, 10])
+
+    snake.move()
+
+    assert list(snake.get_segment_positions()) == [13, 12, 11]
+    assert snake.is_occupied(13)
+    assert not snake.is_occupied(10)
+    assert sum(snake.get_occupancy()) == 3
+
+
+def test_free_cells_follow_snake() -> None:
+    free_cells = FreeCells(cell_count=WIDTH * HEIGHT)
+    snake = Snake(
+        segment_positions=[12, 11, 10],
+        initial_direction='Right',
+        board_width=WIDTH,
+        board_heigth=HEIGHT,
+        free_cells=free_cells
+        )
+
+    snake.move()
+
+    assert free_cells.get_free_count() == WIDTH * HEIGHT - 3
+    assert free_cells.is_free(10)
+    assert not free_cells.is_free(13)
+
+
+def test_opposite_direction_is_ignored() -> None:
+    snake = make_snake([12, 11, 10])
+
+    snake.change_direction('Left')
+    assert snake.get_direction() == 'Right'
+
+    snake.change_direction('Down')
+    snake.move()
+    assert snake.get_head_position() == 12 + WIDTH
+
+
+def test_growth_is_deferred_to_next_moves() -> None:
+    snake = make_snake([12, 11, 10])
+
+    snake.add_segment_to_end()
+    snake.add_segment_to_end()
+    assert len(snake.get_segment_positions()) == 3
+    assert snake.get_pending_growth() == 2
+
+    snake.move()
+    snake.move()
+    assert list(snake.get_segment_positions()) == [14, 13, 12, 11, 10]
+    assert snake.get_pending_growth() == 0
+
+    snake.move()
+    assert list(snake.get_segment_positions()) == [15, 14, 13, 12, 11]
+
+
+def test_undo_move_restores_tail() -> None:
+    snake = make_snake([12, 11, 10])
+    snake.move()
+
+    snake.undo_move()
+
+    assert list(snake.get_segment_positions()) == [12, 11, 10]
+    assert not snake.is_occupied(13)
+    assert snake.is_occupied(10)
+
+
+def test_undo_move_restores_pending_growth() -> None:
+    snake = make_snake([12, 11, 10])
+    snake.add_segment_to_end()
+    snake.move()
+
+    snake.undo_move()
+
+    assert list(snake.get_segment_positions()) == [12, 11, 10]
+    assert snake.get_pending_growth() == 1
+
+
+def test_head_on_body_is_a_collision() -> None:
+    snake = make_snake([22, 23, 33, 32, 31], direction='Left')
+
+    snake.change_direction('Down')
+    snake.move()
+
+    assert snake.get_head_position() == 32
+    assert snake.is_colliding_with_self()
+
+
+def test_head_on_leaving_tail_is_not_a_collision() -> None:
+    snake = make_snake([22, 23, 33, 32], direction='Left')
+
+    snake.change_direction('Down')
+    snake.move()
+
+    assert snake.get_head_position() == 32
+    assert not snake.is_colliding_with_self()
+
+
+def test_walls_are_detected_before_the_move() -> None:
+    assert make_snake([WIDTH - 1, WIDTH - 2], 'Right').is_heading_into_wall()
+    assert make_snake([0, 1], 'Left').is_heading_into_wall()
+    assert make_snake([5, 5 + WIDTH], 'Up').is_heading_into_wall()
+    bottom = (HEIGHT - 1) * WIDTH + 5
+    assert make_snake([bottom, bottom - WIDTH], 'Down').is_heading_into_wall()
+    assert not make_snake([12, 11], 'Right').is_heading_into_wall()
@@ -0,0 +1,114 @@
+"""
+Тесты снимков состояния игры.
+"""
+import struct
+
+import pytest
+
+from agents.simple_agents import GreedyAgent
+from engine.game_engine import GameEngine
+from engine.replay import get_engine_state
+from engine.snapshot import Snapshot
+
+
+SETTINGS = {
+    'board width': 14,
+    'board height': 10,
+    'snake speed': 12,
+    'snake length': 5
+    }
+HEADER = struct.Struct('<4sBQIBHBBIiII')
+RNG_STATE_SIZE = struct.calcsize('<625IBd')
+
+
+def play(engine: GameEngine, ticks: int) -> None:
+    """Продолжает игру жадным агентом."""
+    agent = GreedyAgent()
+    for _ in range(ticks):
+        if engine.is_game_over():
+            break
+        engine.step(agent.choose_direction(engine))
+
+
+@pytest.fixture
+def engine() -> GameEngine:
+    engine = GameEngine(settings=SETTINGS, seed=42)
+    play(engine, 300)
+    assert engine.get_score() > 0
+    return engine
+
+
+def test_round_trip_restores_state(engine: GameEngine) -> None:
+    snapshot = Snapshot.from_engine(engine)
+    loaded = Snapshot.from_bytes(snapshot.to_bytes())
+
+    assert loaded.get_settings() == SETTINGS
+    assert loaded.get_state() == snapshot.get_state()
+    assert list(loaded.get_segment_positions()) == list(
+        engine.get_snake().get_segment_positions()
+        )
+
+    restored = loaded.restore()
+    assert get_engine_state(restored, 0) == get_engine_state(engine, 0)
+    assert restored.get_rng_state() == engine.get_rng_state()
+    assert restored.get_snake().get_direction() == engine.get_snake().get_direction()
+    assert restored.get_snake().get_pending_growth() \
+        == engine.get_snake().get_pending_growth()
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_restored_game_continues_like_original(seed: int) -> None:
+    original = GameEngine(settings=SETTINGS, seed=seed)
+    play(original, 200)
+    restored = Snapshot.from_bytes(Snapshot.from_engine(original).to_bytes()).restore()
+
+    original_agent = GreedyAgent()
+    restored_agent = GreedyAgent()
+    for tick in range(300):
+        if original.is_game_over():
+            break
+        assert original.step(original_agent.choose_direction(original)) \
+            == restored.step(restored_agent.choose_direction(restored))
+        assert get_engine_state(restored, tick) == get_engine_state(original, tick)
+        assert restored.get_food().get_position() \
+            == original.get_food().get_position()
+    assert restored.is_game_over() == original.is_game_over()
+
+
+def test_layout_is_little_endian(engine: GameEngine) -> None:
+    data = Snapshot.from_engine(engine).to_bytes()
+    segment_positions = engine.get_snake().get_segment_positions()
+    (
+        magic, version, seed, score, lives, move_delay, _, _, _, food,
+        settings_length, segment_count
+        ) = HEADER.unpack_from(data)
+
+    assert (magic, version, seed) == (Snapshot.MAGIC, Snapshot.VERSION, 42)
+    assert (score, lives, move_delay) == (
+        engine.get_score(), engine.get_lives(), engine.get_move_delay()
+        )
+    assert food == engine.get_food().get_position()
+    assert segment_count == len(segment_positions)
+    assert len(data) == (
+        HEADER.size + settings_length + RNG_STATE_SIZE + 4 * segment_count
+        )
+
+    offset = len(data) - 4 * segment_count
+    assert list(struct.unpack_from(f'<{segment_count}i', data, offset)) == list(
+        segment_positions
+        )
+
+
+@pytest.mark.parametrize('change', [-4, -1, 1, 4])
+def test_size_mismatch_is_rejected(engine: GameEngine, change: int) -> None:
+    data = Snapshot.from_engine(engine).to_bytes()
+    data = data[:change] if change < 0 else data + bytes(change)
+
+    with pytest.raises(ValueError):
+        Snapshot.from_bytes(data)
+
+
+@pytest.mark.parametrize('data', [b'', b'SNKS', b'XXXX' + bytes(64)])
+def test_invalid_data_is_rejected(data: bytes) -> None:
+    with pytest.raises(ValueError):
+        Snapshot.from_bytes(data)
@@ -0,0 +1,170 @@
+"""
+Тесты планировщика тиков на поддельных часах и таймере.
+"""
+from typing import Callable
+
+import pytest
+
+from engine.tick_scheduler import LatePolicy, TickScheduler
+
+
+PERIOD = 100
+
+
+class FakeTimer:
+    """Поддельные часы и таймер в духе Tk after/after_cancel."""
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.pending = {}
+        self.delays = []
+        self.cancelled = []
+        self.__next_id = 0
+
+    def clock(self) -> float:
+        return self.now
+
+    def schedule(self, delay: int, callback: Callable[[], None]) -> int:
+        self.__next_id += 1
+        self.pending[self.__next_id] = (self.now + delay / 1000, callback)
+        self.delays.append(delay)
+        return self.__next_id
+
+    def cancel(self, after_id: int) -> None:
+        self.cancelled.append(after_id)
+        del self.pending[after_id]
+
+    def fire(self, at: float) -> None:
+        """Переводит часы на момент at и вызывает запланированный вызов."""
+        (after_id, (_, callback)), = self.pending.items()
+        del self.pending[after_id]
+        self.now = at
+        callback()
+
+
+@pytest.fixture
+def timer() -> FakeTimer:
+    return FakeTimer()
+
+
+def make_scheduler(timer: FakeTimer, ticks: list[float], **kwargs) -> TickScheduler:
+    """Создает планировщик, записывающий время тиков в ticks."""
+    def tick() -> bool:
+        ticks.append(timer.now)
+        return True
+
+    return TickScheduler(
+        tick_callback=tick,
+        get_period=lambda: PERIOD,
+        schedule=timer.schedule,
+        cancel=timer.cancel,
+        clock=timer.clock,
+        **kwargs
+        )
+
+
+def test_ticks_follow_absolute_deadlines(timer: FakeTimer) -> None:
+    ticks = []
+    scheduler = make_scheduler(timer, ticks)
+    scheduler.start(PERIOD)
+
+    timer.fire(0.1)
+    timer.fire(0.23)
+
+    assert ticks == [0.1, 0.23]
+    assert timer.delays == [PERIOD, PERIOD, 70]
+    assert scheduler.get_dropped_ticks() == 0
+
+
+def test_catch_up_runs_missed_ticks(timer: FakeTimer) -> None:
+    ticks = []
+    frames = []
+    scheduler = make_scheduler(
+        timer, ticks, frame_callback=lambda: frames.append(timer.now)
+        )
+    scheduler.start(PERIOD)
+
+    timer.fire(0.35)
+
+    assert len(ticks) == 3
+    assert frames == [0.35]
+    assert scheduler.get_dropped_ticks() == 0
+    assert timer.delays[-1] == 50
+
+
+def test_catch_up_is_limited(timer: FakeTimer) -> None:
+    ticks = []
+    scheduler = make_scheduler(timer, ticks, max_catch_up_ticks=2)
+    scheduler.start(PERIOD)
+
+    timer.fire(0.55)
+
+    assert len(ticks) == 2
+    assert scheduler.get_dropped_ticks() == 3
+    assert timer.delays[-1] == PERIOD
+
+
+def test_drop_runs_one_tick(timer: FakeTimer) -> None:
+    ticks = []
+    scheduler = make_scheduler(timer, ticks, late_policy=LatePolicy.DROP)
+    scheduler.start(PERIOD)
+
+    timer.fire(0.35)
+
+    assert len(ticks) == 1
+    assert scheduler.get_dropped_ticks() == 2
+    assert timer.delays[-1] == PERIOD
+
+
+def test_pause_keeps_remaining_time(timer: FakeTimer) -> None:
+    ticks = []
+    scheduler = make_scheduler(timer, ticks)
+    scheduler.start(PERIOD)
+
+    timer.now = 0.04
+    scheduler.pause()
+
+    assert scheduler.is_paused()
+    assert not scheduler.is_running()
+    assert timer.cancelled and not timer.pending
+    assert scheduler.get_progress() == pytest.approx(0.4)
+
+    timer.now = 10.0
+    scheduler.resume()
+
+    assert not scheduler.is_paused()
+    assert timer.delays[-1] == 60
+
+    timer.fire(10.06)
+
+    assert ticks == [10.06]
+    assert scheduler.get_dropped_ticks() == 0
+    assert timer.delays[-1] == PERIOD
+
+
+def test_tick_callback_can_stop_ticks(timer: FakeTimer) -> None:
+    scheduler = TickScheduler(
+        tick_callback=lambda: False,
+        get_period=lambda: PERIOD,
+        schedule=timer.schedule,
+        cancel=timer.cancel,
+        clock=timer.clock
+        )
+    scheduler.start(PERIOD)
+
+    timer.fire(0.1)
+
+    assert not scheduler.is_running()
+    assert not timer.pending
+
+
+def test_stop_cancels_pending_tick(timer: FakeTimer) -> None:
+    scheduler = make_scheduler(timer, [])
+    scheduler.start(PERIOD)
+
+    scheduler.stop()
+
+    assert not scheduler.is_running()
+    assert not timer.pending
+    scheduler.pause()
+    scheduler.resume()
+    assert not timer.pending
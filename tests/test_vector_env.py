@@ -0,0 +1,84 @@
+"""
+Тесты одновременной симуляции игр на массивах NumPy.
+
+Одна игра VectorSnakeEnv сравнивается по тикам с GameEngine при тех же
+действиях. Генераторы случайных чисел у них разные, поэтому еда движка
+после каждого тика переносится в клетку еды VectorSnakeEnv.
+"""
+from random import Random
+
+import numpy as np
+import pytest
+
+from agents.simple_agents import GreedyAgent
+from engine.game_engine import GameEngine, TickResult
+from engine.vector_env import VectorSnakeEnv, NO_ACTION
+
+
+DIRECTIONS = ('Up', 'Down', 'Left', 'Right')
+
+
+def force_food(engine: GameEngine, env: VectorSnakeEnv) -> None:
+    """Переносит еду движка в клетку еды первой игры VectorSnakeEnv."""
+    food = int(env.get_food()[0])
+    engine.get_food().set_position(None if food < 0 else food)
+
+
+def assert_same_state(engine: GameEngine, env: VectorSnakeEnv, tick: int) -> None:
+    """Проверяет, что состояние движка совпадает с первой игрой."""
+    assert env.get_segment_positions(0) == list(
+        engine.get_snake().get_segment_positions()
+        ), f'тик {tick}'
+    assert int(env.get_scores()[0]) == engine.get_score(), f'тик {tick}'
+    assert int(env.get_lives()[0]) == engine.get_lives(), f'тик {tick}'
+    assert int(env.get_move_delays()[0]) == engine.get_move_delay(), f'тик {tick}'
+    assert bool(env.get_game_over()[0]) == engine.is_game_over(), f'тик {tick}'
+    assert bool(env.get_board_full()[0]) == engine.is_board_full(), f'тик {tick}'
+
+
+@pytest.mark.parametrize('seed', range(5))
+@pytest.mark.parametrize('board_size', [(6, 6), (12, 8)])
+def test_single_game_matches_engine(
+    seed: int, board_size: tuple[int, int]
+    ) -> None:
+    width, height = board_size
+    settings = {
+        'board width': width,
+        'board height': height,
+        'snake speed': 10,
+        'snake length': 3
+        }
+    env = VectorSnakeEnv(game_count=1, settings=settings, seed=seed)
+    engine = GameEngine(settings=settings, seed=seed)
+    agent = GreedyAgent()
+    rng = Random(seed)
+    force_food(engine, env)
+    assert_same_state(engine, env, 0)
+
+    games_over = 0
+    for tick in range(1, 3001):
+        roll = rng.random()
+        if roll < 0.7:
+            direction = agent.choose_direction(engine)
+        elif roll < 0.9:
+            direction = rng.choice(DIRECTIONS)
+        else:
+            direction = None
+        action = NO_ACTION if direction is None else DIRECTIONS.index(direction)
+
+        expected = engine.step(direction)
+        result = env.step(np.array([action], dtype=np.int8))
+        assert TickResult(int(result[0])) == expected, f'тик {tick}'
+
+        force_food(engine, env)
+        assert_same_state(engine, env, tick)
+
+        if engine.is_game_over():
+            games_over += 1
+            env.reset()
+            engine.reset(seed=seed + games_over)
+            force_food(engine, env)
+            assert_same_state(engine, env, tick)
+
+    assert games_over
+